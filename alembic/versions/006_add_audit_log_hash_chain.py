@@ -0,0 +1,34 @@
+"""Add hash chain columns to audit_logs
+
+Revision ID: 006_audit_hash_chain
+Revises: add_triggers_notifications
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '006_audit_hash_chain'
+down_revision = 'add_triggers_notifications'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Chain audit rows so that editing or deleting one breaks the chain.
+
+    Each row stores the hash of the previous row (prev_hash) and its own
+    hash over prev_hash and its column values. Existing rows keep NULL
+    hashes; the chain starts with the first row written after upgrade.
+    """
+    op.add_column('audit_logs', sa.Column('prev_hash', sa.String(length=64), nullable=True))
+    op.add_column('audit_logs', sa.Column('hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove hash chain columns"""
+    op.drop_column('audit_logs', 'hash')
+    op.drop_column('audit_logs', 'prev_hash')
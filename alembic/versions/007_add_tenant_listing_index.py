@@ -0,0 +1,35 @@
+"""Add index for keyset pagination of tenants
+
+Revision ID: 007_tenant_listing_index
+Revises: 006_audit_hash_chain
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '007_tenant_listing_index'
+down_revision = '006_audit_hash_chain'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Index the tenant listing order.
+
+    list_tenants filters by status and pages by (created_at, id) newest
+    first, so each page is a range scan instead of a sort.
+    """
+    op.create_index(
+        'ix_tenants_status_created_at_id',
+        'tenants',
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Remove tenant listing index"""
+    op.drop_index('ix_tenants_status_created_at_id', table_name='tenants')
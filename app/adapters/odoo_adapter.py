@@ -443,6 +443,27 @@ class OdooAdapter(BaseAdapter):
             logger.error(f"Odoo check_connection error: {str(e)}")
             return False
 
+    async def resume_session(self, session_id: str, uid: int) -> bool:
+        """
+        Reuse an existing Odoo session instead of authenticating again
+
+        Args:
+            session_id: Session cookie from an earlier authenticate
+            uid: User ID the session belongs to
+
+        Returns:
+            True if the session is still valid
+        """
+        self.client.cookies.set("session_id", session_id)
+        if not await self.check_connection():
+            self.client.cookies.delete("session_id")
+            return False
+
+        self.uid = uid
+        self.session_id = session_id
+        self.is_connected = True
+        return True
+
     async def refresh_session(self) -> bool:
         """
         Refresh Odoo session
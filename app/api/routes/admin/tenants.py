@@ -18,12 +18,14 @@ from app.schemas.admin import (
     TenantConnectionTest
 )
 from app.services.tenant_service import TenantService
+from app.services.cache_service import CacheService
 from app.api.routes.admin.dependencies import get_current_admin
 from app.models.admin import Admin
 from app.models.tenant import TenantStatus
 from loguru import logger
 
 router = APIRouter(prefix="/admin/tenants", tags=["Admin Tenant Management"])
+cache_service = CacheService(settings.REDIS_URL)
 
 
 @router.get("", response_model=List[TenantResponse])
@@ -31,6 +33,7 @@ async def list_tenants(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
     status: Optional[str] = Query(None, regex="^(active|suspended|trial|deleted)$"),
+    after: Optional[UUID] = Query(None, description="ID of the last tenant of the previous page"),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin)
 ):
@@ -41,6 +44,7 @@ async def list_tenants(
     - skip: Number of records to skip (default: 0)
     - limit: Maximum records to return (default: 100, max: 500)
     - status: Filter by status (active, suspended, trial, deleted)
+    - after: Return the tenants after this tenant ID (cursor paging, preferred over skip)
 
     **Requires:**
     - Valid admin JWT token
@@ -48,14 +52,15 @@ async def list_tenants(
     **Returns:**
     - List of tenants
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
 
     tenant_status = TenantStatus(status) if status else None
 
     tenants = await tenant_service.list_tenants(
         skip=skip,
         limit=limit,
-        status=tenant_status
+        status=tenant_status,
+        after=after
     )
 
     return tenants
@@ -81,7 +86,7 @@ async def get_tenant_statistics(
     - trial: Number of trial tenants
     - deleted: Number of deleted tenants
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
     return await tenant_service.get_tenant_statistics()
 
 
@@ -106,7 +111,7 @@ async def get_tenant(
     **Errors:**
     - 404: Tenant not found
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
     tenant = await tenant_service.get_tenant(tenant_id)
 
     if not tenant:
@@ -148,7 +153,7 @@ async def create_tenant(
     - 400: Slug already taken or invalid data
     - 404: Plan not found
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
 
     tenant = await tenant_service.create_tenant(
         **tenant_data.dict(),
@@ -184,7 +189,7 @@ async def update_tenant(
     - 400: Slug already taken
     - 404: Tenant not found
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
 
     # Only include non-None values
     update_data = tenant_data.dict(exclude_unset=True)
@@ -223,7 +228,7 @@ async def suspend_tenant(
     **Errors:**
     - 404: Tenant not found
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
     success = await tenant_service.suspend_tenant(tenant_id)
 
     if not success:
@@ -258,7 +263,7 @@ async def activate_tenant(
     **Errors:**
     - 404: Tenant not found
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
     success = await tenant_service.activate_tenant(tenant_id)
 
     if not success:
@@ -293,7 +298,7 @@ async def delete_tenant(
     **Errors:**
     - 404: Tenant not found
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
     success = await tenant_service.delete_tenant(tenant_id)
 
     if not success:
@@ -330,7 +335,7 @@ async def test_tenant_connection(
     **Errors:**
     - 404: Tenant not found
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
     result = await tenant_service.test_odoo_connection(tenant_id)
     return result
 
@@ -365,7 +370,7 @@ async def get_rate_limit_status(
     **Returns:**
     - Current rate limit counts and limits
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
     tenant = await tenant_service.get_tenant(tenant_id)
     
     if not tenant:
@@ -431,7 +436,7 @@ async def reset_rate_limit(
     **Returns:**
     - Message confirming reset
     """
-    tenant_service = TenantService(db)
+    tenant_service = TenantService(db, cache_service)
     tenant = await tenant_service.get_tenant(tenant_id)
     
     if not tenant:
@@ -225,7 +225,7 @@ async def generate_report(
     Args:
         system_id: System identifier
         report_type: Report type (sales, inventory, partners)
-        format: Export format (xlsx, csv, pdf)
+        format: Export format (xlsx, csv, parquet, pdf)
         start_date: Start date (for sales report)
         end_date: End date (for sales report)
 
@@ -289,7 +289,8 @@ async def generate_report(
         content_types = {
             "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             "csv": "text/csv",
-            "pdf": "application/pdf"
+            "pdf": "application/pdf",
+            "parquet": "application/vnd.apache.parquet"
         }
 
         return Response(
@@ -322,14 +323,14 @@ async def export_data(
     service: SystemService = Depends(get_system_service)
 ):
     """
-    Export data to Excel/CSV
+    Export data to Excel/CSV/Parquet
 
     Args:
         system_id: System identifier
         model: Model name
         domain: Search filters
         fields: Fields to export
-        format: Export format (xlsx, csv)
+        format: Export format (xlsx, csv, parquet)
         limit: Maximum records
 
     Returns:
@@ -363,6 +364,8 @@ async def export_data(
             content = await report_service.export_to_excel(records)
         elif format == "csv":
             content = await report_service.export_to_csv(records)
+        elif format == "parquet":
+            content = await report_service.export_to_parquet(records)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -374,7 +377,8 @@ async def export_data(
         # Determine content type
         content_types = {
             "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            "csv": "text/csv"
+            "csv": "text/csv",
+            "parquet": "application/vnd.apache.parquet"
         }
 
         return Response(
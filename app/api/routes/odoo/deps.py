@@ -7,7 +7,7 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status, Header, Request
 from loguru import logger
 
-from app.core.encryption import encryption_service
+from app.services.tenant_service import decrypt_odoo_password
 from app.services.odoo import (
     OdooOperationsService,
     SearchOperations,
@@ -82,7 +82,7 @@ async def get_odoo_credentials(
     if tenant:
         # Decrypt Odoo password
         try:
-            decrypted_password = encryption_service.decrypt_value(tenant.odoo_password)
+            decrypted_password = decrypt_odoo_password(tenant.odoo_password)
         except Exception as e:
             logger.warning(f"Password decryption failed: {str(e)}")
             decrypted_password = tenant.odoo_password
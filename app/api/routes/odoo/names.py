@@ -97,7 +97,8 @@ async def name_get(
         results = await service.name_get(
             model=request.model,
             ids=request.ids,
-            context=request.context
+            context=request.context,
+            use_name_get=request.use_name_get
         )
 
         return NameGetResponse(
@@ -99,7 +99,8 @@ async def validate_references(
     try:
         result = await service.validate_references(
             references=request.references,
-            context=request.context
+            context=request.context,
+            fail_fast=request.fail_fast
         )
 
         return ValidateReferencesResponse(
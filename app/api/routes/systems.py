@@ -390,14 +390,12 @@ async def connect_system(
         await db.commit()
         await db.refresh(system)
         
-        # Cache system_id -> db_id mapping
-        service._system_id_cache[system_id] = system.id
-        
         # Connect to system
         adapter = await service.connect_system(
             system_id=system_id,
             system_type=system_type,
-            config=config
+            config=config,
+            db_id=system.id
         )
 
         return {
@@ -60,6 +60,31 @@ class Settings(BaseSettings):
         env="ODOO_SYNC_BATCH_SIZE",
         description="Number of events to pull per sync"
     )
+    ODOO_MAX_INFLIGHT: int = Field(
+        default=32,
+        env="ODOO_MAX_INFLIGHT",
+        description="Maximum concurrent RPC calls per Odoo endpoint"
+    )
+    ODOO_HTTP_POOL_SIZE: int = Field(
+        default=32,
+        env="ODOO_HTTP_POOL_SIZE",
+        description="Maximum pooled HTTP connections to Odoo servers"
+    )
+    ODOO_HTTP2: bool = Field(
+        default=True,
+        env="ODOO_HTTP2",
+        description="Use HTTP/2 for Odoo calls when the h2 package is installed"
+    )
+    ODOO_METADATA_CACHE_DIR: str = Field(
+        default="",
+        env="ODOO_METADATA_CACHE_DIR",
+        description="Directory for the persistent fields/views cache (empty disables it)"
+    )
+    ODOO_METADATA_CACHE_TTL: int = Field(
+        default=86400,
+        env="ODOO_METADATA_CACHE_TTL",
+        description="Lifetime of persisted fields/views metadata (in seconds)"
+    )
 
     # JWT
     JWT_SECRET_KEY: str = Field(
@@ -96,6 +121,18 @@ class Settings(BaseSettings):
     DEFAULT_TENANT_RATE_LIMIT_PER_HOUR: int = Field(default=1000, env="DEFAULT_TENANT_RATE_LIMIT_PER_HOUR")
     DEFAULT_TENANT_RATE_LIMIT_PER_DAY: int = Field(default=10000, env="DEFAULT_TENANT_RATE_LIMIT_PER_DAY")
 
+    # Audit trail (comma-separated; empty AUDIT_ACTIONS disables auditing)
+    AUDIT_ACTIONS: str = Field(
+        default="create,read,update,delete",
+        env="AUDIT_ACTIONS",
+        description="Actions written to the audit trail"
+    )
+    AUDIT_EXCLUDED_MODELS: str = Field(
+        default="",
+        env="AUDIT_EXCLUDED_MODELS",
+        description="Models never written to the audit trail"
+    )
+
     # Monitoring
     SENTRY_DSN: Optional[str] = Field(default=None, env="SENTRY_DSN")
 
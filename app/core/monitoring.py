@@ -176,6 +176,12 @@ circuit_breaker_failures = Counter(
     ['system_id']
 )
 
+# Audit trail metrics
+audit_entries_lost_total = Counter(
+    'audit_entries_lost_total',
+    'Audit entries that could not be written'
+)
+
 # Version migration metrics
 version_migrations_total = Counter(
     'version_migrations_total',
@@ -306,6 +312,11 @@ def record_circuit_breaker_failure(system_id: str):
     circuit_breaker_failures.labels(system_id=system_id).inc()
 
 
+def record_audit_entries_lost(count: int):
+    """Record audit entries dropped after every write attempt failed"""
+    audit_entries_lost_total.inc(count)
+
+
 def record_version_migration(
     system_type: str,
     from_version: str,
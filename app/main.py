@@ -13,7 +13,10 @@ from loguru import logger
 from app.core.config import settings
 from app.utils.logger import setup_logging
 from app.middleware.logging_middleware import logging_middleware
+from app.middleware.name_cache import name_cache_middleware
 from app.db.session import init_db, close_db
+from app.services.odoo.base import close_shared_client
+from app.services.audit_service import audit_batcher
 from app.api.routes import auth, health, systems, batch, barcode, files, websocket, odoo
 from app.api.routes.odoo import router as odoo_operations_router
 from app.api.routes.admin import (
@@ -52,9 +55,12 @@ async def lifespan(app: FastAPI):
     Startup:
     - Setup logging
     - Initialize database
+    - Start the audit log batcher
 
     Shutdown:
+    - Write pending audit logs
     - Close database connections
+    - Close the shared Odoo HTTP client
     """
     # Startup
     logger.info("Starting application...")
@@ -70,12 +76,16 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database: {str(e)}")
 
+    audit_batcher.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    await audit_batcher.stop()
     await close_db()
     logger.info("Database connections closed")
+    await close_shared_client()
 
 
 # Create FastAPI app
@@ -121,6 +131,9 @@ app = FastAPI(
 # Add rate limiter state
 app.state.limiter = limiter
 
+# Request-scoped display name cache for Odoo name lookups
+app.middleware("http")(name_cache_middleware)
+
 # Logging Middleware (first to execute - added last)
 app.middleware("http")(logging_middleware)
 
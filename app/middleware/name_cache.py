@@ -0,0 +1,21 @@
+"""
+Name Cache Middleware for request-scoped display name caching
+"""
+from fastapi import Request
+
+from app.services.odoo.cache import NAME_CACHE
+
+
+async def name_cache_middleware(request: Request, call_next):
+    """
+    Bind a fresh display name cache for the duration of each request
+
+    NameOperations reads it implicitly, so every name_get and
+    get_display_names call within a request shares the same cache
+    without passing it through call sites.
+    """
+    token = NAME_CACHE.set({})
+    try:
+        return await call_next(request)
+    finally:
+        NAME_CACHE.reset(token)
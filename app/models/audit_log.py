@@ -35,6 +35,10 @@ class AuditLog(Base):
     duration_ms = Column(Integer)  # Request duration in milliseconds
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    # Tamper evidence: each row hashes the previous row's hash with its own values
+    prev_hash = Column(String(64))
+    hash = Column(String(64))
+
     # Relationships
     user = relationship("User", back_populates="audit_logs")
     system = relationship("System", back_populates="audit_logs")
@@ -3,12 +3,17 @@ Tenant (company) model for multi-tenancy
 """
 from sqlalchemy import Column, String, Boolean, DateTime, Enum, Integer, ForeignKey, JSON
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 import uuid
 import enum
 from app.db.base import Base, TimestampMixin
 
 
+def normalize_slug(slug: str) -> str:
+    """Canonical (lower-case) form of a tenant slug, as stored and queried"""
+    return slug.strip().lower()
+
+
 class TenantStatus(str, enum.Enum):
     """Tenant status"""
     ACTIVE = "active"
@@ -70,5 +75,10 @@ class Tenant(Base, TimestampMixin):
     # Multi-System Support (NEW)
     connected_systems = relationship("TenantSystem", back_populates="tenant", cascade="all, delete-orphan")
 
+    @validates("slug")
+    def _normalize_slug(self, key, slug):
+        # Stored lower-case so lookups are plain equality on the slug index
+        return normalize_slug(slug) if slug is not None else slug
+
     def __repr__(self):
         return f"<Tenant(id={self.id}, name='{self.name}', slug='{self.slug}', status='{self.status}')>"
@@ -90,7 +90,8 @@ async def get_offline_sync_service(
                     adapter = await service.connect_system(
                         system_id=system_id,
                         system_type=system.system_type,
-                        config=config
+                        config=config,
+                        db_id=system.id
                     )
 
                 session_id = getattr(adapter, 'session_id', None)
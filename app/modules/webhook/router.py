@@ -93,7 +93,8 @@ async def get_odoo_client(
             adapter = await service.connect_system(
                 system_id=system_id,
                 system_type=system.system_type,
-                config=config
+                config=config,
+                db_id=system.id
             )
             logger.info(f"Successfully reconnected to {system_id}")
         except Exception as e:
@@ -66,7 +66,8 @@ async def get_odoo_client(
             adapter = await service.connect_system(
                 system_id=system_id,
                 system_type=system.system_type,
-                config=config
+                config=config,
+                db_id=system.id
             )
         except Exception as e:
             logger.error(f"Failed to connect to Odoo: {str(e)}")
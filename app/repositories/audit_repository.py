@@ -2,13 +2,17 @@
 Audit Log Repository
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import List, Optional
+from sqlalchemy import func, insert, select
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 from app.models.audit_log import AuditLog
 from app.repositories.base_repository import BaseRepository
 
 
+# pg_advisory_xact_lock key serializing appends to the audit hash chain
+AUDIT_CHAIN_LOCK_ID = 0x6175646974  # "audit"
+
+
 class AuditRepository(BaseRepository[AuditLog]):
     """Repository for audit log operations"""
 
@@ -77,3 +81,33 @@ class AuditRepository(BaseRepository[AuditLog]):
 
         result = await self.session.execute(query)
         return result.scalars().all()
+
+    async def get_last_hash(self) -> Optional[str]:
+        """Get the chain hash of the most recent chained audit row"""
+        query = (
+            select(self.model.hash)
+            .where(self.model.hash.isnot(None))
+            .order_by(self.model.id.desc())
+            .limit(1)
+        )
+
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def lock_chain_head(self) -> Optional[str]:
+        """
+        Lock the audit hash chain and get the hash to extend it from
+
+        On PostgreSQL, takes a transaction-scoped advisory lock, held until
+        the insert commits, so the batchers of several workers cannot extend
+        the same hash. Other databases (SQLite in tests and development) run
+        a single worker and skip the lock.
+        """
+        if self.session.bind.dialect.name == "postgresql":
+            await self.session.execute(select(func.pg_advisory_xact_lock(AUDIT_CHAIN_LOCK_ID)))
+        return await self.get_last_hash()
+
+    async def insert_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert audit rows with a single INSERT statement"""
+        await self.session.execute(insert(self.model), rows)
+        await self.session.commit()
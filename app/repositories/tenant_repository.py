@@ -1,14 +1,17 @@
 """
 Tenant repository for tenant data access
 """
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from typing import Optional, List
 from datetime import datetime
-from app.repositories.base_repository import BaseRepository
-from app.models.tenant import Tenant, TenantStatus
+from typing import Dict, List, Optional
 from uuid import UUID
 
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tenant import Tenant, TenantStatus, normalize_slug
+from app.repositories.base_repository import BaseRepository
+
 
 class TenantRepository(BaseRepository[Tenant]):
     """Repository for tenant operations"""
@@ -26,7 +29,7 @@ class TenantRepository(BaseRepository[Tenant]):
         Returns:
             Tenant instance or None
         """
-        query = select(Tenant).where(Tenant.slug == slug)
+        query = select(Tenant).where(Tenant.slug == normalize_slug(slug))
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
@@ -44,6 +47,44 @@ class TenantRepository(BaseRepository[Tenant]):
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_or_none(self, tenant_id: UUID) -> Optional[Tenant]:
+        """
+        Get tenant by UUID from the session's identity map, querying only on a miss
+
+        Args:
+            tenant_id: Tenant UUID
+
+        Returns:
+            Tenant instance or None
+        """
+        return await self.session.get(Tenant, tenant_id)
+
+    async def get_odoo_credentials(self, tenant_id: UUID) -> Optional[Row]:
+        """
+        Get the columns needed to connect to a tenant's Odoo instance
+
+        Returns a plain row instead of a Tenant, so only these columns are
+        transferred and no ORM object is built.
+
+        Args:
+            tenant_id: Tenant UUID
+
+        Returns:
+            Row with id, name, slug and the odoo_* columns, or None
+        """
+        query = select(
+            Tenant.id,
+            Tenant.name,
+            Tenant.slug,
+            Tenant.odoo_url,
+            Tenant.odoo_database,
+            Tenant.odoo_username,
+            Tenant.odoo_password,
+            Tenant.odoo_version
+        ).where(Tenant.id == tenant_id)
+        result = await self.session.execute(query)
+        return result.one_or_none()
+
     async def is_slug_taken(self, slug: str, exclude_id: Optional[UUID] = None) -> bool:
         """
         Check if slug is already taken
@@ -55,7 +96,7 @@ class TenantRepository(BaseRepository[Tenant]):
         Returns:
             True if slug is taken, False otherwise
         """
-        query = select(Tenant).where(Tenant.slug == slug)
+        query = select(Tenant).where(Tenant.slug == normalize_slug(slug))
         if exclude_id:
             query = query.where(Tenant.id != exclude_id)
 
@@ -83,6 +124,48 @@ class TenantRepository(BaseRepository[Tenant]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def list_page(
+        self,
+        after: Optional[UUID] = None,
+        limit: int = 100,
+        status: Optional[TenantStatus] = None,
+        skip: int = 0
+    ) -> List[Tenant]:
+        """
+        List tenants newest first using keyset pagination
+
+        Args:
+            after: ID of the last tenant of the previous page
+            limit: Maximum number of records to return
+            status: Optional status filter
+            skip: Number of records to skip (offset paging, prefer after)
+
+        Returns:
+            List of tenants ordered by created_at, id descending
+        """
+        query = select(Tenant)
+
+        if status:
+            query = query.where(Tenant.status == status)
+
+        if after:
+            cursor_created_at = select(Tenant.created_at).where(Tenant.id == after).scalar_subquery()
+            query = query.where(
+                or_(
+                    Tenant.created_at < cursor_created_at,
+                    and_(Tenant.created_at == cursor_created_at, Tenant.id < after)
+                )
+            )
+
+        query = (
+            query
+            .order_by(Tenant.created_at.desc(), Tenant.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
     async def count_by_status(self, status: TenantStatus) -> int:
         """
         Count tenants by status
@@ -97,6 +180,61 @@ class TenantRepository(BaseRepository[Tenant]):
         result = await self.session.execute(query)
         return result.scalar()
 
+    async def count_grouped_by_status(self) -> Dict[TenantStatus, int]:
+        """
+        Count tenants per status in a single query
+
+        Returns:
+            Number of tenants for each status that has any
+        """
+        query = select(Tenant.status, func.count()).group_by(Tenant.status)
+        result = await self.session.execute(query)
+        return dict(result.all())
+
+    async def set_status(
+        self,
+        tenant_id: UUID,
+        status: TenantStatus,
+        *,
+        deleted_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Change a tenant's status in a single UPDATE ... RETURNING
+
+        Args:
+            tenant_id: Tenant UUID
+            status: New status
+            deleted_at: Soft-delete timestamp to store alongside the status
+
+        Returns:
+            True if the tenant exists, False otherwise
+        """
+        values = {"status": status}
+        if deleted_at is not None:
+            values["deleted_at"] = deleted_at
+
+        query = (
+            update(Tenant)
+            .where(Tenant.id == tenant_id)
+            .values(**values)
+            .returning(Tenant.id)
+        )
+        result = await self.session.execute(query)
+        await self.session.commit()
+        return result.scalar_one_or_none() is not None
+
+    async def set_odoo_version(self, tenant_id: UUID, odoo_version: str) -> None:
+        """
+        Store the Odoo version detected for a tenant
+
+        Args:
+            tenant_id: Tenant UUID
+            odoo_version: Odoo server version
+        """
+        query = update(Tenant).where(Tenant.id == tenant_id).values(odoo_version=odoo_version)
+        await self.session.execute(query)
+        await self.session.commit()
+
     async def update_last_active(self, tenant_id: UUID) -> None:
         """
         Update tenant's last active timestamp
@@ -53,6 +53,10 @@ class NameGetRequest(BaseModel):
     model: str = Field(..., description="Model name", min_length=1)
     ids: List[int] = Field(..., description="Record IDs", min_length=1)
     context: Optional[Dict[str, Any]] = Field(default=None, description="Additional context")
+    use_name_get: bool = Field(
+        default=False,
+        description="Call legacy name_get instead of reading display_name"
+    )
 
     class Config:
         json_schema_extra = {
@@ -43,6 +43,7 @@ class ValidateReferencesRequest(BaseModel):
         description="List of {'model': str, 'ids': List[int]}"
     )
     context: Optional[Dict[str, Any]] = Field(default=None, description="Additional context")
+    fail_fast: bool = Field(default=False, description="Stop at the first invalid reference")
 
     class Config:
         json_schema_extra = {
@@ -35,10 +35,11 @@ class AnalyticsService:
             Dictionary with system metrics
         """
         # Tenant statistics
-        total_tenants = await self.tenant_repo.count()
-        active_tenants = await self.tenant_repo.count_by_status(TenantStatus.ACTIVE)
-        trial_tenants = await self.tenant_repo.count_by_status(TenantStatus.TRIAL)
-        suspended_tenants = await self.tenant_repo.count_by_status(TenantStatus.SUSPENDED)
+        tenant_counts = await self.tenant_repo.count_grouped_by_status()
+        total_tenants = sum(tenant_counts.values())
+        active_tenants = tenant_counts.get(TenantStatus.ACTIVE, 0)
+        trial_tenants = tenant_counts.get(TenantStatus.TRIAL, 0)
+        suspended_tenants = tenant_counts.get(TenantStatus.SUSPENDED, 0)
 
         # Usage statistics (last 24 hours)
         yesterday = datetime.utcnow() - timedelta(hours=24)
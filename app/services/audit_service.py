@@ -1,13 +1,94 @@
 """
 Audit Logging Service
 """
-from typing import Dict, Any, Optional
+import asyncio
+import hashlib
+from typing import Dict, Any, List, Mapping, Optional, Sequence
 from datetime import datetime
+from types import MappingProxyType
 from loguru import logger
+import orjson
+from app.core.config import settings
+from app.core.monitoring import record_audit_entries_lost
+from app.db.session import AsyncSessionLocal
 from app.models.audit_log import AuditLog
 from app.repositories.audit_repository import AuditRepository
 
 
+# Queued audit rows are written when this many are pending...
+AUDIT_BATCH_SIZE = 100
+# ...or when the oldest pending row has waited this many seconds
+AUDIT_FLUSH_INTERVAL = 5.0
+# A failed batch is retried this many times in total, waiting
+# AUDIT_RETRY_BACKOFF seconds before the first retry and doubling after
+AUDIT_WRITE_ATTEMPTS = 3
+AUDIT_RETRY_BACKOFF = 0.5
+
+
+def _setting_set(value: str) -> frozenset:
+    """Parse a comma-separated setting into a frozenset"""
+    return frozenset(item.strip() for item in value.split(",") if item.strip())
+
+
+# Parsed once; AuditService is created per request
+_ENABLED_ACTIONS = _setting_set(settings.AUDIT_ACTIONS)
+_EXCLUDED_MODELS = _setting_set(settings.AUDIT_EXCLUDED_MODELS)
+
+
+# Columns covered by the audit hash chain
+_HASHED_FIELDS = (
+    "user_id", "system_id", "action", "model", "record_id",
+    "request_data", "response_data", "status", "error_message",
+    "ip_address", "user_agent", "duration_ms", "timestamp",
+)
+
+
+def _thaw_payload(row: Dict[str, Any]):
+    """Replace a read-only request_data view with a plain dict for storage"""
+    request_data = row.get("request_data")
+    if isinstance(request_data, MappingProxyType):
+        row["request_data"] = dict(request_data)
+
+
+def audit_row_hash(prev_hash: Optional[str], row: Mapping[str, Any]) -> str:
+    """
+    Chain hash of an audit row
+
+    blake2b over the previous row's hash and a canonical encoding of the
+    row's column values, so changing any row breaks every later hash.
+    """
+    payload = orjson.dumps(
+        {field: row.get(field) for field in _HASHED_FIELDS},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+    return hashlib.blake2b((prev_hash or "").encode() + payload, digest_size=32).hexdigest()
+
+
+def verify_audit_chain(entries: Sequence[AuditLog]) -> Optional[int]:
+    """
+    Check the hash chain of audit entries
+
+    Args:
+        entries: Consecutive audit entries ordered by id
+
+    Entries written directly by log_operation are not chained and are
+    skipped.
+
+    Returns:
+        ID of the first entry that was altered or does not follow its
+        predecessor, or None if the chain is intact
+    """
+    entries = [entry for entry in entries if entry.hash is not None]
+    prev_hash = entries[0].prev_hash if entries else None
+    for entry in entries:
+        values = {field: getattr(entry, field) for field in _HASHED_FIELDS}
+        if entry.prev_hash != prev_hash or entry.hash != audit_row_hash(prev_hash, values):
+            return entry.id
+        prev_hash = entry.hash
+    return None
+
+
 class AuditService:
     """
     Service for logging all operations (Audit Trail)
@@ -19,8 +100,20 @@ class AuditService:
     - Identify failed operations
     """
 
-    def __init__(self, audit_repo: AuditRepository):
+    def __init__(self, audit_repo: AuditRepository, batcher: Optional["AuditBatcher"] = None):
         self.audit_repo = audit_repo
+        self.batcher = batcher
+        self.enabled_actions: frozenset = _ENABLED_ACTIONS
+        self.excluded_models: frozenset = _EXCLUDED_MODELS
+
+    def is_enabled(self, action: str, model: Optional[str] = None) -> bool:
+        """
+        Whether an action on a model is written to the audit trail
+
+        Callers check this before building the audit payload so that
+        disabled actions cost nothing.
+        """
+        return action in self.enabled_actions and model not in self.excluded_models
 
     async def log_operation(
         self,
@@ -40,6 +133,10 @@ class AuditService:
         """
         Log an operation to audit trail
 
+        The row is written immediately and is not linked into the audit hash
+        chain; rows queued with enqueue_operation are chained when the
+        batcher writes them.
+
         Args:
             user_id: User who performed the operation
             system_id: System where operation was performed
@@ -65,28 +162,107 @@ class AuditService:
                 status="success"
             )
         """
-        log_entry = AuditLog(
-            user_id=user_id,
-            system_id=system_id,
-            action=action,
-            model=model,
-            record_id=record_id,
-            request_data=request_data,
-            response_data=response_data,
-            status=status,
-            error_message=error_message,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            timestamp=datetime.utcnow(),
-            duration_ms=duration_ms
+        row = {
+            "user_id": user_id,
+            "system_id": system_id,
+            "action": action,
+            "model": model,
+            "record_id": record_id,
+            "request_data": request_data,
+            "response_data": response_data,
+            "status": status,
+            "error_message": error_message,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "timestamp": datetime.utcnow(),
+            "duration_ms": duration_ms
+        }
+        _thaw_payload(row)
+
+        await self.audit_repo.create(AuditLog(**row))
+
+        logger.info(
+            f"Audit: User {user_id} performed {action} on system {system_id}/{model}/{record_id} - {status}"
         )
 
-        await self.audit_repo.create(log_entry)
+    async def enqueue_operation(
+        self,
+        user_id: int,
+        system_id: Optional[int],
+        action: str,
+        model: Optional[str] = None,
+        record_id: Optional[str] = None,
+        request_data: Optional[Dict[str, Any]] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+        status: str = "success",
+        error_message: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        duration_ms: Optional[int] = None
+    ):
+        """
+        Queue an operation for the audit trail without waiting for the write
+
+        Takes the same arguments as log_operation. The row is written in bulk
+        by the audit batcher; when no batcher is running it is written
+        immediately with log_operation.
+
+        request_data may be a MappingProxyType view of the caller's payload.
+        It is only copied when the batch is written, so the caller must not
+        mutate the payload afterwards.
+        """
+        batcher = self.batcher or audit_batcher
+        row = {
+            "user_id": user_id,
+            "system_id": system_id,
+            "action": action,
+            "model": model,
+            "record_id": record_id,
+            "request_data": request_data,
+            "response_data": response_data,
+            "status": status,
+            "error_message": error_message,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "timestamp": datetime.utcnow(),
+            "duration_ms": duration_ms
+        }
+
+        if not batcher.enqueue(row):
+            await self.log_operation(**{k: v for k, v in row.items() if k != "timestamp"})
+            return
 
         logger.info(
             f"Audit: User {user_id} performed {action} on system {system_id}/{model}/{record_id} - {status}"
         )
 
+    async def bulk_log_operations(self, rows: List[Dict[str, Any]]):
+        """
+        Write several audit rows in one transaction
+
+        Used by the audit batcher. Rows are linked into the audit hash chain
+        (prev_hash and hash are added to each dict) under the chain lock
+        before they are inserted.
+
+        Args:
+            rows: AuditLog column values, one dict per entry
+        """
+        if not rows:
+            return
+
+        # Chain the batch onto the last stored row; hashing happens here,
+        # in the batcher, rather than on the request path. The chain stays
+        # locked until insert_many() commits
+        prev_hash = await self.audit_repo.lock_chain_head()
+        for row in rows:
+            _thaw_payload(row)
+            row["prev_hash"] = prev_hash
+            prev_hash = row["hash"] = audit_row_hash(prev_hash, row)
+
+        await self.audit_repo.insert_many(rows)
+
+        logger.debug(f"Audit: wrote {len(rows)} entries")
+
     async def get_user_activity(
         self,
         user_id: int,
@@ -155,3 +331,140 @@ class AuditService:
             system_id=system_id,
             hours=hours
         )
+
+
+class AuditBatcher:
+    """
+    Buffer audit rows and write them in bulk from a background task
+
+    Rows are written once AUDIT_BATCH_SIZE are pending or AUDIT_FLUSH_INTERVAL
+    seconds after the first pending row, each batch in its own session.
+
+    Example:
+        >>> audit_batcher.start()      # application startup
+        >>> audit_batcher.enqueue(row)
+        >>> await audit_batcher.stop()  # application shutdown, writes the rest
+    """
+
+    def __init__(
+        self,
+        max_batch: int = AUDIT_BATCH_SIZE,
+        interval: float = AUDIT_FLUSH_INTERVAL,
+        session_factory=AsyncSessionLocal
+    ):
+        self.max_batch = max_batch
+        self.interval = interval
+        self._session_factory = session_factory
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start the background flusher on the running event loop"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._flusher())
+
+    def enqueue(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue an audit row without blocking
+
+        Returns:
+            False if the batcher is not running and the row was not queued
+        """
+        if not self.running:
+            return False
+        self._queue.put_nowait(row)
+        return True
+
+    async def flush(self):
+        """Write every queued row now"""
+        if self._queue is None:
+            return
+        rows = []
+        while not self._queue.empty():
+            row = self._queue.get_nowait()
+            if row is not None:
+                rows.append(row)
+        for start in range(0, len(rows), self.max_batch):
+            await self._write(rows[start:start + self.max_batch])
+
+    async def stop(self):
+        """Stop the flusher after it has written every queued row"""
+        if not self.running:
+            return
+        # The sentinel makes the flusher write what it holds and exit
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        await self.flush()
+
+    async def _flusher(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            if row is None:
+                return
+            batch = [row]
+            deadline = loop.time() + self.interval
+            stopping = False
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+            await self._write(batch)
+            if stopping:
+                return
+
+    async def _write(self, rows: List[Dict[str, Any]]):
+        """
+        Write a batch, retrying with backoff
+
+        If every attempt fails the rows are written one by one, so a single
+        bad row only loses itself; rows that still fail are logged and
+        counted in the audit_entries_lost_total metric.
+        """
+        if not rows:
+            return
+        for attempt in range(1, AUDIT_WRITE_ATTEMPTS + 1):
+            try:
+                await self._write_batch(rows)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Failed to write {len(rows)} audit entries "
+                    f"(attempt {attempt}/{AUDIT_WRITE_ATTEMPTS}): {str(e)}"
+                )
+            if attempt < AUDIT_WRITE_ATTEMPTS:
+                await asyncio.sleep(AUDIT_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+        lost = 0
+        for row in rows:
+            try:
+                await self._write_batch([row])
+            except Exception as e:
+                lost += 1
+                logger.error(f"Audit entry lost: {row.get('action')} {row.get('model')}/{row.get('record_id')} - {str(e)}")
+        if lost:
+            record_audit_entries_lost(lost)
+
+    async def _write_batch(self, rows: List[Dict[str, Any]]):
+        # Each attempt gets a fresh session, so a failed transaction is discarded
+        async with self._session_factory() as session:
+            await AuditService(AuditRepository(session)).bulk_log_operations(rows)
+
+
+# Shared batcher, started and stopped with the application
+audit_batcher = AuditBatcher()
@@ -2,7 +2,7 @@
 Redis Caching Service
 """
 import redis.asyncio as redis
-from typing import Optional, Any, Callable
+from typing import Optional, Any, Callable, List
 import json
 import pickle
 from datetime import timedelta
@@ -17,6 +17,7 @@ class CacheService:
     Features:
     - Get/Set/Delete operations
     - Pattern-based deletion
+    - Tag-based invalidation
     - TTL support
     - Decorator for automatic caching
     - Support for complex Python objects using pickle
@@ -123,6 +124,75 @@ class CacheService:
             logger.error(f"Cache delete pattern error for {pattern}: {str(e)}")
             return 0
 
+    async def set_tagged(
+        self,
+        key: str,
+        value: Any,
+        tags: List[str],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Save value to cache and register its key under tags
+
+        Tags are Redis sets of keys, so invalidate_tag deletes exactly the
+        tagged keys instead of scanning the keyspace like delete_pattern.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            tags: Tag names the key belongs to
+            ttl: Time to live in seconds (also applied to the tag sets)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            serialized = pickle.dumps(value)
+
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                if ttl:
+                    pipe.setex(key, ttl, serialized)
+                else:
+                    pipe.set(key, serialized)
+                for tag in tags:
+                    pipe.sadd(f"tag:{tag}", key)
+                    if ttl:
+                        # Tag sets expire with their latest entry
+                        pipe.expire(f"tag:{tag}", ttl)
+                await pipe.execute()
+
+            return True
+        except Exception as e:
+            logger.error(f"Cache set error for key {key}: {str(e)}")
+            return False
+
+    async def invalidate_tag(self, tag: str) -> int:
+        """
+        Delete every key registered under a tag
+
+        Args:
+            tag: Tag name
+
+        Returns:
+            Number of keys deleted
+
+        Example:
+            await cache.invalidate_tag("model:odoo-prod:res.partner")
+        """
+        try:
+            # Read and drop the tag atomically so keys tagged meanwhile
+            # stay registered for the next invalidation
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.smembers(f"tag:{tag}")
+                pipe.delete(f"tag:{tag}")
+                keys, _ = await pipe.execute()
+            if keys:
+                return await self.redis_client.delete(*keys)
+            return 0
+        except Exception as e:
+            logger.error(f"Cache invalidate tag error for {tag}: {str(e)}")
+            return 0
+
     async def exists(self, key: str) -> bool:
         """
         Check if key exists
@@ -150,13 +150,56 @@ class FieldMappingService:
         Returns:
             Universal schema data
         """
-        mapping_key = f"{system_type}_{system_version.replace('.', '_')}"
-        mapping = self.mappings.get(mapping_key, {}).get(model, {}).get("odoo_to_universal", {})
+        mapping = self._get_mapping(system_type, system_version, model, "odoo_to_universal")
 
         if not mapping:
             logger.warning(f"No mapping found for {system_type} {system_version} {model}")
             return data
 
+        return self._to_universal(data, mapping)
+
+    async def transform_batch_to_universal(
+        self,
+        records: List[Dict[str, Any]],
+        system_type: str,
+        system_version: str,
+        model: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Transform many system-specific records to universal schema
+
+        The mapping is resolved once for the whole batch.
+
+        Args:
+            records: System-specific records
+            system_type: System type (odoo, sap, etc.)
+            system_version: System version
+            model: Model name
+
+        Returns:
+            Universal schema records
+        """
+        mapping = self._get_mapping(system_type, system_version, model, "odoo_to_universal")
+
+        if not mapping:
+            logger.warning(f"No mapping found for {system_type} {system_version} {model}")
+            return records
+
+        return [self._to_universal(record, mapping) for record in records]
+
+    def _get_mapping(
+        self,
+        system_type: str,
+        system_version: str,
+        model: str,
+        direction: str
+    ) -> Dict[str, str]:
+        """Get the field mapping of a model in one direction"""
+        mapping_key = f"{system_type}_{system_version.replace('.', '_')}"
+        return self.mappings.get(mapping_key, {}).get(model, {}).get(direction, {})
+
+    def _to_universal(self, data: Dict[str, Any], mapping: Dict[str, str]) -> Dict[str, Any]:
+        """Apply an odoo_to_universal mapping to one record"""
         universal_data = {}
 
         for system_field, universal_field in mapping.items():
@@ -191,8 +234,7 @@ class FieldMappingService:
         Returns:
             System-specific data
         """
-        mapping_key = f"{system_type}_{system_version.replace('.', '_')}"
-        mapping = self.mappings.get(mapping_key, {}).get(model, {}).get("universal_to_odoo", {})
+        mapping = self._get_mapping(system_type, system_version, model, "universal_to_odoo")
 
         if not mapping:
             logger.warning(f"No mapping found for {system_type} {system_version} {model}")
@@ -4,10 +4,19 @@ Base service class for all Odoo operations
 This module provides the foundational class that all Odoo operation services inherit from.
 It handles authentication, JSON-RPC communication, context management, and error handling.
 """
+import asyncio
+import importlib.util
+import re
+import weakref
 from abc import ABC
-from typing import Any, Dict, List, Optional, Union
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 import httpx
 import json
+import orjson
 from loguru import logger
 
 from app.core.config import settings
@@ -20,6 +29,149 @@ from app.core.exceptions import (
     OdooModelNotFoundException,
     OdooRecordNotFoundException,
 )
+from .cache import (
+    count_cache,
+    forget_ids,
+    forget_xmlids,
+    invalidate_model,
+    invalidate_request_names,
+    remember_ids,
+    view_cache,
+    xmlid_cache,
+)
+from .disk_cache import disk_key, metadata_disk_cache
+
+
+# Methods that modify records; cached reads for the model are dropped after them
+WRITE_METHODS = frozenset({
+    "create", "write", "unlink", "copy", "name_create", "web_save",
+})
+
+# Methods whose results are lists of records carrying their ids
+RECORD_READ_METHODS = frozenset({
+    "read", "search_read", "web_read", "web_search_read",
+})
+
+# Shared read-only defaults for optional RPC arguments (no context, no
+# options, empty domain), so call sites don't allocate fresh empties per call
+EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
+EMPTY_LIST: Tuple = ()
+
+# The call_kw envelope never changes between calls, so its serialized prefix is
+# built once here and only the params object is encoded per request.
+_CALL_KW_PREFIX = b'{"jsonrpc":"2.0","method":"call","id":1,"params":'
+_CALL_KW_SUFFIX = b"}"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_SESSION_INFO_PAYLOAD = b'{"jsonrpc":"2.0","method":"call","params":{},"id":1}'
+
+# Leading major version of server_version strings such as "17.0+e" or "saas~17.2"
+_SERVER_VERSION_RE = re.compile(r"(?:saas~)?(\d+)")
+
+# Odoo's wire format for date and datetime values
+_ODOO_DATE_FORMAT = "%Y-%m-%d"
+_ODOO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def json_default(value: Any) -> Any:
+    """
+    orjson fallback for values it does not encode the way Odoo expects
+
+    Read-only mappings (EMPTY_DICT) become dicts, Decimals become floats and
+    dates/datetimes use Odoo's server format instead of ISO 8601.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, datetime):
+        # Odoo stores naive UTC datetimes
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime(_ODOO_DATETIME_FORMAT)
+    if isinstance(value, date):
+        return value.strftime(_ODOO_DATE_FORMAT)
+    if isinstance(value, time):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _build_call_kw_payload(
+    model: str,
+    method: str,
+    args: List,
+    kwargs: Mapping[str, Any]
+) -> bytes:
+    """Serialize a call_kw request body around the precomputed envelope"""
+    params = orjson.dumps(
+        {
+            "model": model,
+            "method": method,
+            "args": args,
+            "kwargs": kwargs
+        },
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        default=json_default
+    )
+    return _CALL_KW_PREFIX + params + _CALL_KW_SUFFIX
+
+
+# HTTP client shared by every service instance so connections (and TLS
+# sessions) are reused across requests. Session cookies are sent per request
+# by each service; the client's own cookie jar accepts nothing, so sessions of
+# different users never mix.
+#
+# Concurrent calls are not packed into JSON-RPC batch arrays: Odoo's JSON-RPC
+# dispatcher only accepts a single request object. With HTTP/2 they are
+# multiplexed over one connection instead.
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get (creating on first use) the pooled HTTP client for Odoo calls"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        pool_size = settings.ODOO_HTTP_POOL_SIZE
+        _shared_client = httpx.AsyncClient(
+            http2=settings.ODOO_HTTP2 and importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=60
+            ),
+            timeout=httpx.Timeout(60.0),
+            follow_redirects=True,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the pooled HTTP client and drop the loop's RPC semaphores (application shutdown)"""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+    _rpc_semaphores.pop(asyncio.get_running_loop(), None)
+
+
+# One semaphore per Odoo endpoint, shared by every service instance talking to
+# it. A semaphore binds to the event loop that first waits on it, so they are
+# kept per loop (weakly, so a closed loop's semaphores go with it)
+_rpc_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # loop -> {url: Semaphore}
+
+
+def _get_rpc_semaphore(odoo_url: str) -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent RPC calls to an Odoo endpoint on the running loop"""
+    loop = asyncio.get_running_loop()
+    semaphores = _rpc_semaphores.get(loop)
+    if semaphores is None:
+        semaphores = _rpc_semaphores.setdefault(loop, {})
+    semaphore = semaphores.get(odoo_url)
+    if semaphore is None:
+        semaphore = semaphores.setdefault(
+            odoo_url, asyncio.Semaphore(settings.ODOO_MAX_INFLIGHT)
+        )
+    return semaphore
 
 
 class OdooExecutionError(Exception):
@@ -95,26 +247,28 @@ class OdooOperationsService(ABC):
         self.base_context = context or {}
         self._uid: Optional[int] = None
         self._session_id = session_id
+        self._server_version: Optional[str] = None
         self._timeout = timeout
-
-        # HTTP client with connection pooling
-        self._client: Optional[httpx.AsyncClient] = None
+        self._call_kw_url = f"{self.odoo_url}/web/dataset/call_kw"
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with proper configuration"""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout),
-                follow_redirects=True,
-                cookies={} if not self._session_id else {"session_id": self._session_id}
-            )
-        return self._client
+        """Get the HTTP client shared by all Odoo services"""
+        return get_shared_client()
+
+    def _session_headers(self) -> Dict[str, str]:
+        """Request headers carrying this service's Odoo session cookie"""
+        if not self._session_id:
+            return _JSON_HEADERS
+        return {**_JSON_HEADERS, "Cookie": f"session_id={self._session_id}"}
 
     async def close(self):
-        """Close the HTTP client"""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """
+        Release the service's HTTP resources
+
+        The HTTP client is shared between services and closed at application
+        shutdown by close_shared_client(), so there is nothing to release here.
+        """
+        return None
 
     @property
     def uid(self) -> Optional[int]:
@@ -126,6 +280,22 @@ class OdooOperationsService(ABC):
         """Get current session ID"""
         return self._session_id
 
+    @property
+    def server_version(self) -> Optional[str]:
+        """Get Odoo server version reported at authentication"""
+        return self._server_version
+
+    @property
+    def server_major_version(self) -> Optional[int]:
+        """Get Odoo major version (e.g. 17 for "17.0" or "saas~17.2")"""
+        match = _SERVER_VERSION_RE.match(self._server_version or "")
+        return int(match.group(1)) if match else None
+
+    @property
+    def _cache_scope(self) -> tuple:
+        """Key prefix isolating cached results per Odoo instance and user"""
+        return (self.odoo_url, self.database, self.username)
+
     @property
     def is_authenticated(self) -> bool:
         """Check if service is authenticated"""
@@ -173,12 +343,13 @@ class OdooOperationsService(ABC):
 
             response = await client.post(
                 url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=self._timeout
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = orjson.loads(response.content)
 
             if "error" in result:
                 error_data = result["error"]
@@ -193,11 +364,8 @@ class OdooOperationsService(ABC):
                     response.cookies.get("session_id_http")
                 )
 
-                # Update client cookies
-                if self._session_id:
-                    self._client.cookies.set("session_id", self._session_id)
-
                 user_context = result["result"].get("user_context", {})
+                self._server_version = result["result"].get("server_version")
 
                 logger.info(
                     f"Authenticated with Odoo",
@@ -246,7 +414,7 @@ class OdooOperationsService(ABC):
         model: str,
         method: str,
         args: Optional[List] = None,
-        kwargs: Optional[Dict] = None,
+        kwargs: Optional[Mapping[str, Any]] = None,
         retry_on_session_expire: bool = True
     ) -> Any:
         """
@@ -273,32 +441,21 @@ class OdooOperationsService(ABC):
         """
         await self._ensure_authenticated()
 
-        # Merge context
-        merged_kwargs = kwargs.copy() if kwargs else {}
-        if "context" not in merged_kwargs:
-            merged_kwargs["context"] = {}
-        merged_kwargs["context"].update(self.base_context)
+        # Merge context into a new dict; the caller's context may be shared
+        merged_kwargs = dict(kwargs) if kwargs else {}
+        context = {**(merged_kwargs.get("context") or EMPTY_DICT), **self.base_context}
 
         # Add uid to context if available
-        if self._uid and "uid" not in merged_kwargs["context"]:
-            merged_kwargs["context"]["uid"] = self._uid
+        if self._uid and "uid" not in context:
+            context["uid"] = self._uid
+        merged_kwargs["context"] = context
 
-        url = f"{self.odoo_url}/web/dataset/call_kw"
-
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "call",
-            "params": {
-                "model": model,
-                "method": method,
-                "args": args or [],
-                "kwargs": merged_kwargs
-            },
-            "id": 1
-        }
+        payload = _build_call_kw_payload(model, method, args or [], merged_kwargs)
 
         logger.debug(
-            f"Executing {model}.{method}",
+            "Executing {}.{}",
+            model,
+            method,
             extra={
                 "model": model,
                 "method": method,
@@ -309,7 +466,13 @@ class OdooOperationsService(ABC):
 
         try:
             client = await self._get_client()
-            response = await client.post(url, json=payload)
+            async with _get_rpc_semaphore(self.odoo_url):
+                response = await client.post(
+                    self._call_kw_url,
+                    content=payload,
+                    headers=self._session_headers(),
+                    timeout=self._timeout
+                )
             response.raise_for_status()
 
             # Check content type
@@ -322,7 +485,7 @@ class OdooOperationsService(ABC):
 
             # Try to parse JSON with better error handling
             try:
-                result = response.json()
+                result = orjson.loads(response.content)
             except json.JSONDecodeError as json_err:
                 response_text = response.text[:1000]  # First 1000 chars
                 response_text_safe = response_text.replace('{', '{{').replace('}', '}}')
@@ -428,8 +591,34 @@ class OdooOperationsService(ABC):
                     data=error_details
                 )
 
-            logger.debug(f"✅ Successfully executed {model}.{method}")
-            return result.get("result")
+            rpc_result = result.get("result")
+
+            if method in RECORD_READ_METHODS:
+                self._remember_record_ids(model, rpc_result)
+            elif method in WRITE_METHODS:
+                invalidate_model(count_cache, self._cache_scope, model)
+                invalidate_request_names(self._cache_scope, model)
+                if method == "unlink" and args:
+                    ids = args[0] if isinstance(args[0], list) else [args[0]]
+                    forget_ids(self._cache_scope, model, ids)
+                    stale = forget_xmlids(self._cache_scope, model, ids)
+                    if metadata_disk_cache is not None:
+                        await metadata_disk_cache.adelete([disk_key(None, key) for key in stale])
+                if model == "ir.ui.view":
+                    scope = self._cache_scope
+                    view_cache.invalidate(lambda key: key[0] == scope)
+                    # Persisted views are stored under the model they render,
+                    # which the write does not name, so drop the whole scope
+                    if metadata_disk_cache is not None:
+                        await metadata_disk_cache.ainvalidate(scope)
+                elif model == "ir.model.data":
+                    scope = self._cache_scope
+                    xmlid_cache.invalidate(lambda key: key[0] == scope)
+                    if metadata_disk_cache is not None:
+                        await metadata_disk_cache.ainvalidate(scope, "ir.model.data")
+
+            logger.debug("✅ Successfully executed {}.{}", model, method)
+            return rpc_result
 
         except httpx.TimeoutException:
             raise OdooTimeoutException(
@@ -499,6 +688,16 @@ class OdooOperationsService(ABC):
                 data={"model": model, "method": method, "error_type": type(e).__name__, **response_info}
             )
 
+    def _remember_record_ids(self, model: str, result: Any) -> None:
+        """Record ids returned by a read so exists() can skip the RPC"""
+        records = result.get("records") if isinstance(result, dict) else result
+        if isinstance(records, list):
+            remember_ids(
+                self._cache_scope,
+                model,
+                (r["id"] for r in records if isinstance(r, dict) and "id" in r)
+            )
+
     async def _execute_with_cache(
         self,
         cache_key: str,
@@ -540,10 +739,12 @@ class OdooOperationsService(ABC):
             client = await self._get_client()
             response = await client.post(
                 f"{self.odoo_url}/web/session/get_session_info",
-                json={"jsonrpc": "2.0", "method": "call", "params": {}, "id": 1}
+                content=_SESSION_INFO_PAYLOAD,
+                headers=self._session_headers(),
+                timeout=self._timeout
             )
 
-            result = response.json()
+            result = orjson.loads(response.content)
 
             if "result" in result:
                 session_info = result["result"]
@@ -566,10 +767,12 @@ class OdooOperationsService(ABC):
             client = await self._get_client()
             response = await client.post(
                 f"{self.odoo_url}/web/session/get_session_info",
-                json={"jsonrpc": "2.0", "method": "call", "params": {}, "id": 1}
+                content=_SESSION_INFO_PAYLOAD,
+                headers=self._session_headers(),
+                timeout=self._timeout
             )
 
-            result = response.json()
+            result = orjson.loads(response.content)
             return result.get("result", {})
 
         except Exception as e:
@@ -0,0 +1,130 @@
+"""
+Micro-batching for Odoo RPC calls
+
+Collects id-based requests fired within a short window and serves them with a
+single RPC. Like the caches in cache.py, batchers live at module level so that
+calls from different per-request services can share a batch.
+"""
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from loguru import logger
+
+
+class _PendingBatch:
+    """Ids and waiting callers collected for one key"""
+
+    def __init__(self, fetch: Callable[[List[int]], Awaitable[Union[Iterable[int], Dict[int, Any]]]]):
+        self.fetch = fetch
+        self.ids: Set[int] = set()
+        self.waiters: List[Tuple[List[int], asyncio.Future]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class IdBatcher:
+    """
+    Coalesce concurrent id lookups into one RPC per key
+
+    Callers submit the ids they need; every submission for the same key within
+    window_ms (or until max_batch ids are pending) is answered by a single
+    fetch over the union of ids. Each caller gets back only its own ids that
+    were present in the fetch result, in the order it asked for them. When
+    fetch returns a dict keyed by id, callers get the matching sub-dict.
+
+    Example:
+        >>> batcher = IdBatcher()
+        >>> existing = await batcher.submit(
+        ...     key, [1, 2, 3], lambda ids: service._execute_kw(model, "exists", [ids])
+        ... )
+    """
+
+    def __init__(self):
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+        self._running: Set[asyncio.Future] = set()
+
+    async def submit(
+        self,
+        key: Hashable,
+        ids: List[int],
+        fetch: Callable[[List[int]], Awaitable[Union[Iterable[int], Dict[int, Any]]]],
+        window_ms: float = 2.0,
+        max_batch: int = 500
+    ) -> Union[List[int], Dict[int, Any]]:
+        """
+        Queue ids for the next batched fetch of key
+
+        Args:
+            key: Batch identity (scope, model, context, ...)
+            ids: Ids this caller needs
+            fetch: Coroutine function fetching a list of ids; the first
+                caller's fetch is used for the whole batch
+            window_ms: How long to wait for more callers before fetching
+            max_batch: Fetch immediately once this many ids are pending
+
+        Returns:
+            List[int] or Dict[int, Any]: Caller's ids (or id -> value
+            entries) found in the fetch result
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = _PendingBatch(fetch)
+            batch.timer = loop.call_later(window_ms / 1000, self._flush, key, batch)
+            self._pending[key] = batch
+
+        future = loop.create_future()
+        batch.waiters.append((ids, future))
+        batch.ids.update(ids)
+
+        if len(batch.ids) >= max_batch:
+            batch.timer.cancel()
+            self._flush(key, batch)
+
+        return await future
+
+    def _flush(self, key: Hashable, batch: _PendingBatch) -> None:
+        if self._pending.get(key) is batch:
+            del self._pending[key]
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: _PendingBatch) -> None:
+        try:
+            found = await batch.fetch(sorted(batch.ids))
+        except Exception as e:
+            logger.debug("Batched fetch failed: {}", e)
+            for _, future in batch.waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if isinstance(found, dict):
+            for ids, future in batch.waiters:
+                if not future.done():
+                    future.set_result({i: found[i] for i in ids if i in found})
+            return
+
+        found = set(found)
+        for ids, future in batch.waiters:
+            if not future.done():
+                future.set_result([i for i in ids if i in found])
+
+
+# Pending exists() lookups, keyed by (scope, model, context fingerprint)
+exists_batcher = IdBatcher()
+
+# Pending get_xmlids() lookups, keyed by (scope, model, context fingerprint)
+xmlid_batcher = IdBatcher()
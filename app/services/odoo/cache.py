@@ -0,0 +1,281 @@
+"""
+In-process caches for Odoo operations
+
+Odoo services are created per request, so caches that should survive across
+requests live at module level here. Every key starts with the service's cache
+scope (URL, database, user) so results never leak between tenants or users.
+"""
+import asyncio
+import copy
+import hashlib
+import time
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+import orjson
+from loguru import logger
+
+# Named caches log their stats at debug level once every this many lookups
+STATS_LOG_INTERVAL = 1000
+
+
+class TTLCache:
+    """
+    Bounded in-memory LRU cache with a fixed time-to-live
+
+    Entries are stored as (expires_at, value) pairs. Hits move an entry to the
+    back, so when the cache is full the least recently used entry is evicted.
+
+    Example:
+        >>> cache = TTLCache(maxsize=100, ttl=5)
+        >>> cache.set(("scope", "res.partner"), 42)
+        >>> cache.get(("scope", "res.partner"))
+        42
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 5.0, name: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        if self.name and (self.hits + self.misses + 1) % STATS_LOG_INTERVAL == 0:
+            logger.debug("Cache {} stats: {}", self.name, self.stats())
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data[key] = self._data.pop(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full"""
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+            self.evictions += 1
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum size, evicting least recently used entries if needed"""
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        while len(self._data) > maxsize:
+            self._data.pop(next(iter(self._data)))
+            self.evictions += 1
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every entry whose key matches predicate
+
+        Returns:
+            int: Number of entries removed
+        """
+        stale = [key for key in self._data if predicate(key)]
+        for key in stale:
+            del self._data[key]
+        return len(stale)
+
+    def invalidate_key(self, key: Hashable) -> bool:
+        """Remove a single entry, returning whether it was present"""
+        return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics"""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return size, capacity and hit/miss/eviction counters"""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls into a single execution
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same task instead of issuing their own request.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> result = await flight.run(key, lambda: service._execute_kw(...))
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        copy_result: bool = False
+    ) -> Any:
+        """
+        Run factory once per key among concurrent callers
+
+        Args:
+            key: Identity of the call
+            factory: Zero-argument callable returning the awaitable to run
+            copy_result: Give joining callers a deep copy so they can mutate it
+
+        Returns:
+            Any: Result of the shared call
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            result = await asyncio.shield(task)
+            return copy.deepcopy(result) if copy_result else result
+
+        task = asyncio.ensure_future(factory())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._discard(key, done))
+        return await asyncio.shield(task)
+
+    def _discard(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+
+def _fingerprint_default(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def fingerprint(value: Any) -> bytes:
+    """
+    Build a stable digest for a JSON-like value (domain, context, ...)
+
+    Dict keys are sorted so logically equal values share a fingerprint.
+    """
+    data = orjson.dumps(
+        value,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=_fingerprint_default
+    )
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def invalidate_model(cache: TTLCache, scope: Hashable, model: Optional[str]) -> int:
+    """Drop entries of a cache whose keys are (scope, model, ...) tuples"""
+    return cache.invalidate(lambda key: key[0] == scope and key[1] == model)
+
+
+# search_count results, keyed by (scope, model, domain fingerprint, context fingerprint)
+count_cache = TTLCache(maxsize=1024, ttl=5, name="count")
+
+# In-flight search_read calls shared between concurrent requests
+search_read_flight = SingleFlight()
+
+# fields_get results; field metadata only changes on module upgrades
+fields_cache = TTLCache(maxsize=1024, ttl=3600, name="fields")
+
+# Raw get_view / get_views / fields_view_get / load_views responses
+view_cache = TTLCache(maxsize=512, ttl=600, name="view")
+
+# In-flight fields_get and view loads, keyed like their cache entries
+metadata_flight = SingleFlight()
+
+# Record ids recently returned by read/search_read/web_read, keyed by
+# (scope, model, id). Used to answer exists() without an RPC.
+known_ids_cache = TTLCache(maxsize=10000, ttl=60, name="known_ids")
+
+
+def remember_ids(scope: Hashable, model: str, ids: Iterable[int]) -> None:
+    """Mark ids as known to exist for a model"""
+    for record_id in ids:
+        known_ids_cache.set((scope, model, record_id), True)
+
+
+def forget_ids(scope: Hashable, model: str, ids: Iterable[int]) -> None:
+    """Drop ids from the known-ids cache (e.g. after unlink)"""
+    for record_id in ids:
+        known_ids_cache.invalidate_key((scope, model, record_id))
+
+
+# External ids in both directions: (scope, model, res_id) -> "module.name" (None
+# when the record has none) and (scope, "ir.model.data", "module.name") ->
+# (model, res_id). XML ids practically never change once created.
+xmlid_cache = TTLCache(maxsize=10000, ttl=3600, name="xmlid")
+
+
+def xmlid_keys(scope: Hashable, model: str, record_id: int, xmlid: Optional[str]) -> List[Tuple]:
+    """Return the forward key and, if xmlid is set, the reverse key for a record"""
+    keys = [(scope, model, record_id)]
+    if xmlid:
+        keys.append((scope, "ir.model.data", xmlid))
+    return keys
+
+
+def forget_xmlids(scope: Hashable, model: str, ids: Iterable[int]) -> List[Tuple]:
+    """
+    Drop cached external ids of records (e.g. after unlink)
+
+    Returns:
+        List[Tuple]: Keys to drop from persistent storage as well; reverse
+        keys are only known for records whose xmlid was still in memory
+    """
+    stale = []
+    for record_id in ids:
+        xmlid = xmlid_cache.get((scope, model, record_id))
+        for key in xmlid_keys(scope, model, record_id, xmlid):
+            xmlid_cache.invalidate_key(key)
+            stale.append(key)
+    return stale
+
+
+# Per-request display name cache, bound by name_cache_middleware. Maps
+# (scope, model, context fingerprint, use_name_get) -> {id: display_name}.
+NAME_CACHE: ContextVar[Optional[Dict[Hashable, Dict[int, Any]]]] = ContextVar(
+    "name_cache", default=None
+)
+
+
+def invalidate_request_names(scope: Hashable, model: Optional[str]) -> None:
+    """Drop display names cached for a model in the current request"""
+    names = NAME_CACHE.get()
+    if names:
+        for key in [key for key in names if key[0] == scope and key[1] == model]:
+            del names[key]
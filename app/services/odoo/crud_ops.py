@@ -373,7 +373,6 @@ class CRUDOperations(OdooOperationsService):
 
         # Copy authentication state
         search_service._uid = self._uid
-        search_service._client = self._client
 
         existing_ids = await search_service.search(
             model=model,
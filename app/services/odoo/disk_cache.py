@@ -0,0 +1,196 @@
+"""
+Persistent metadata cache for Odoo operations
+
+Field definitions and view architectures rarely change between restarts, so
+they can be kept on disk and reused by the next process instead of being
+re-fetched on the first UI render. Entries live in a small SQLite database and
+are serialized with orjson. Disk I/O runs in a worker thread.
+
+Enabled by setting ODOO_METADATA_CACHE_DIR; when it is empty the cache is off.
+"""
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional
+
+import orjson
+from loguru import logger
+
+from app.core.config import settings
+
+from .cache import fingerprint
+
+# Bump when the shape of cached values changes so stale rows are never read
+SCHEMA_VERSION = 1
+
+
+class DiskCache:
+    """
+    SQLite-backed key/value cache with a TTL
+
+    Rows are stored with the scope and model they belong to so that
+    invalidation can target one model of one Odoo instance.
+
+    Example:
+        >>> cache = DiskCache("/var/cache/bridgecore/odoo_meta")
+        >>> await cache.aset(scope, "res.partner", key, {"name": {...}})
+        >>> await cache.aget(key)
+    """
+
+    def __init__(self, directory: str, ttl: int = 86400):
+        self.path = os.path.join(os.path.expanduser(directory), "metadata.sqlite3")
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "key BLOB PRIMARY KEY, scope BLOB NOT NULL, model TEXT NOT NULL, "
+                "value BLOB NOT NULL, ts INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS metadata_scope_model ON metadata (scope, model)"
+            )
+        return self._conn
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """Return the stored value for key, or None if missing or expired"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value, ts FROM metadata WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] + self.ttl <= time.time():
+            return None
+        return orjson.loads(row[0])
+
+    def set(self, scope: Hashable, model: str, key: bytes, value: Any) -> None:
+        """Store value under key"""
+        data = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, scope, model, value, ts) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, fingerprint(scope), model, data, int(time.time()))
+            )
+            conn.commit()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, Any]:
+        """Return the stored values of keys that are present and not expired"""
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT key, value, ts FROM metadata WHERE key IN ({placeholders})",
+                keys
+            ).fetchall()
+        now = time.time()
+        return {
+            bytes(key): orjson.loads(value)
+            for key, value, ts in rows
+            if ts + self.ttl > now
+        }
+
+    def set_many(self, scope: Hashable, model: str, items: Dict[bytes, Any]) -> None:
+        """Store several values for one scope and model"""
+        scope_key = fingerprint(scope)
+        now = int(time.time())
+        rows = [
+            (key, scope_key, model, orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS), now)
+            for key, value in items.items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO metadata (key, scope, model, value, ts) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+
+    def delete(self, keys: List[bytes]) -> None:
+        """Delete rows by key"""
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("DELETE FROM metadata WHERE key = ?", [(key,) for key in keys])
+            conn.commit()
+
+    def invalidate(self, scope: Hashable, model: Optional[str] = None) -> int:
+        """Delete rows for a scope, optionally limited to one model"""
+        with self._lock:
+            conn = self._connect()
+            if model is None:
+                cursor = conn.execute(
+                    "DELETE FROM metadata WHERE scope = ?", (fingerprint(scope),)
+                )
+            else:
+                cursor = conn.execute(
+                    "DELETE FROM metadata WHERE scope = ? AND model = ?",
+                    (fingerprint(scope), model)
+                )
+            conn.commit()
+            return cursor.rowcount
+
+    async def aget(self, key: bytes) -> Optional[Any]:
+        """Async get; failures are logged and treated as a miss"""
+        try:
+            return await asyncio.to_thread(self.get, key)
+        except Exception as e:
+            logger.warning(f"Metadata disk cache read failed: {e}")
+            return None
+
+    async def aset(self, scope: Hashable, model: str, key: bytes, value: Any) -> None:
+        """Async set; failures are logged and ignored"""
+        try:
+            await asyncio.to_thread(self.set, scope, model, key, value)
+        except Exception as e:
+            logger.warning(f"Metadata disk cache write failed: {e}")
+
+    async def aget_many(self, keys: List[bytes]) -> Dict[bytes, Any]:
+        """Async get_many; failures are logged and treated as misses"""
+        try:
+            return await asyncio.to_thread(self.get_many, keys)
+        except Exception as e:
+            logger.warning(f"Metadata disk cache read failed: {e}")
+            return {}
+
+    async def aset_many(self, scope: Hashable, model: str, items: Dict[bytes, Any]) -> None:
+        """Async set_many; failures are logged and ignored"""
+        try:
+            await asyncio.to_thread(self.set_many, scope, model, items)
+        except Exception as e:
+            logger.warning(f"Metadata disk cache write failed: {e}")
+
+    async def adelete(self, keys: List[bytes]) -> None:
+        """Async delete; failures are logged and ignored"""
+        try:
+            await asyncio.to_thread(self.delete, keys)
+        except Exception as e:
+            logger.warning(f"Metadata disk cache delete failed: {e}")
+
+    async def ainvalidate(self, scope: Hashable, model: Optional[str] = None) -> int:
+        """Async invalidate; failures are logged and ignored"""
+        try:
+            return await asyncio.to_thread(self.invalidate, scope, model)
+        except Exception as e:
+            logger.warning(f"Metadata disk cache invalidation failed: {e}")
+            return 0
+
+
+def disk_key(server_version: Optional[str], cache_key: Hashable) -> bytes:
+    """Build a disk cache key from an in-memory key and the Odoo version"""
+    return fingerprint([SCHEMA_VERSION, server_version, cache_key])
+
+
+metadata_disk_cache: Optional[DiskCache] = (
+    DiskCache(settings.ODOO_METADATA_CACHE_DIR, settings.ODOO_METADATA_CACHE_TTL)
+    if settings.ODOO_METADATA_CACHE_DIR
+    else None
+)
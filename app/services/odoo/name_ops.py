@@ -6,10 +6,11 @@ This module provides name-related operations for Odoo:
 - name_get: Get display name for records
 - name_create: Create record with just a name
 """
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from loguru import logger
 
 from .base import OdooOperationsService
+from .cache import NAME_CACHE, fingerprint
 
 
 class NameOperations(OdooOperationsService):
@@ -40,7 +41,7 @@ class NameOperations(OdooOperationsService):
         operator: str = "ilike",
         limit: int = 100,
         context: Optional[Dict[str, Any]] = None
-    ) -> List[Tuple[int, str]]:
+    ) -> List[Sequence[Any]]:
         """
         Search records by name
 
@@ -56,7 +57,7 @@ class NameOperations(OdooOperationsService):
             context: Additional context
 
         Returns:
-            List[Tuple[int, str]]: List of (id, display_name) tuples
+            List[Sequence[Any]]: List of [id, display_name] pairs as returned by Odoo
 
         Example:
             >>> results = await service.name_search(
@@ -66,7 +67,7 @@ class NameOperations(OdooOperationsService):
             ...     operator='ilike',
             ...     limit=10
             ... )
-            >>> # Returns: [(1, 'Ahmed Company'), (5, 'Ahmed Trading')]
+            >>> # Returns: [[1, 'Ahmed Company'], [5, 'Ahmed Trading']]
         """
         kwargs: Dict[str, Any] = {
             "name": name,
@@ -94,8 +95,8 @@ class NameOperations(OdooOperationsService):
             kwargs=kwargs
         )
 
-        # Convert to list of tuples
-        results = [(r[0], r[1]) for r in result] if result else []
+        # Pairs are already subscriptable, no need to rebuild them as tuples
+        results = result or []
 
         logger.debug(f"name_search returned {len(results)} results for {model}")
         return results
@@ -104,54 +105,109 @@ class NameOperations(OdooOperationsService):
         self,
         model: str,
         ids: List[int],
-        context: Optional[Dict[str, Any]] = None
-    ) -> List[Tuple[int, str]]:
+        context: Optional[Dict[str, Any]] = None,
+        use_name_get: bool = False
+    ) -> List[Sequence[Any]]:
         """
         Get display names for records
 
-        Returns the display name (name_get) for specified record IDs.
-        The display name is computed based on the model's _rec_name field
-        and _name_get method.
+        Returns the display name for specified record IDs. By default this
+        reads the display_name field directly, which skips the server-side
+        name_get computation and prefetch cascade.
 
         Args:
             model: Model name
             ids: List of record IDs
             context: Additional context
+            use_name_get: Call the legacy name_get method instead of reading
+                display_name (for models where display_name is not available)
 
         Returns:
-            List[Tuple[int, str]]: List of (id, display_name) tuples
+            List[Sequence[Any]]: List of [id, display_name] pairs as returned by Odoo
 
         Example:
             >>> names = await service.name_get(
             ...     model='res.partner',
             ...     ids=[1, 2, 3]
             ... )
-            >>> # Returns: [(1, 'Company A'), (2, 'John Doe'), (3, 'Jane Smith')]
+            >>> # Returns: [[1, 'Company A'], [2, 'John Doe'], [3, 'Jane Smith']]
+        """
+        if not ids:
+            return []
+
+        results = await self._raw_name_get(model, ids, context, use_name_get)
+
+        logger.debug(f"name_get returned {len(results)} names for {model}")
+        return results
+
+    async def _raw_name_get(
+        self,
+        model: str,
+        ids: List[int],
+        context: Optional[Dict[str, Any]] = None,
+        use_name_get: bool = False
+    ) -> List[Sequence[Any]]:
         """
+        Fetch [id, display_name] pairs for records
+
+        Shared by name_get and get_display_names so neither has to
+        materialize an intermediate list before shaping its result.
+        Inside a request, names are cached per request so repeated lookups
+        only fetch the ids that have not been seen yet.
+        """
+        names = NAME_CACHE.get()
+        if names is None:
+            return await self._fetch_names(model, ids, context, use_name_get)
+
+        bucket = names.setdefault(
+            (
+                self._cache_scope,
+                model,
+                fingerprint([context or {}, self.base_context]),
+                use_name_get
+            ),
+            {}
+        )
+        missing = [id for id in ids if id not in bucket]
+        if missing:
+            for pair in await self._fetch_names(model, missing, context, use_name_get):
+                bucket[pair[0]] = pair[1]
+
+        return [(id, bucket[id]) for id in ids if id in bucket]
+
+    async def _fetch_names(
+        self,
+        model: str,
+        ids: List[int],
+        context: Optional[Dict[str, Any]],
+        use_name_get: bool
+    ) -> List[Sequence[Any]]:
+        """Fetch [id, display_name] pairs from Odoo"""
         kwargs: Dict[str, Any] = {}
         if context:
             kwargs["context"] = context
 
-        if not ids:
-            return []
-
         logger.debug(
             f"name_get on {model}",
-            extra={"model": model, "ids": ids}
+            extra={"model": model, "ids": ids, "use_name_get": use_name_get}
         )
 
+        if use_name_get:
+            result = await self._execute_kw(
+                model=model,
+                method="name_get",
+                args=[ids],
+                kwargs=kwargs
+            )
+            return result or []
+
         result = await self._execute_kw(
             model=model,
-            method="name_get",
-            args=[ids],
+            method="read",
+            args=[ids, ["display_name"]],
             kwargs=kwargs
         )
-
-        # Convert to list of tuples
-        results = [(r[0], r[1]) for r in result] if result else []
-
-        logger.debug(f"name_get returned {len(results)} names for {model}")
-        return results
+        return [(r["id"], r["display_name"]) for r in result] if result else []
 
     async def name_create(
         self,
@@ -209,7 +265,8 @@ class NameOperations(OdooOperationsService):
         self,
         model: str,
         ids: List[int],
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        use_name_get: bool = False
     ) -> Dict[int, str]:
         """
         Get display names as a dictionary
@@ -220,6 +277,7 @@ class NameOperations(OdooOperationsService):
             model: Model name
             ids: List of record IDs
             context: Additional context
+            use_name_get: Call the legacy name_get method instead of reading display_name
 
         Returns:
             Dict[int, str]: Mapping of id -> display_name
@@ -231,5 +289,8 @@ class NameOperations(OdooOperationsService):
             ... )
             >>> print(names[1])  # 'Company A'
         """
-        results = await self.name_get(model, ids, context)
-        return {id: name for id, name in results}
+        if not ids:
+            return {}
+
+        result = await self._raw_name_get(model, ids, context, use_name_get)
+        return {r[0]: r[1] for r in result}
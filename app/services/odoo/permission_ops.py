@@ -4,10 +4,41 @@ Permission Operations for Odoo
 This module provides permission-related operations:
 - check_access_rights: Check if user has rights for an operation
 """
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
 from loguru import logger
 
-from .base import OdooOperationsService
+from app.core.exceptions import OdooModelNotFoundException
+
+from .base import OdooExecutionError, OdooOperationsService
+
+# Endpoints whose Odoo version has no has_access method (pre-18); these go
+# straight to the exception-based check_access_rule path
+_legacy_rule_check_endpoints: Set[str] = set()
+
+# Optional server-side helper that checks many models in one RPC. It is provided
+# by a companion Odoo addon; endpoints without it use client-side fan-out.
+BULK_PERMISSIONS_MODEL = "bridgecore.perms"
+BULK_PERMISSIONS_METHOD = "bulk_access_rights"
+_no_bulk_permission_endpoints: Set[str] = set()
+
+CRUD_OPERATIONS = ("create", "read", "write", "unlink")
+
+
+def _bulk_helper_missing(error: Exception) -> bool:
+    """Whether an error from the bulk RPC means the server lacks the helper"""
+    if isinstance(error, OdooModelNotFoundException):
+        return True
+    if not isinstance(error, OdooExecutionError):
+        return False
+    if error.data.get("error_type") == "method_not_found":
+        return True
+    # Odoo answers an unknown model with a KeyError naming it
+    return (
+        error.data.get("name") == "builtins.KeyError"
+        and BULK_PERMISSIONS_MODEL in str(error.data.get("message", ""))
+    )
 
 
 class PermissionOperations(OdooOperationsService):
@@ -115,15 +146,12 @@ class PermissionOperations(OdooOperationsService):
             >>> print(rights)
             >>> # {'create': True, 'read': True, 'write': True, 'unlink': False}
         """
-        operations = ['create', 'read', 'write', 'unlink']
-        rights = {}
+        results = await asyncio.gather(*(
+            self.check_access_rights(model, op, False, context)
+            for op in CRUD_OPERATIONS
+        ))
 
-        for op in operations:
-            rights[op] = await self.check_access_rights(
-                model, op, False, context
-            )
-
-        return rights
+        return dict(zip(CRUD_OPERATIONS, results, strict=True))
 
     async def check_access_rules(
         self,
@@ -138,6 +166,10 @@ class PermissionOperations(OdooOperationsService):
         Checks if user can perform operation on specific records,
         considering record rules (ir.rule).
 
+        Uses has_access, which answers with a boolean instead of raising an
+        AccessError. Older Odoo versions without it fall back to
+        check_access_rule and treat an error as denied.
+
         Args:
             model: Model name
             ids: List of record IDs to check
@@ -164,8 +196,26 @@ class PermissionOperations(OdooOperationsService):
             extra={"model": model, "operation": operation, "ids": ids}
         )
 
+        if self.odoo_url not in _legacy_rule_check_endpoints:
+            try:
+                result = await self._execute_kw(
+                    model=model,
+                    method="has_access",
+                    args=[ids, operation],
+                    kwargs=kwargs
+                )
+                return bool(result)
+            except OdooExecutionError as e:
+                if e.data.get("error_type") != "method_not_found":
+                    logger.debug("Access rule check failed: {}", e)
+                    return False
+                _legacy_rule_check_endpoints.add(self.odoo_url)
+            except Exception as e:
+                logger.debug("Access rule check failed: {}", e)
+                return False
+
         try:
-            result = await self._execute_kw(
+            await self._execute_kw(
                 model=model,
                 method="check_access_rule",
                 args=[ids, operation],
@@ -173,7 +223,7 @@ class PermissionOperations(OdooOperationsService):
             )
             return True
         except Exception as e:
-            logger.debug(f"Access rule check failed: {e}")
+            logger.debug("Access rule check failed: {}", e)
             return False
 
     async def get_user_permissions(
@@ -187,6 +237,10 @@ class PermissionOperations(OdooOperationsService):
         Batch check permissions for multiple models.
         Useful for initializing app with user capabilities.
 
+        When the Odoo instance provides bridgecore.perms.bulk_access_rights,
+        all models are checked in a single round trip. Otherwise the checks
+        run concurrently, bounded by the per-endpoint RPC limit.
+
         Args:
             models: List of model names
             context: Additional context
@@ -203,11 +257,42 @@ class PermissionOperations(OdooOperationsService):
             >>> for model, rights in perms.items():
             ...     print(f"{model}: {rights}")
         """
-        permissions = {}
-
-        for model in models:
-            permissions[model] = await self.check_all_access_rights(
-                model, context
-            )
-
-        return permissions
+        if not models:
+            return {}
+
+        if self.odoo_url not in _no_bulk_permission_endpoints:
+            kwargs: Dict[str, Any] = {}
+            if context:
+                kwargs["context"] = context
+
+            try:
+                result = await self._execute_kw(
+                    model=BULK_PERMISSIONS_MODEL,
+                    method=BULK_PERMISSIONS_METHOD,
+                    args=[models],
+                    kwargs=kwargs
+                )
+            except (OdooExecutionError, OdooModelNotFoundException) as e:
+                # Only a missing helper disables the bulk path for the
+                # endpoint; other server errors fall back for this call.
+                # Transport errors propagate.
+                if _bulk_helper_missing(e):
+                    logger.debug("Bulk permission check unavailable: {}", e)
+                    _no_bulk_permission_endpoints.add(self.odoo_url)
+                else:
+                    logger.warning("Bulk permission check failed, checking per model: {}", e)
+            else:
+                if not isinstance(result, dict):
+                    raise OdooExecutionError(
+                        f"{BULK_PERMISSIONS_MODEL}.{BULK_PERMISSIONS_METHOD} returned "
+                        f"{type(result).__name__}, expected a dict",
+                        data={"model": BULK_PERMISSIONS_MODEL, "method": BULK_PERMISSIONS_METHOD}
+                    )
+                return result
+
+        results = await asyncio.gather(*(
+            self.check_all_access_rights(model, context)
+            for model in models
+        ))
+
+        return dict(zip(models, results, strict=True))
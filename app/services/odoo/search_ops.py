@@ -6,11 +6,12 @@ This module provides search-related operations for Odoo:
 - search_read: Search + read in one operation
 - search_count: Count matching records
 """
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 import time
 from loguru import logger
 
 from .base import OdooOperationsService
+from .cache import count_cache, fingerprint, search_read_flight
 
 
 class SearchOperations(OdooOperationsService):
@@ -153,6 +154,7 @@ class SearchOperations(OdooOperationsService):
 
         This combines search and read into a single efficient operation.
         Use this when you need both to find records and read their data.
+        Concurrent calls with the same arguments are coalesced into one RPC.
 
         Args:
             model: Model name (e.g., 'res.partner', 'product.product')
@@ -206,8 +208,10 @@ class SearchOperations(OdooOperationsService):
         if context:
             kwargs["context"] = context
 
-        start_time = time.time()
-        
+        start_time = time.perf_counter_ns()
+
+        # Positional args leave formatting to loguru, which skips it when
+        # INFO is disabled
         logger.info(
             "🔍 [SEARCHREAD] Starting search_read operation\n"
             "   Model: {}\n"
@@ -215,62 +219,74 @@ class SearchOperations(OdooOperationsService):
             "   Fields: {}\n"
             "   Limit: {}\n"
             "   Offset: {}\n"
-            "   Order: {}".format(
-                str(model),
-                domain,
-                fields,
-                limit,
-                offset,
-                order
-            )
+            "   Order: {}",
+            model,
+            domain,
+            fields,
+            limit,
+            offset,
+            order
+        )
+
+        # Identical concurrent calls share one RPC
+        flight_key = (
+            self._cache_scope,
+            model,
+            fingerprint(domain or []),
+            tuple(fields or ()),
+            limit,
+            offset,
+            order,
+            fingerprint([context or {}, self.base_context])
         )
 
         try:
-            result = await self._execute_kw(
-                model=model,
-                method="search_read",
-                args=[domain or []],
-                kwargs=kwargs
+            result = await search_read_flight.run(
+                flight_key,
+                lambda: self._execute_kw(
+                    model=model,
+                    method="search_read",
+                    args=[domain or []],
+                    kwargs=kwargs
+                ),
+                copy_result=True
             )
 
             records = result if isinstance(result, list) else []
-            duration = (time.time() - start_time) * 1000
+            duration = (time.perf_counter_ns() - start_time) / 1_000_000
 
             logger.info(
                 "✅ [SEARCHREAD] Completed successfully\n"
                 "   Model: {}\n"
                 "   Records returned: {}\n"
-                "   Duration: {:.2f}ms".format(
-                    str(model),
-                    len(records),
-                    duration
-                )
+                "   Duration: {:.2f}ms",
+                model,
+                len(records),
+                duration
             )
 
             return records
         except Exception as e:
-            duration = (time.time() - start_time) * 1000
-            error_msg = str(e).replace('{', '{{').replace('}', '}}')
+            duration = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.error(
                 "❌ [SEARCHREAD] Error: {}\n"
                 "   Model: {}\n"
                 "   Domain: {}\n"
-                "   Duration: {:.2f}ms".format(
-                    error_msg,
-                    str(model),
-                    domain,
-                    duration
-                ),
+                "   Duration: {:.2f}ms",
+                e,
+                model,
+                domain,
+                duration,
                 exc_info=True
             )
             raise
-        return records
 
     async def search_count(
         self,
         model: str,
         domain: Optional[List] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> int:
         """
         Count records matching the domain
@@ -278,10 +294,14 @@ class SearchOperations(OdooOperationsService):
         This is the most efficient way to get the count of matching records.
         Use for pagination metadata or dashboard statistics.
 
+        Counts are cached for a few seconds per (model, domain, context) and
+        dropped whenever this service writes to the model.
+
         Args:
             model: Model name
             domain: Search domain expression
             context: Additional context values
+            use_cache: Whether to serve and store the count in the short-lived cache
 
         Returns:
             int: Count of records matching the domain
@@ -312,6 +332,19 @@ class SearchOperations(OdooOperationsService):
         if context:
             kwargs["context"] = context
 
+        cache_key = None
+        if use_cache:
+            cache_key = (
+                self._cache_scope,
+                model,
+                fingerprint(domain or []),
+                fingerprint([context or {}, self.base_context])
+            )
+            cached = count_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"search_count cache hit for {model}")
+                return cached
+
         logger.debug(
             f"search_count on {model}",
             extra={"model": model, "domain": domain}
@@ -326,9 +359,68 @@ class SearchOperations(OdooOperationsService):
 
         count = result if isinstance(result, int) else 0
 
+        if cache_key is not None:
+            count_cache.set(cache_key, count)
+
         logger.debug(f"search_count returned {count} for {model}")
         return count
 
+    async def iter_search_read(
+        self,
+        model: str,
+        domain: Optional[List] = None,
+        fields: Optional[List[str]] = None,
+        batch_size: int = 500,
+        order: str = "id ASC",
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over matching records one batch at a time
+
+        Use for exports and other large reads: only one batch of records is
+        held in memory at a time instead of the whole result set.
+
+        Args:
+            model: Model name
+            domain: Search domain
+            fields: Fields to read
+            batch_size: Number of records fetched per RPC
+            order: Sort order; should be stable so batches don't overlap
+            context: Additional context
+
+        Yields:
+            Dict[str, Any]: Records with requested fields
+
+        Example:
+            >>> async for partner in service.iter_search_read(
+            ...     'res.partner',
+            ...     fields=['name', 'email'],
+            ...     batch_size=1000
+            ... ):
+            ...     writer.writerow(partner)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        offset = 0
+        while True:
+            records = await self.search_read(
+                model=model,
+                domain=domain,
+                fields=fields,
+                limit=batch_size,
+                offset=offset,
+                order=order,
+                context=context
+            )
+
+            for record in records:
+                yield record
+
+            if len(records) < batch_size:
+                return
+            offset += batch_size
+
     async def paginated_search_read(
         self,
         model: str,
@@ -353,6 +445,9 @@ class SearchOperations(OdooOperationsService):
             order: Sort order
             context: Additional context
 
+        Raises:
+            ValueError: If page_size is less than 1
+
         Returns:
             Dict containing:
                 - records: List of records
@@ -374,6 +469,9 @@ class SearchOperations(OdooOperationsService):
             >>> for record in result['records']:
             ...     print(record['name'])
         """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+
         # Calculate offset
         offset = (page - 1) * page_size
 
@@ -391,8 +489,8 @@ class SearchOperations(OdooOperationsService):
             context=context
         )
 
-        # Calculate total pages
-        pages = (total + page_size - 1) // page_size if page_size > 0 else 1
+        # Calculate total pages (ceiling division)
+        pages = -(-total // page_size)
 
         return {
             "records": records,
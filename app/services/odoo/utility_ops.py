@@ -3,11 +3,17 @@ Utility Operations for Odoo
 
 This module provides utility operations:
 - exists: Check if records exist
+- get_xmlids / resolve_xmlid: Cached external id lookups
 """
-from typing import Any, Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
 from loguru import logger
 
-from .base import OdooOperationsService
+from .base import EMPTY_DICT, EMPTY_LIST, OdooOperationsService
+from .batching import exists_batcher, xmlid_batcher
+from .cache import fingerprint, known_ids_cache, xmlid_cache, xmlid_keys
+from .disk_cache import disk_key, metadata_disk_cache
 
 
 class UtilityOperations(OdooOperationsService):
@@ -23,6 +29,25 @@ class UtilityOperations(OdooOperationsService):
         >>> print(existing)  # [1, 2] (999 doesn't exist)
     """
 
+    def __init__(
+        self,
+        *args: Any,
+        batch_window_ms: float = 2.0,
+        max_batch: int = 500,
+        **kwargs: Any
+    ):
+        """
+        Initialize Utility Operations
+
+        Args:
+            batch_window_ms: How long exists() waits to batch concurrent lookups
+            max_batch: Number of pending ids that triggers an immediate batch
+            *args, **kwargs: Passed to OdooOperationsService
+        """
+        super().__init__(*args, **kwargs)
+        self.batch_window_ms = batch_window_ms
+        self.max_batch = max_batch
+
     async def exists(
         self,
         model: str,
@@ -35,6 +60,11 @@ class UtilityOperations(OdooOperationsService):
         Returns IDs of records that actually exist in the database.
         Useful for validating references before operations.
 
+        Ids returned by a recent read, search_read or web_read are treated as
+        existing without an RPC. Concurrent calls for the same model fired
+        within batch_window_ms are answered by a single exists RPC over the
+        union of their remaining ids.
+
         Args:
             model: Model name
             ids: List of record IDs to check
@@ -55,18 +85,54 @@ class UtilityOperations(OdooOperationsService):
             >>> invalid_ids = set(ids) - set(existing_ids)
             >>> print(f"Invalid IDs: {invalid_ids}")
         """
-        kwargs: Dict[str, Any] = {}
-        if context:
-            kwargs["context"] = context
-
         if not ids:
             return []
 
         logger.debug(
-            f"exists check for {model}",
+            "exists check for {}",
+            model,
             extra={"model": model, "ids": ids}
         )
 
+        scope = self._cache_scope
+        known = {i for i in ids if (scope, model, i) in known_ids_cache}
+        unknown = [i for i in ids if i not in known]
+
+        found = set()
+        if unknown:
+            found = set(await exists_batcher.submit(
+                (scope, model, fingerprint([context or {}, self.base_context])),
+                unknown,
+                lambda batch_ids: self._fetch_existing(model, batch_ids, context),
+                window_ms=self.batch_window_ms,
+                max_batch=self.max_batch
+            ))
+
+        existing = [i for i in ids if i in known or i in found]
+
+        logger.debug(
+            "exists: {}/{} records exist in {}",
+            len(existing),
+            len(ids),
+            model,
+            extra={
+                "model": model,
+                "requested": len(ids),
+                "existing": len(existing)
+            }
+        )
+
+        return existing
+
+    async def _fetch_existing(
+        self,
+        model: str,
+        ids: List[int],
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[int]:
+        """Run the exists RPC for a batch of ids"""
+        kwargs = {"context": context} if context else EMPTY_DICT
+
         result = await self._execute_kw(
             model=model,
             method="exists",
@@ -76,22 +142,44 @@ class UtilityOperations(OdooOperationsService):
 
         # exists() returns recordset, we need to extract IDs
         if isinstance(result, list):
-            existing = result
+            return result
         elif hasattr(result, 'ids'):
-            existing = result.ids
-        else:
-            existing = []
+            return result.ids
+        return []
 
-        logger.debug(
-            f"exists: {len(existing)}/{len(ids)} records exist in {model}",
-            extra={
-                "model": model,
-                "requested": len(ids),
-                "existing": len(existing)
-            }
+    def invalidate(self, model: Optional[str] = None) -> int:
+        """
+        Drop known record ids and external ids cached for this Odoo instance
+
+        Reverse (xmlid -> record) entries are dropped for every model, since
+        their keys don't carry the model.
+
+        Args:
+            model: Only drop entries for this model (None for all models)
+
+        Returns:
+            int: Number of cache entries removed
+        """
+        scope = self._cache_scope
+        removed = known_ids_cache.invalidate(
+            lambda key: key[0] == scope and (model is None or key[1] == model)
+        )
+        return removed + xmlid_cache.invalidate(
+            lambda key: key[0] == scope and (model is None or key[1] in (model, "ir.model.data"))
         )
 
-        return existing
+    def set_cache_size(self, maxsize: int) -> None:
+        """
+        Resize the known-ids and external id caches
+
+        The caches are shared by all services of the process, so this
+        affects every Odoo instance served.
+
+        Args:
+            maxsize: Maximum number of entries per cache
+        """
+        known_ids_cache.resize(maxsize)
+        xmlid_cache.resize(maxsize)
 
     async def exists_single(
         self,
@@ -102,7 +190,9 @@ class UtilityOperations(OdooOperationsService):
         """
         Check if a single record exists
 
-        Convenience method for checking single record existence.
+        Convenience method for checking single record existence. Goes
+        through the exists() batcher, so many concurrent single checks on
+        the same model cost one RPC.
 
         Args:
             model: Model name
@@ -143,16 +233,20 @@ class UtilityOperations(OdooOperationsService):
     async def validate_references(
         self,
         references: List[Dict[str, Any]],
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        fail_fast: bool = False
     ) -> Dict[str, Any]:
         """
         Validate multiple model references
 
         Batch validate references across different models.
+        The existence checks for all references run concurrently.
 
         Args:
             references: List of dicts with 'model' and 'ids' keys
             context: Additional context
+            fail_fast: Stop at the first reference with missing ids and
+                cancel the checks that have not finished yet
 
         Returns:
             Dict with validation results
@@ -171,24 +265,40 @@ class UtilityOperations(OdooOperationsService):
             'invalid': []
         }
 
-        for ref in references:
-            model = ref['model']
-            ids = ref['ids']
-
-            existing = await self.exists(model, ids, context)
-            missing = list(set(ids) - set(existing))
+        checks = [
+            asyncio.ensure_future(self.exists(ref['model'], ref['ids'], context))
+            for ref in references
+        ]
 
-            result_item = {
-                'model': model,
-                'requested': ids,
-                'existing': existing,
-                'missing': missing
-            }
+        try:
+            for ref, check in zip(references, checks, strict=True):
+                ids = ref['ids']
+                existing = await check
+
+                # exists() returns a subset of ids, so equal lengths mean
+                # nothing is missing
+                if len(existing) == len(ids):
+                    missing = []
+                else:
+                    existing_set = set(existing)
+                    missing = [i for i in ids if i not in existing_set]
+
+                result_item = {
+                    'model': ref['model'],
+                    'requested': ids,
+                    'existing': existing,
+                    'missing': missing
+                }
 
-            if missing:
-                results['invalid'].append(result_item)
-            else:
-                results['valid'].append(result_item)
+                if missing:
+                    results['invalid'].append(result_item)
+                    if fail_fast:
+                        break
+                else:
+                    results['valid'].append(result_item)
+        finally:
+            for check in checks:
+                check.cancel()
 
         return results
 
@@ -211,14 +321,12 @@ class UtilityOperations(OdooOperationsService):
         Returns:
             int: Number of records
         """
-        kwargs: Dict[str, Any] = {}
-        if context:
-            kwargs["context"] = context
+        kwargs = {"context": context} if context else EMPTY_DICT
 
         result = await self._execute_kw(
             model=model,
             method="search_count",
-            args=[domain or []],
+            args=[domain or EMPTY_LIST],
             kwargs=kwargs
         )
 
@@ -245,31 +353,184 @@ class UtilityOperations(OdooOperationsService):
             >>> xmlid = await service.get_xmlid('res.country', 1)
             >>> print(xmlid)  # 'base.us'
         """
-        kwargs: Dict[str, Any] = {}
-        if context:
-            kwargs["context"] = context
-
         try:
-            result = await self._execute_kw(
-                model="ir.model.data",
-                method="search_read",
-                args=[[
-                    ['model', '=', model],
-                    ['res_id', '=', record_id]
-                ]],
-                kwargs={
-                    "fields": ['module', 'name'],
-                    "limit": 1,
-                    **kwargs
-                }
-            )
-
-            if result:
-                module = result[0]['module']
-                name = result[0]['name']
-                return f"{module}.{name}"
-            return None
+            xmlids = await self.get_xmlids(model, [record_id], context)
+            return xmlids.get(record_id)
 
         except Exception as e:
             logger.error(f"Failed to get xmlid: {e}")
             return None
+
+    async def get_xmlids(
+        self,
+        model: str,
+        ids: List[int],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[int, Optional[str]]:
+        """
+        Get XML IDs (External IDs) for several records
+
+        External ids are cached in memory and, when ODOO_METADATA_CACHE_DIR
+        is set, on disk. Remaining ids are fetched with one ir.model.data
+        search_read, shared with concurrent calls for the same model.
+
+        Args:
+            model: Model name
+            ids: Record IDs
+            context: Additional context
+
+        Returns:
+            Dict[int, Optional[str]]: Mapping of id to external ID (None if
+            the record has none)
+
+        Example:
+            >>> xmlids = await service.get_xmlids('res.country', [1, 2])
+            >>> print(xmlids)  # {1: 'base.us', 2: 'base.ca'}
+        """
+        if not ids:
+            return {}
+
+        scope = self._cache_scope
+        xmlids: Dict[int, Optional[str]] = {}
+        missing = []
+        for record_id in dict.fromkeys(ids):
+            key = (scope, model, record_id)
+            if key in xmlid_cache:
+                xmlids[record_id] = xmlid_cache.get(key)
+            else:
+                missing.append(record_id)
+
+        if missing and metadata_disk_cache is not None:
+            stored = await metadata_disk_cache.aget_many(
+                [disk_key(None, (scope, model, record_id)) for record_id in missing]
+            )
+            still_missing = []
+            for record_id in missing:
+                xmlid = stored.get(disk_key(None, (scope, model, record_id)))
+                if xmlid is None:
+                    still_missing.append(record_id)
+                    continue
+                self._cache_xmlid(model, record_id, xmlid)
+                xmlids[record_id] = xmlid
+            missing = still_missing
+
+        if missing:
+            found = await xmlid_batcher.submit(
+                (scope, model, fingerprint([context or {}, self.base_context])),
+                missing,
+                lambda batch_ids: self._fetch_xmlids(model, batch_ids, context),
+                window_ms=self.batch_window_ms,
+                max_batch=self.max_batch
+            )
+
+            for record_id in missing:
+                xmlid = found.get(record_id)
+                self._cache_xmlid(model, record_id, xmlid)
+                xmlids[record_id] = xmlid
+
+            # Only positive results are persisted; records may gain an
+            # external id later (e.g. on export)
+            if metadata_disk_cache is not None and found:
+                await metadata_disk_cache.aset_many(scope, "ir.model.data", {
+                    disk_key(None, key): value
+                    for record_id, xmlid in found.items()
+                    for key, value in zip(
+                        xmlid_keys(scope, model, record_id, xmlid),
+                        (xmlid, [model, record_id]),
+                        strict=True,
+                    )
+                })
+
+        return xmlids
+
+    async def resolve_xmlid(
+        self,
+        xmlid: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Resolve an XML ID (External ID) to its model and record ID
+
+        Uses the same cache as get_xmlids().
+
+        Args:
+            xmlid: External ID in 'module.name' form
+            context: Additional context
+
+        Returns:
+            Tuple[str, int] or None: (model, res_id) if the external ID exists
+
+        Raises:
+            ValueError: If xmlid is not of the form 'module.name'
+
+        Example:
+            >>> await service.resolve_xmlid('base.us')
+            ('res.country', 233)
+        """
+        module, _, name = xmlid.partition(".")
+        if not module or not name:
+            raise ValueError(f"Invalid external id: {xmlid!r}")
+
+        scope = self._cache_scope
+        key = (scope, "ir.model.data", xmlid)
+        target = xmlid_cache.get(key)
+        if target is None and metadata_disk_cache is not None:
+            target = await metadata_disk_cache.aget(disk_key(None, key))
+        if target is not None:
+            model, res_id = target
+            self._cache_xmlid(model, res_id, xmlid)
+            return model, res_id
+
+        kwargs = {"context": context} if context else EMPTY_DICT
+
+        result = await self._execute_kw(
+            model="ir.model.data",
+            method="search_read",
+            args=[[['module', '=', module], ['name', '=', name]]],
+            kwargs={"fields": ['model', 'res_id'], "limit": 1, **kwargs}
+        )
+        if not result:
+            return None
+
+        model, res_id = result[0]['model'], result[0]['res_id']
+        self._cache_xmlid(model, res_id, xmlid)
+        if metadata_disk_cache is not None:
+            await metadata_disk_cache.aset_many(scope, "ir.model.data", {
+                disk_key(None, (scope, model, res_id)): xmlid,
+                disk_key(None, key): [model, res_id]
+            })
+        return model, res_id
+
+    def _cache_xmlid(self, model: str, record_id: int, xmlid: Optional[str]) -> None:
+        """Store an external id in memory in both directions"""
+        keys = xmlid_keys(self._cache_scope, model, record_id, xmlid)
+        xmlid_cache.set(keys[0], xmlid)
+        if xmlid:
+            xmlid_cache.set(keys[1], (model, record_id))
+
+    async def _fetch_xmlids(
+        self,
+        model: str,
+        ids: List[int],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[int, str]:
+        """Fetch external ids for a batch of records"""
+        kwargs = {"context": context} if context else EMPTY_DICT
+
+        result = await self._execute_kw(
+            model="ir.model.data",
+            method="search_read",
+            args=[[
+                ['model', '=', model],
+                ['res_id', 'in', ids]
+            ]],
+            kwargs={
+                "fields": ['module', 'name', 'res_id'],
+                **kwargs
+            }
+        )
+
+        xmlids: Dict[int, str] = {}
+        for row in result or []:
+            xmlids.setdefault(row['res_id'], f"{row['module']}.{row['name']}")
+        return xmlids
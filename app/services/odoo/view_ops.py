@@ -7,11 +7,16 @@ This module provides view and field metadata operations:
 - get_view: Get view definition (Odoo 16+)
 - load_views: Load multiple views (legacy)
 - get_views: Load multiple views (Odoo 16+)
+- get_view_compat: get_view or fields_view_get depending on the server
 """
-from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Union
 from loguru import logger
 
-from .base import OdooOperationsService
+from .base import EMPTY_DICT, EMPTY_LIST, OdooOperationsService
+from .cache import TTLCache, fields_cache, fingerprint, metadata_flight, view_cache
+from .disk_cache import disk_key, metadata_disk_cache
 
 
 class ViewOperations(OdooOperationsService):
@@ -37,7 +42,8 @@ class ViewOperations(OdooOperationsService):
         model: str,
         fields: Optional[List[str]] = None,
         attributes: Optional[List[str]] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Dict[str, Any]]:
         """
         Get field definitions for a model
@@ -45,6 +51,9 @@ class ViewOperations(OdooOperationsService):
         Returns metadata about fields including type, label, selection values,
         relation info, and more.
 
+        Results are cached for an hour per (model, fields, attributes, context);
+        each caller gets its own copy and may modify it.
+
         Args:
             model: Model name
             fields: List of field names (None for all fields)
@@ -52,6 +61,7 @@ class ViewOperations(OdooOperationsService):
                 Common: 'string', 'type', 'required', 'readonly',
                         'selection', 'relation', 'domain', 'help'
             context: Additional context
+            use_cache: Whether to serve and store the result in the metadata cache
 
         Returns:
             Dict[str, Dict]: Field name -> field attributes
@@ -70,6 +80,31 @@ class ViewOperations(OdooOperationsService):
             >>> #     'category_id': {'string': 'Tags', 'type': 'many2many', 'relation': 'res.partner.category'}
             >>> # }
         """
+        fields_info = await self._fields_get(model, fields, attributes, context, use_cache)
+        return copy.deepcopy(fields_info) if use_cache else fields_info
+
+    async def _fields_get(
+        self,
+        model: str,
+        fields: Optional[List[str]] = None,
+        attributes: Optional[List[str]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        fields_get returning the cached result itself
+
+        The result is shared between requests; callers must not modify it.
+        """
+        # Cache hits (every field lookup after the first for a model) return
+        # before any request arguments or closures are built
+        cache_key = None
+        if use_cache:
+            cache_key = self._fields_cache_key(model, fields, attributes, context)
+            cached = fields_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         kwargs: Dict[str, Any] = {}
         if fields:
             kwargs["allfields"] = fields
@@ -78,26 +113,217 @@ class ViewOperations(OdooOperationsService):
         if context:
             kwargs["context"] = context
 
-        logger.debug(
-            f"fields_get for {model}",
-            extra={
-                "model": model,
-                "fields": fields,
-                "attributes": attributes
-            }
+        async def fetch() -> Dict[str, Dict[str, Any]]:
+            logger.debug(
+                "fields_get for {}",
+                model,
+                extra={
+                    "model": model,
+                    "fields": fields,
+                    "attributes": attributes
+                }
+            )
+
+            result = await self._execute_kw(
+                model=model,
+                method="fields_get",
+                args=[],
+                kwargs=kwargs
+            )
+
+            fields_info = result if isinstance(result, dict) else {}
+
+            logger.debug("fields_get returned {} fields for {}", len(fields_info), model)
+            return fields_info
+
+        if cache_key is None:
+            return await fetch()
+
+        return await self._load_metadata(fields_cache, cache_key, model, fetch)
+
+    def _fields_cache_key(
+        self,
+        model: str,
+        fields: Optional[List[str]],
+        attributes: Optional[List[str]],
+        context: Optional[Dict[str, Any]]
+    ) -> Tuple:
+        """Key of a fields_get result in the metadata cache"""
+        return (
+            self._cache_scope,
+            model,
+            "fields_get",
+            tuple(sorted(fields)) if fields else (),
+            tuple(sorted(attributes)) if attributes else (),
+            fingerprint([context or EMPTY_DICT, self.base_context])
+        )
+
+    async def fields_get_many(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Run several fields_get calls at once
+
+        Args:
+            requests: fields_get keyword arguments, one dict per model
+
+        Returns:
+            List of fields_get results, in request order
+
+        Example:
+            >>> partner_fields, order_fields = await service.fields_get_many([
+            ...     {'model': 'res.partner', 'attributes': ['string', 'type']},
+            ...     {'model': 'sale.order', 'attributes': ['string', 'type']},
+            ... ])
+        """
+        return list(await asyncio.gather(
+            *(self.fields_get(**request) for request in requests)
+        ))
+
+    async def _load_metadata(
+        self,
+        memory_cache: TTLCache,
+        cache_key: Hashable,
+        model: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Load metadata missing from the memory cache from disk or Odoo
+
+        Callers check memory_cache first. Lookups then go to disk (when
+        ODOO_METADATA_CACHE_DIR is set) and finally to the RPC, and results
+        are written through to both caches. Concurrent misses for the same
+        key share one fetch.
+        """
+        async def load() -> Dict[str, Any]:
+            stored_key = None
+            if metadata_disk_cache is not None:
+                # The disk key includes the server version, which is known
+                # once authenticated
+                await self._ensure_authenticated()
+                stored_key = disk_key(self.server_version, cache_key)
+                stored = await metadata_disk_cache.aget(stored_key)
+                if stored is not None:
+                    memory_cache.set(cache_key, stored)
+                    return stored
+
+            value = await fetch()
+            memory_cache.set(cache_key, value)
+
+            if stored_key is not None:
+                await metadata_disk_cache.aset(self._cache_scope, model, stored_key, value)
+
+            return value
+
+        return await metadata_flight.run(cache_key, load)
+
+    async def invalidate_fields(self, model: Optional[str] = None) -> int:
+        """
+        Drop cached fields_get results for this Odoo instance
+
+        Call after changes that alter a model's fields (module install or
+        upgrade, custom field creation). Persisted metadata for the model
+        (fields and views) is dropped as well.
+
+        Args:
+            model: Only drop entries for this model (None for all models)
+
+        Returns:
+            int: Number of cache entries removed
+        """
+        scope = self._cache_scope
+        if metadata_disk_cache is not None:
+            await metadata_disk_cache.ainvalidate(scope, model)
+        return fields_cache.invalidate(
+            lambda key: key[0] == scope and (model is None or key[1] == model)
         )
 
-        result = await self._execute_kw(
-            model=model,
-            method="fields_get",
-            args=[],
-            kwargs=kwargs
+    async def _execute_view_call(
+        self,
+        model: str,
+        method: str,
+        kwargs: Dict[str, Any],
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Execute a view loading method through the shared view cache
+
+        The raw server response is cached per instance, model, method and
+        arguments (including context and lang) for ten minutes, mirroring
+        Odoo's own server-side view cache. Concurrent cache misses for the
+        same key share one RPC. Writes to ir.ui.view through any service
+        drop the cached views for that instance. Cached responses are
+        returned as copies, so callers may modify them.
+        """
+        cache_key = None
+        if use_cache:
+            cache_key = (
+                self._cache_scope,
+                model,
+                method,
+                fingerprint([kwargs, self.base_context])
+            )
+            cached = view_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("{} cache hit for {}", method, model)
+                return copy.deepcopy(cached)
+
+        async def fetch() -> Dict[str, Any]:
+            result = await self._execute_kw(
+                model=model,
+                method=method,
+                args=[],
+                kwargs=kwargs
+            )
+            return result if isinstance(result, dict) else {}
+
+        if cache_key is None:
+            return await fetch()
+
+        return copy.deepcopy(await self._load_metadata(view_cache, cache_key, model, fetch))
+
+    async def invalidate_views(self, model: Optional[str] = None) -> int:
+        """
+        Drop cached view definitions for this Odoo instance
+
+        Args:
+            model: Only drop entries for this model (None for all models)
+
+        Returns:
+            int: Number of cache entries removed
+        """
+        scope = self._cache_scope
+        if metadata_disk_cache is not None:
+            await metadata_disk_cache.ainvalidate(scope, model)
+        return view_cache.invalidate(
+            lambda key: key[0] == scope and (model is None or key[1] == model)
         )
 
-        fields_info = result if isinstance(result, dict) else {}
+    async def invalidate(self, model: Optional[str] = None) -> int:
+        """
+        Drop cached fields and view definitions for this Odoo instance
+
+        Args:
+            model: Only drop entries for this model (None for all models)
+
+        Returns:
+            int: Number of cache entries removed
+        """
+        return await self.invalidate_fields(model) + await self.invalidate_views(model)
+
+    def set_cache_size(self, maxsize: int) -> None:
+        """
+        Resize the fields and view caches
 
-        logger.debug(f"fields_get returned {len(fields_info)} fields for {model}")
-        return fields_info
+        The caches are shared by all services of the process, so this
+        affects every Odoo instance served.
+
+        Args:
+            maxsize: Maximum number of entries per cache
+        """
+        fields_cache.resize(maxsize)
+        view_cache.resize(maxsize)
 
     async def fields_view_get(
         self,
@@ -105,7 +331,8 @@ class ViewOperations(OdooOperationsService):
         view_id: Optional[int] = None,
         view_type: str = "form",
         toolbar: bool = False,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Get view definition (legacy method for Odoo <= 15)
@@ -118,6 +345,7 @@ class ViewOperations(OdooOperationsService):
             view_type: View type ('form', 'tree', 'kanban', 'search', etc.)
             toolbar: Include toolbar actions
             context: Additional context
+            use_cache: Whether to serve and store the result in the view cache
 
         Returns:
             Dict containing:
@@ -146,7 +374,8 @@ class ViewOperations(OdooOperationsService):
             kwargs["context"] = context
 
         logger.debug(
-            f"fields_view_get for {model}",
+            "fields_view_get for {}",
+            model,
             extra={
                 "model": model,
                 "view_id": view_id,
@@ -154,14 +383,7 @@ class ViewOperations(OdooOperationsService):
             }
         )
 
-        result = await self._execute_kw(
-            model=model,
-            method="fields_view_get",
-            args=[],
-            kwargs=kwargs
-        )
-
-        return result if isinstance(result, dict) else {}
+        return await self._execute_view_call(model, "fields_view_get", kwargs, use_cache)
 
     async def get_view(
         self,
@@ -169,7 +391,8 @@ class ViewOperations(OdooOperationsService):
         view_id: Optional[int] = None,
         view_type: str = "form",
         options: Optional[Dict[str, Any]] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Get view definition (Odoo 16+ method)
@@ -182,6 +405,7 @@ class ViewOperations(OdooOperationsService):
             view_type: View type ('form', 'list', 'kanban', 'search', etc.)
             options: View options (toolbar, load_filters, etc.)
             context: Additional context
+            use_cache: Whether to serve and store the result in the view cache
 
         Returns:
             Dict containing view definition
@@ -196,13 +420,14 @@ class ViewOperations(OdooOperationsService):
         kwargs: Dict[str, Any] = {
             "view_id": view_id or False,
             "view_type": view_type,
-            "options": options or {}
+            "options": options or EMPTY_DICT
         }
         if context:
             kwargs["context"] = context
 
         logger.debug(
-            f"get_view for {model}",
+            "get_view for {}",
+            model,
             extra={
                 "model": model,
                 "view_id": view_id,
@@ -210,21 +435,59 @@ class ViewOperations(OdooOperationsService):
             }
         )
 
-        result = await self._execute_kw(
-            model=model,
-            method="get_view",
-            args=[],
-            kwargs=kwargs
-        )
+        return await self._execute_view_call(model, "get_view", kwargs, use_cache)
+
+    async def get_view_compat(
+        self,
+        model: str,
+        view_id: Optional[int] = None,
+        view_type: str = "form",
+        options: Optional[Dict[str, Any]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get view definition on any Odoo version
+
+        Uses get_view on Odoo 16+ and fields_view_get on older servers,
+        based on the server version reported at authentication.
 
-        return result if isinstance(result, dict) else {}
+        Args:
+            model: Model name
+            view_id: Specific view ID (None for default)
+            view_type: View type (form, tree/list, kanban, search, etc.)
+            options: View options; only 'toolbar' is used on legacy servers
+            context: Additional context
+            use_cache: Serve repeated requests from the view cache
+
+        Returns:
+            Dict with view definition
+
+        Example:
+            >>> view = await service.get_view_compat('res.partner', view_type='form')
+        """
+        await self._ensure_authenticated()
+
+        major = self.server_major_version
+        if major is None or major >= 16:
+            return await self.get_view(model, view_id, view_type, options, context, use_cache)
+
+        return await self.fields_view_get(
+            model,
+            view_id,
+            view_type,
+            toolbar=bool((options or EMPTY_DICT).get("toolbar")),
+            context=context,
+            use_cache=use_cache
+        )
 
     async def load_views(
         self,
         model: str,
         views: List[Tuple[Union[int, bool], str]],
         options: Optional[Dict[str, Any]] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Load multiple views at once (legacy method)
@@ -237,6 +500,7 @@ class ViewOperations(OdooOperationsService):
                 Example: [(False, 'form'), (False, 'list'), (False, 'search')]
             options: Load options (toolbar, load_filters, etc.)
             context: Additional context
+            use_cache: Whether to serve and store the result in the view cache
 
         Returns:
             Dict containing views indexed by view_type
@@ -252,34 +516,29 @@ class ViewOperations(OdooOperationsService):
         """
         kwargs: Dict[str, Any] = {
             "views": views,
-            "options": options or {}
+            "options": options or EMPTY_DICT
         }
         if context:
             kwargs["context"] = context
 
         logger.debug(
-            f"load_views for {model}",
+            "load_views for {}",
+            model,
             extra={
                 "model": model,
                 "views": views
             }
         )
 
-        result = await self._execute_kw(
-            model=model,
-            method="load_views",
-            args=[],
-            kwargs=kwargs
-        )
-
-        return result if isinstance(result, dict) else {}
+        return await self._execute_view_call(model, "load_views", kwargs, use_cache)
 
     async def get_views(
         self,
         model: str,
         views: List[Tuple[Union[int, bool], str]],
         options: Optional[Dict[str, Any]] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Load multiple views at once (Odoo 16+ method)
@@ -291,6 +550,7 @@ class ViewOperations(OdooOperationsService):
             views: List of (view_id, view_type) tuples
             options: Load options
             context: Additional context
+            use_cache: Whether to serve and store the result in the view cache
 
         Returns:
             Dict containing views
@@ -304,27 +564,21 @@ class ViewOperations(OdooOperationsService):
         """
         kwargs: Dict[str, Any] = {
             "views": views,
-            "options": options or {}
+            "options": options or EMPTY_DICT
         }
         if context:
             kwargs["context"] = context
 
         logger.debug(
-            f"get_views for {model}",
+            "get_views for {}",
+            model,
             extra={
                 "model": model,
                 "views": views
             }
         )
 
-        result = await self._execute_kw(
-            model=model,
-            method="get_views",
-            args=[],
-            kwargs=kwargs
-        )
-
-        return result if isinstance(result, dict) else {}
+        return await self._execute_view_call(model, "get_views", kwargs, use_cache)
 
     async def get_field_info(
         self,
@@ -335,7 +589,11 @@ class ViewOperations(OdooOperationsService):
         """
         Get detailed information about a single field
 
-        Convenience method for getting info about one field.
+        Convenience method for getting info about one field. When the
+        definitions of all fields of the model are already cached (see
+        prefetch_models()), the field is looked up there; otherwise only
+        this field is requested and cached. Call prefetch_models() first
+        when many fields of a model will be looked up.
 
         Args:
             model: Model name
@@ -350,19 +608,25 @@ class ViewOperations(OdooOperationsService):
             >>> print(f"Type: {info['type']}")
             >>> print(f"Relation: {info.get('relation')}")
         """
-        fields = await self.fields_get(model, [field_name], context=context)
-        return fields.get(field_name, {})
+        fields = fields_cache.get(self._fields_cache_key(model, None, None, context))
+        if fields is None:
+            fields = await self._fields_get(model, [field_name], context=context)
+
+        field_info = fields.get(field_name)
+        return copy.deepcopy(field_info) if field_info else {}
 
     async def get_selection_values(
         self,
         model: str,
         field_name: str,
         context: Optional[Dict[str, Any]] = None
-    ) -> List[Tuple[str, str]]:
+    ) -> List[Sequence[str]]:
         """
         Get selection field options
 
-        Convenience method for getting selection field values.
+        Convenience method for getting selection field values. Like
+        get_field_info(), uses the cached definitions of the whole model when
+        present and otherwise requests only this field's selection.
 
         Args:
             model: Model name
@@ -370,23 +634,44 @@ class ViewOperations(OdooOperationsService):
             context: Additional context
 
         Returns:
-            List of (value, label) tuples
+            List of [value, label] pairs, as returned by Odoo
 
         Example:
             >>> states = await service.get_selection_values(
             ...     'sale.order',
             ...     'state'
             ... )
-            >>> # Returns: [('draft', 'Quotation'), ('sent', 'Quotation Sent'), ...]
+            >>> # Returns: [['draft', 'Quotation'], ['sent', 'Quotation Sent'], ...]
         """
-        fields = await self.fields_get(
-            model,
-            [field_name],
-            attributes=['selection'],
-            context=context
-        )
+        fields = fields_cache.get(self._fields_cache_key(model, None, None, context))
+        if fields is None:
+            fields = await self._fields_get(
+                model,
+                [field_name],
+                attributes=['selection'],
+                context=context
+            )
+
+        field_info = fields.get(field_name, EMPTY_DICT)
+        return [list(option) for option in field_info.get('selection') or EMPTY_LIST]
+
+    async def prefetch_models(
+        self,
+        models: List[str],
+        context: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Warm the field definitions cache for several models
 
-        field_info = fields.get(field_name, {})
-        selection = field_info.get('selection', [])
+        Call at session start for the models a client is about to display;
+        later get_field_info() / get_selection_values() calls are then
+        answered from cache.
 
-        return [(s[0], s[1]) for s in selection] if selection else []
+        Args:
+            models: Model names
+            context: Additional context
+
+        Example:
+            >>> await service.prefetch_models(['res.partner', 'sale.order'])
+        """
+        await asyncio.gather(*(self._fields_get(model, context=context) for model in models))
@@ -5,11 +5,16 @@ This module provides web-optimized operations:
 - web_save: Save with specification (optimized for UI)
 - web_read: Read with specification
 - web_search_read: Search and read with specification
+- web_read_many / web_search_read_many: Several reads in one call
+- iter_web_search_read: Iterate over all matching records
 """
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
 from loguru import logger
 
-from .base import OdooOperationsService
+from .base import EMPTY_DICT, EMPTY_LIST, OdooOperationsService
 
 
 class WebOperations(OdooOperationsService):
@@ -94,16 +99,15 @@ class WebOperations(OdooOperationsService):
             ...     }
             ... )
         """
-        kwargs: Dict[str, Any] = {}
-        if context:
-            kwargs["context"] = context
+        kwargs = {"context": context} if context else EMPTY_DICT
 
         logger.debug(
-            f"web_save on {model}",
+            "web_save on {}",
+            model,
             extra={
                 "model": model,
                 "ids": ids,
-                "spec_fields": list(specification.keys())
+                "spec_fields": specification.keys()
             }
         )
 
@@ -179,19 +183,18 @@ class WebOperations(OdooOperationsService):
             ...     }
             ... )
         """
-        kwargs: Dict[str, Any] = {}
-        if context:
-            kwargs["context"] = context
+        kwargs = {"context": context} if context else EMPTY_DICT
 
         if not ids:
             return []
 
         logger.debug(
-            f"web_read on {model}",
+            "web_read on {}",
+            model,
             extra={
                 "model": model,
                 "ids": ids,
-                "spec_fields": list(specification.keys())
+                "spec_fields": specification.keys()
             }
         )
 
@@ -256,8 +259,8 @@ class WebOperations(OdooOperationsService):
             ...     print(f"{order['name']}: {order['amount_total']}")
         """
         kwargs: Dict[str, Any] = {
-            "domain": domain or [],
-            "specification": specification or {}
+            "domain": domain or EMPTY_LIST,
+            "specification": specification or EMPTY_DICT
         }
 
         if limit is not None:
@@ -272,13 +275,14 @@ class WebOperations(OdooOperationsService):
             kwargs["context"] = context
 
         logger.debug(
-            f"web_search_read on {model}",
+            "web_search_read on {}",
+            model,
             extra={
                 "model": model,
                 "domain": domain,
                 "limit": limit,
                 "offset": offset,
-                "spec_fields": list((specification or {}).keys())
+                "spec_fields": specification.keys() if specification else ()
             }
         )
 
@@ -296,6 +300,130 @@ class WebOperations(OdooOperationsService):
         else:
             return {"records": [], "length": 0}
 
+    async def iter_web_search_read(
+        self,
+        model: str,
+        domain: Optional[List] = None,
+        specification: Optional[Dict[str, Any]] = None,
+        page_size: int = 500,
+        order: str = "id ASC",
+        concurrency: int = 8,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over all matching records, fetching pages concurrently
+
+        The first page reports the total length; the remaining pages are
+        then requested up to `concurrency` at a time. Records are yielded in
+        `order`, page by page, so at most `concurrency` pages are buffered.
+
+        Args:
+            model: Model name
+            domain: Search domain
+            specification: Fields specification
+            page_size: Number of records per RPC
+            order: Sort order; should be stable so pages don't overlap
+            concurrency: Maximum number of pages fetched at the same time
+            context: Additional context
+
+        Yields:
+            Dict[str, Any]: Records with nested data
+
+        Example:
+            >>> async for order in service.iter_web_search_read(
+            ...     'sale.order',
+            ...     domain=[['state', '=', 'sale']],
+            ...     specification={'name': {}, 'amount_total': {}}
+            ... ):
+            ...     process(order)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be >= 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+
+        def fetch(offset: int) -> "asyncio.Task[Dict[str, Any]]":
+            return asyncio.ensure_future(self.web_search_read(
+                model=model,
+                domain=domain,
+                specification=specification,
+                limit=page_size,
+                offset=offset,
+                order=order,
+                context=context
+            ))
+
+        first = await fetch(0)
+        for record in first["records"]:
+            yield record
+
+        offsets = iter(range(page_size, first.get("length", 0), page_size))
+        pending: Deque["asyncio.Task[Dict[str, Any]]"] = deque(
+            fetch(offset) for _, offset in zip(range(concurrency), offsets, strict=False)
+        )
+        try:
+            while pending:
+                page = await pending.popleft()
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(fetch(next_offset))
+                for record in page["records"]:
+                    yield record
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def web_read_many(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several web_read calls at once
+
+        Useful for screens composed of several widgets reading different
+        models. The reads are dispatched concurrently, so the total time is
+        roughly that of the slowest read instead of their sum.
+
+        Args:
+            requests: web_read keyword arguments, one dict per read
+                (model, ids, specification and optionally context)
+
+        Returns:
+            List of web_read results, in request order
+
+        Example:
+            >>> orders, partners = await service.web_read_many([
+            ...     {'model': 'sale.order', 'ids': [1], 'specification': {'name': {}}},
+            ...     {'model': 'res.partner', 'ids': [7], 'specification': {'email': {}}},
+            ... ])
+        """
+        return list(await asyncio.gather(
+            *(self.web_read(**request) for request in requests)
+        ))
+
+    async def web_search_read_many(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several web_search_read calls at once
+
+        Args:
+            requests: web_search_read keyword arguments, one dict per search
+
+        Returns:
+            List of web_search_read results, in request order
+
+        Example:
+            >>> orders, invoices = await service.web_search_read_many([
+            ...     {'model': 'sale.order', 'specification': {'name': {}}, 'limit': 5},
+            ...     {'model': 'account.move', 'specification': {'name': {}}, 'limit': 5},
+            ... ])
+        """
+        return list(await asyncio.gather(
+            *(self.web_search_read(**request) for request in requests)
+        ))
+
     def build_specification(
         self,
         fields: List[str],
@@ -309,7 +437,8 @@ class WebOperations(OdooOperationsService):
             relations: Dict of relation field -> fields to include
 
         Returns:
-            Specification dict
+            Specification dict. Simple fields share one empty dict, so
+            replace a field's entry instead of mutating it.
 
         Example:
             >>> spec = service.build_specification(
@@ -320,12 +449,13 @@ class WebOperations(OdooOperationsService):
             ...     }
             ... )
         """
+        # A fresh dict per field, so callers can nest into any entry
         spec = {field: {} for field in fields}
 
         if relations:
             for rel_field, rel_fields in relations.items():
                 spec[rel_field] = {
-                    "fields": {f: {} for f in rel_fields}
+                    "fields": {field: {} for field in rel_fields}
                 }
 
         return spec
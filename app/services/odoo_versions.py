@@ -3,6 +3,11 @@ Odoo Version Migration Rules (13.0 -> 19.0)
 
 Comprehensive migration rules for all Odoo versions from 13 to 19
 """
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+from loguru import logger
 
 ODOO_VERSION_RULES = {
     "res.partner": {
@@ -311,34 +316,80 @@ ODOO_VERSION_RULES = {
     }
 }
 
+class Rule(NamedTuple):
+    """Migration rule of one field, built once from ODOO_VERSION_RULES"""
+    rename_to: Optional[str] = None
+    replace_with: Optional[Dict[str, Any]] = None
+    warning: Optional[str] = None
+    removed: bool = False
+    transform: Optional[str] = None
+    value_mapping: Optional[Dict[Any, Any]] = None
+
+
+# (model, from_version, to_version) -> rules, flattened once from ODOO_VERSION_RULES
+_RULES_INDEX: Dict[Tuple[str, str, str], Dict[str, "Rule"]] = {}
+for _model, _paths in ODOO_VERSION_RULES.items():
+    for _path, _rules in _paths.items():
+        _from_version, _to_version = _path.split("_to_")
+        _RULES_INDEX[(_model, _from_version, _to_version)] = {
+            _field: Rule(**_rule) for _field, _rule in _rules.items()
+        }
+
+# Returned when no rules exist for a step; shared, never mutated
+_NO_RULES: Mapping[str, Rule] = MappingProxyType({})
+
+
+def get_rules(model: str, from_version: str, to_version: str) -> Mapping[str, Rule]:
+    """
+    Get migration rules of a model for one version step
+
+    Args:
+        model: Model name (e.g., "res.partner")
+        from_version: Source version (e.g., "13.0")
+        to_version: Target version (e.g., "14.0")
+
+    Returns:
+        Rule per field, or an empty mapping if there are none
+    """
+    return _RULES_INDEX.get((model, from_version, to_version), _NO_RULES)
+
+
 # Version sequence for auto-migration
 ODOO_VERSION_SEQUENCE = [
     "13.0", "14.0", "15.0", "16.0", "17.0", "18.0", "19.0"
 ]
 
-def get_migration_path(from_version: str, to_version: str) -> list:
+# Position of each version in ODOO_VERSION_SEQUENCE
+_VERSION_INDEX = {version: idx for idx, version in enumerate(ODOO_VERSION_SEQUENCE)}
+
+
+@lru_cache(maxsize=64)
+def get_migration_path(from_version: str, to_version: str) -> Tuple[str, ...]:
     """
     Get the migration path between two versions
 
+    Results are memoized, so the returned tuple is shared between callers.
+
     Args:
         from_version: Source version (e.g., "13.0")
         to_version: Target version (e.g., "19.0")
 
     Returns:
-        List of version steps
+        Tuple of version steps (empty if the range is invalid)
 
     Example:
         get_migration_path("13.0", "19.0")
-        # Returns: ["13.0", "14.0", "15.0", "16.0", "17.0", "18.0", "19.0"]
+        # Returns: ("13.0", "14.0", "15.0", "16.0", "17.0", "18.0", "19.0")
     """
-    try:
-        from_idx = ODOO_VERSION_SEQUENCE.index(from_version)
-        to_idx = ODOO_VERSION_SEQUENCE.index(to_version)
+    from_idx = _VERSION_INDEX.get(from_version)
+    to_idx = _VERSION_INDEX.get(to_version)
+
+    if from_idx is None or to_idx is None:
+        logger.error(f"Invalid version in migration path: {from_version} -> {to_version}")
+        return ()
 
-        if from_idx > to_idx:
-            raise ValueError("Downgrade not supported")
+    if from_idx > to_idx:
+        logger.error("Invalid version in migration path: Downgrade not supported")
+        return ()
 
-        return ODOO_VERSION_SEQUENCE[from_idx:to_idx + 1]
-    except ValueError as e:
-        logger.error(f"Invalid version in migration path: {e}")
-        return []
+    return tuple(ODOO_VERSION_SEQUENCE[from_idx:to_idx + 1])
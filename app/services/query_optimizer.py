@@ -3,10 +3,85 @@ Query Optimizer for Odoo Operations
 
 Optimizes Odoo queries to prevent N+1 queries and improve performance
 """
-from typing import List, Dict, Any, Optional
+import hashlib
+import sys
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+import orjson
 from loguru import logger
 
 
+# Cached operations invalidated by any write on a model
+_CACHE_OPS = (
+    'search_read', 'read', 'search', 'search_count',
+    'name_search', 'name_get', 'web_search_read', 'web_read'
+)
+
+
+def _canonical_bytes(params: Dict[str, Any]) -> bytes:
+    """Encode parameters deterministically (sorted keys) for hashing"""
+    return orjson.dumps(
+        params,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+
+
+@lru_cache(maxsize=4096)
+def _hash_bytes(data: bytes) -> str:
+    """Hash canonical parameter bytes (blake2b, 64 bits as hex)"""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _build_cache_key(system_id: str, operation: str, model: str, kwargs: Dict[str, Any]) -> str:
+    """Build the cache key string for a parameter set"""
+    # Create deterministic key from parameters
+    params = {
+        'system_id': system_id,
+        'operation': operation,
+        'model': model,
+        **kwargs
+    }
+
+    # Return formatted key
+    return f"odoo:{system_id}:{operation}:{model}:{_hash_bytes(_canonical_bytes(params))}"
+
+
+# Parameter types generate_cache_key memoizes on. Each value is keyed with
+# its type, since True == 1 == 1.0 would otherwise share one memo entry
+# while their canonical encodings (and so their cache keys) differ
+_MEMO_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+@lru_cache(maxsize=2048)
+def _frozen_cache_key(system_id: str, operation: str, model: str, frozen_kwargs: tuple) -> str:
+    """Memoized generate_cache_key for scalar parameters as (name, type, value) triples"""
+    kwargs = {name: value for name, _, value in frozen_kwargs}
+    return _build_cache_key(system_id, operation, model, kwargs)
+
+
+@lru_cache(maxsize=1024)
+def _invalidation_patterns(system_id: str, model: str) -> Tuple[str, ...]:
+    """Cache key patterns of every cached operation on a model"""
+    return tuple(f"odoo:{system_id}:{op}:{model}:*" for op in _CACHE_OPS)
+
+
+@lru_cache(maxsize=512)
+def _normalize_order(order: str) -> str:
+    """Normalize an order clause once per distinct string"""
+    terms = []
+    seen = set()
+    for term in order.split(','):
+        parts = term.split()
+        if not parts or parts[0] in seen:
+            # A repeated field never affects the sort
+            continue
+        seen.add(parts[0])
+        terms.append(" ".join([parts[0], *(part.upper() for part in parts[1:])]))
+    return ", ".join(terms)
+
+
 class QueryOptimizer:
     """
     Optimize Odoo queries for better performance
@@ -18,34 +93,40 @@ class QueryOptimizer:
     - Related field expansion
     """
 
-    # Common relation fields and their suggested expansions
+    # Common relation fields and their suggested expansions. Dotted names are
+    # not interned by the compiler like identifier literals, so intern them
+    # to share one string object across expansions.
     RELATION_FIELDS = {
-        'partner_id': ['partner_id.name', 'partner_id.email', 'partner_id.phone', 'partner_id.vat'],
-        'user_id': ['user_id.name', 'user_id.email', 'user_id.login'],
-        'company_id': ['company_id.name', 'company_id.currency_id'],
-        'product_id': ['product_id.name', 'product_id.default_code', 'product_id.barcode'],
-        'category_id': ['category_id.name', 'category_id.complete_name'],
-        'product_tmpl_id': ['product_tmpl_id.name', 'product_tmpl_id.default_code'],
-        'warehouse_id': ['warehouse_id.name', 'warehouse_id.code'],
-        'location_id': ['location_id.name', 'location_id.complete_name'],
-        'picking_type_id': ['picking_type_id.name', 'picking_type_id.code'],
-        'currency_id': ['currency_id.name', 'currency_id.symbol'],
-        'pricelist_id': ['pricelist_id.name', 'pricelist_id.currency_id'],
-        'sale_order_id': ['sale_order_id.name', 'sale_order_id.state'],
-        'purchase_order_id': ['purchase_order_id.name', 'purchase_order_id.state'],
-        'invoice_id': ['invoice_id.name', 'invoice_id.state'],
-        'account_id': ['account_id.name', 'account_id.code'],
-        'journal_id': ['journal_id.name', 'journal_id.code'],
-        'tax_id': ['tax_id.name', 'tax_id.amount'],
-        'state_id': ['state_id.name', 'state_id.code'],
-        'country_id': ['country_id.name', 'country_id.code'],
+        sys.intern(field): tuple(map(sys.intern, related))
+        for field, related in {
+            'partner_id': ('partner_id.name', 'partner_id.email', 'partner_id.phone', 'partner_id.vat'),
+            'user_id': ('user_id.name', 'user_id.email', 'user_id.login'),
+            'company_id': ('company_id.name', 'company_id.currency_id'),
+            'product_id': ('product_id.name', 'product_id.default_code', 'product_id.barcode'),
+            'category_id': ('category_id.name', 'category_id.complete_name'),
+            'product_tmpl_id': ('product_tmpl_id.name', 'product_tmpl_id.default_code'),
+            'warehouse_id': ('warehouse_id.name', 'warehouse_id.code'),
+            'location_id': ('location_id.name', 'location_id.complete_name'),
+            'picking_type_id': ('picking_type_id.name', 'picking_type_id.code'),
+            'currency_id': ('currency_id.name', 'currency_id.symbol'),
+            'pricelist_id': ('pricelist_id.name', 'pricelist_id.currency_id'),
+            'sale_order_id': ('sale_order_id.name', 'sale_order_id.state'),
+            'purchase_order_id': ('purchase_order_id.name', 'purchase_order_id.state'),
+            'invoice_id': ('invoice_id.name', 'invoice_id.state'),
+            'account_id': ('account_id.name', 'account_id.code'),
+            'journal_id': ('journal_id.name', 'journal_id.code'),
+            'tax_id': ('tax_id.name', 'tax_id.amount'),
+            'state_id': ('state_id.name', 'state_id.code'),
+            'country_id': ('country_id.name', 'country_id.code'),
+        }.items()
     }
+    _RELATION_KEYS = frozenset(RELATION_FIELDS)
 
     # Indexed fields that should be prioritized in domain
-    INDEXED_FIELDS = [
+    INDEXED_FIELDS = frozenset({
         'id', 'create_date', 'write_date', 'name',
         'active', 'state', 'company_id'
-    ]
+    })
 
     # Maximum limits for different operations
     MAX_LIMITS = {
@@ -58,6 +139,26 @@ class QueryOptimizer:
         'search_count': None,  # No limit
     }
 
+    # Operations whose results can be cached
+    _CACHEABLE_OPS = frozenset({
+        'search_read', 'read', 'search', 'search_count',
+        'fields_get', 'name_search', 'name_get',
+        'web_search_read', 'web_read'
+    })
+
+    # Cache TTL per operation, in seconds
+    _CACHE_TTLS = {
+        'fields_get': 3600,      # 1 hour - field metadata rarely changes
+        'name_search': 600,       # 10 minutes
+        'name_get': 600,          # 10 minutes
+        'search_count': 300,      # 5 minutes
+        'search_read': 300,       # 5 minutes
+        'read': 300,              # 5 minutes
+        'search': 300,            # 5 minutes
+        'web_search_read': 300,   # 5 minutes
+        'web_read': 300,          # 5 minutes
+    }
+
     @staticmethod
     def optimize_fields(
         model: str,
@@ -67,6 +168,9 @@ class QueryOptimizer:
         """
         Optimize fields list by adding related fields to prevent N+1 queries
 
+        The requested fields keep their order and come first; expansions
+        follow without duplicates.
+
         Args:
             model: Odoo model name
             fields: List of fields to read
@@ -86,18 +190,24 @@ class QueryOptimizer:
         if not expand_relations:
             return fields
 
-        optimized_fields = set(fields)
+        # Most reads request no known relation field: return them untouched
+        if QueryOptimizer._RELATION_KEYS.isdisjoint(fields):
+            return fields
+
+        optimized_fields = list(fields)
+        seen = set(fields)
 
         # Add related fields for many2one relations
         for field in fields:
-            if field in QueryOptimizer.RELATION_FIELDS:
-                related_fields = QueryOptimizer.RELATION_FIELDS[field]
-                optimized_fields.update(related_fields)
-                logger.debug(
-                    f"Expanded {field} with related fields: {related_fields}"
-                )
+            related_fields = QueryOptimizer.RELATION_FIELDS.get(field)
+            if related_fields is None:
+                continue
+            added = [f for f in related_fields if f not in seen]
+            seen.update(added)
+            optimized_fields.extend(added)
+            logger.debug("Expanded {} with related fields: {}", field, related_fields)
 
-        return list(optimized_fields)
+        return optimized_fields
 
     @staticmethod
     def optimize_domain(domain: List) -> List:
@@ -105,7 +215,9 @@ class QueryOptimizer:
         Optimize search domain for better performance
 
         Odoo evaluates domains left-to-right, so putting indexed fields first
-        improves query performance.
+        improves query performance. Only pure-AND domains are reordered: '&',
+        '|' and '!' are prefix operators bound to the criteria that follow
+        them, so domains containing them are returned unchanged.
 
         Args:
             domain: Odoo domain (list of tuples/lists)
@@ -114,22 +226,41 @@ class QueryOptimizer:
             Optimized domain
 
         Example:
-            Input: [('name', 'ilike', 'test'), ('id', '>', 100), '|', ('active', '=', True)]
-            Output: [('id', '>', 100), ('active', '=', True), '|', ('name', 'ilike', 'test')]
+            Input: [('name', 'ilike', 'test'), ('email', '!=', False), ('id', '>', 100)]
+            Output: [('name', 'ilike', 'test'), ('id', '>', 100), ('email', '!=', False)]
         """
         if not domain:
             return []
 
+        # Nothing to reorder
+        if len(domain) < 2:
+            return domain
+
+        # Moving criteria around an operator changes what it applies to
+        if any(isinstance(criterion, str) for criterion in domain):
+            return domain
+
+        # Return the domain as-is when indexed criteria already come first
+        seen_other = False
+        for criterion in domain:
+            if (
+                isinstance(criterion, (list, tuple))
+                and len(criterion) >= 3
+                and criterion[0] in QueryOptimizer.INDEXED_FIELDS
+            ):
+                if seen_other:
+                    break
+            else:
+                seen_other = True
+        else:
+            return domain
+
         indexed_criteria = []
         other_criteria = []
-        operators = []
 
         for criterion in domain:
-            # Check if it's an operator ('&', '|', '!')
-            if isinstance(criterion, str):
-                operators.append(criterion)
             # Check if it's a criterion tuple/list
-            elif isinstance(criterion, (list, tuple)) and len(criterion) >= 3:
+            if isinstance(criterion, (list, tuple)) and len(criterion) >= 3:
                 field_name = criterion[0]
                 if field_name in QueryOptimizer.INDEXED_FIELDS:
                     indexed_criteria.append(criterion)
@@ -139,20 +270,12 @@ class QueryOptimizer:
                 # Keep unknown formats as is
                 other_criteria.append(criterion)
 
-        # Reconstruct domain: operators first, then indexed, then others
-        optimized = []
-
-        # Add operators at the beginning (they affect the criteria that follow)
-        optimized.extend(operators)
-
-        # Add indexed criteria first for better performance
-        optimized.extend(indexed_criteria)
-
-        # Add other criteria
-        optimized.extend(other_criteria)
+        # Reconstruct domain: indexed criteria first for better performance,
+        # then the others
+        optimized = indexed_criteria + other_criteria
 
         if optimized != domain:
-            logger.debug(f"Optimized domain from {domain} to {optimized}")
+            logger.debug("Optimized domain from {} to {}", domain, optimized)
 
         return optimized
 
@@ -201,19 +324,24 @@ class QueryOptimizer:
         """
         Optimize order clause for better performance
 
+        Terms are normalized and repeated fields dropped; the sort itself is
+        never changed, so indexed columns are not moved ahead of others.
+
         Args:
             order: Order clause (e.g., "name ASC, id DESC")
             model: Odoo model name
 
         Returns:
             Optimized order clause
+
+        Example:
+            optimize_order("name  asc,id desc, name", ...) -> "name ASC, id DESC"
         """
         if not order:
             # Use default order (id DESC for most cases)
             return "id DESC"
 
-        # Ensure indexed fields are used when possible
-        return order
+        return _normalize_order(order) or "id DESC"
 
     @staticmethod
     def should_cache(operation: str) -> bool:
@@ -226,13 +354,7 @@ class QueryOptimizer:
         Returns:
             True if should cache
         """
-        cacheable_operations = [
-            'search_read', 'read', 'search', 'search_count',
-            'fields_get', 'name_search', 'name_get',
-            'web_search_read', 'web_read'
-        ]
-
-        return operation in cacheable_operations
+        return operation in QueryOptimizer._CACHEABLE_OPS
 
     @staticmethod
     def get_cache_ttl(operation: str) -> int:
@@ -245,19 +367,7 @@ class QueryOptimizer:
         Returns:
             TTL in seconds
         """
-        cache_ttls = {
-            'fields_get': 3600,      # 1 hour - field metadata rarely changes
-            'name_search': 600,       # 10 minutes
-            'name_get': 600,          # 10 minutes
-            'search_count': 300,      # 5 minutes
-            'search_read': 300,       # 5 minutes
-            'read': 300,              # 5 minutes
-            'search': 300,            # 5 minutes
-            'web_search_read': 300,   # 5 minutes
-            'web_read': 300,          # 5 minutes
-        }
-
-        return cache_ttls.get(operation, 300)  # Default 5 minutes
+        return QueryOptimizer._CACHE_TTLS.get(operation, 300)  # Default 5 minutes
 
     @staticmethod
     def generate_cache_key(
@@ -278,32 +388,55 @@ class QueryOptimizer:
         Returns:
             Cache key string
         """
-        import hashlib
-        import json
+        # Hot queries repeat with identical parameters: memoize the whole key
+        # when every value is a scalar, otherwise hash the canonical bytes
+        if all(type(value) in _MEMO_SCALAR_TYPES for value in kwargs.values()):
+            frozen_kwargs = tuple(
+                (name, type(value), value) for name, value in sorted(kwargs.items())
+            )
+            return _frozen_cache_key(system_id, operation, model, frozen_kwargs)
+        return _build_cache_key(system_id, operation, model, kwargs)
+
+    @staticmethod
+    def generate_cache_keys_batch(
+        system_id: str,
+        operation: str,
+        model: str,
+        param_dicts: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Generate cache keys for many parameter sets of one operation
 
-        # Create deterministic key from parameters
-        params = {
+        Keys are identical to generate_cache_key for the same parameters;
+        the prefix and constant parameters are built once for the batch.
+
+        Args:
+            system_id: System identifier
+            operation: Operation name
+            model: Model name
+            param_dicts: Additional parameters of each query
+
+        Returns:
+            Cache key strings, in the order of param_dicts
+        """
+        prefix = f"odoo:{system_id}:{operation}:{model}:"
+        base = {
             'system_id': system_id,
             'operation': operation,
             'model': model,
-            **kwargs
         }
 
-        # Sort for consistency
-        sorted_params = json.dumps(params, sort_keys=True)
-
-        # Create hash
-        hash_value = hashlib.md5(sorted_params.encode()).hexdigest()[:16]
-
-        # Return formatted key
-        return f"odoo:{system_id}:{operation}:{model}:{hash_value}"
+        return [
+            prefix + _hash_bytes(_canonical_bytes({**base, **params}))
+            for params in param_dicts
+        ]
 
     @staticmethod
     def get_invalidation_patterns(
         system_id: str,
         model: str,
         operation: str
-    ) -> List[str]:
+    ) -> Tuple[str, ...]:
         """
         Get cache invalidation patterns for write operations
 
@@ -313,7 +446,7 @@ class QueryOptimizer:
             operation: Operation that was performed (create, write, unlink)
 
         Returns:
-            List of cache key patterns to invalidate
+            Tuple of cache key patterns to invalidate
 
         Example:
             For write on 'product.product':
@@ -321,19 +454,9 @@ class QueryOptimizer:
             - 'odoo:system1:read:product.product:*'
             - 'odoo:system1:search:product.product:*'
         """
-        patterns = []
-
-        # Invalidate all cached queries for this model
-        cache_operations = [
-            'search_read', 'read', 'search', 'search_count',
-            'name_search', 'name_get', 'web_search_read', 'web_read'
-        ]
-
-        for cache_op in cache_operations:
-            pattern = f"odoo:{system_id}:{cache_op}:{model}:*"
-            patterns.append(pattern)
-
-        return patterns
+        # Invalidate all cached queries for this model; patterns only depend
+        # on (system_id, model) and are reused across writes
+        return _invalidation_patterns(system_id, model)
 
 
 # Singleton instance
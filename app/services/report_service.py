@@ -6,22 +6,54 @@ Generate and export reports from external systems
 from typing import Dict, Any, List, Optional
 from loguru import logger
 from datetime import datetime
+import asyncio
+import importlib.util
 import io
 
 
+# Leading rows used to size Excel columns and find datetime columns
+WIDTH_SAMPLE_ROWS = 100
+
+# Records rendered per PDF report call, and concurrent calls per report
+REPORT_CHUNK_SIZE = 50
+REPORT_CHUNK_CONCURRENCY = 4
+
+
+# Adapter class -> whether it exposes call_method, resolved once per class
+_REPORT_SUPPORT: Dict[type, bool] = {}
+
+
+def _supports_reports(adapter: Any) -> bool:
+    """Whether reports can be rendered through the adapter's call_method"""
+    adapter_type = type(adapter)
+    supported = _REPORT_SUPPORT.get(adapter_type)
+    if supported is None:
+        supported = callable(getattr(adapter, 'call_method', None))
+        _REPORT_SUPPORT[adapter_type] = supported
+    return supported
+
+
+def _csv_row(record: Dict[str, Any], headers: tuple) -> List[Any]:
+    """Values of a record in header order, with datetimes formatted"""
+    return [
+        value.strftime("%Y-%m-%d %H:%M:%S") if isinstance(value, datetime) else value
+        for value in (record.get(header, "") for header in headers)
+    ]
+
+
 class ReportService:
     """
     Service for generating and exporting reports
 
     Features:
     - Generate reports from external systems
-    - Export to PDF, Excel, CSV
+    - Export to PDF, Excel, CSV, Parquet
     - Custom report templates
     - Scheduled reports
     """
 
     def __init__(self):
-        self.report_formats = ['pdf', 'xlsx', 'csv', 'json']
+        self.report_formats = ['pdf', 'xlsx', 'csv', 'json', 'parquet']
 
     async def generate_report(
         self,
@@ -58,18 +90,19 @@ class ReportService:
                 raise ValueError(f"Unsupported format: {format}. Allowed: {self.report_formats}")
 
             # For Odoo systems
-            if hasattr(adapter, 'call_method'):
-                # Generate report using Odoo's report system
-                result = await adapter.call_method(
-                    model="ir.actions.report",
-                    method="_render_qweb_pdf",
-                    args=[report_name, record_ids]
-                )
-
-                if isinstance(result, (list, tuple)) and len(result) > 0:
-                    report_content = result[0]
+            if _supports_reports(adapter):
+                # Large reports are rendered in concurrent chunks and merged
+                if (
+                    len(record_ids) > REPORT_CHUNK_SIZE
+                    and importlib.util.find_spec("pypdf") is not None
+                ):
+                    report_content = await self._render_report_chunks(
+                        adapter, report_name, record_ids
+                    )
                 else:
-                    report_content = result
+                    report_content = await self._render_report(
+                        adapter, report_name, record_ids
+                    )
 
                 logger.info(f"Generated report {report_name} for {len(record_ids)} records")
 
@@ -82,6 +115,51 @@ class ReportService:
             logger.error(f"Report generation error: {str(e)}")
             raise
 
+    async def _render_report(
+        self,
+        adapter: Any,
+        report_name: str,
+        record_ids: List[int]
+    ) -> bytes:
+        """Render a PDF report with Odoo's report system in one call"""
+        result = await adapter.call_method(
+            model="ir.actions.report",
+            method="_render_qweb_pdf",
+            args=[report_name, record_ids]
+        )
+
+        if isinstance(result, (list, tuple)) and len(result) > 0:
+            return result[0]
+        return result
+
+    async def _render_report_chunks(
+        self,
+        adapter: Any,
+        report_name: str,
+        record_ids: List[int]
+    ) -> bytes:
+        """Render a PDF report in chunks of REPORT_CHUNK_SIZE records and merge the parts"""
+        from pypdf import PdfWriter
+
+        semaphore = asyncio.Semaphore(REPORT_CHUNK_CONCURRENCY)
+
+        async def render(chunk: List[int]) -> bytes:
+            async with semaphore:
+                return await self._render_report(adapter, report_name, chunk)
+
+        parts = await asyncio.gather(*(
+            render(record_ids[i:i + REPORT_CHUNK_SIZE])
+            for i in range(0, len(record_ids), REPORT_CHUNK_SIZE)
+        ))
+
+        writer = PdfWriter()
+        for part in parts:
+            writer.append(io.BytesIO(part))
+        output = io.BytesIO()
+        writer.write(output)
+
+        return output.getvalue()
+
     async def export_to_excel(
         self,
         data: List[Dict[str, Any]],
@@ -108,49 +186,70 @@ class ReportService:
         """
         try:
             import openpyxl
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, Alignment
-
-            # Create workbook
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Export"
+            from openpyxl.utils import get_column_letter
 
             if not data:
                 return b""
 
-            # Write headers
-            headers = list(data[0].keys())
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num, value=header)
-                cell.font = Font(bold=True)
-                cell.alignment = Alignment(horizontal='center')
-
-            # Write data
-            for row_num, record in enumerate(data, 2):
-                for col_num, header in enumerate(headers, 1):
+            # Write-only workbook: rows are streamed to a temporary file
+            # instead of being kept as cell objects
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Export")
+
+            headers = tuple(data[0].keys())
+
+            # Column widths must be set before the first row is written, so
+            # size columns from the headers and a sample of leading rows. The
+            # same sample tells which columns hold datetimes.
+            widths = [len(str(header)) for header in headers]
+            datetime_columns = set()
+            for record in data[:WIDTH_SAMPLE_ROWS]:
+                for col, header in enumerate(headers):
                     value = record.get(header, "")
-                    # Handle datetime objects
                     if isinstance(value, datetime):
-                        value = value.strftime("%Y-%m-%d %H:%M:%S")
-                    ws.cell(row=row_num, column=col_num, value=value)
-
-            # Auto-size columns
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(cell.value)
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
+                        datetime_columns.add(col)
+                        length = 19
+                    else:
+                        length = len(str(value))
+                    if length > widths[col]:
+                        widths[col] = length
+            for col, width in enumerate(widths, 1):
+                ws.column_dimensions[get_column_letter(col)].width = min(width + 2, 50)
+
+            # Write headers
+            header_font = Font(bold=True)
+            header_alignment = Alignment(horizontal='center')
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = header_font
+                cell.alignment = header_alignment
+                header_row.append(cell)
+            ws.append(header_row)
+
+            # Write data. Sampled rows only need the datetime columns checked;
+            # later rows also check the other columns, since a column's first
+            # datetime may come after the sample
+            other_columns = [col for col in range(len(headers)) if col not in datetime_columns]
+            datetime_columns = sorted(datetime_columns)
+            for index, record in enumerate(data):
+                row = [record.get(header, "") for header in headers]
+                for col in datetime_columns:
+                    value = row[col]
+                    if isinstance(value, datetime):
+                        row[col] = value.strftime("%Y-%m-%d %H:%M:%S")
+                if index >= WIDTH_SAMPLE_ROWS:
+                    for col in other_columns:
+                        value = row[col]
+                        if isinstance(value, datetime):
+                            row[col] = value.strftime("%Y-%m-%d %H:%M:%S")
+                ws.append(row)
 
             # Save to bytes
             output = io.BytesIO()
             wb.save(output)
-            output.seek(0)
 
             logger.info(f"Exported {len(data)} records to Excel")
 
@@ -184,30 +283,79 @@ class ReportService:
             if not data:
                 return b""
 
-            output = io.StringIO()
-            headers = list(data[0].keys())
+            # Encode while writing instead of copying the full text at the end
+            output = io.BytesIO()
+            text = io.TextIOWrapper(output, encoding='utf-8', newline='')
+            headers = tuple(data[0].keys())
 
-            writer = csv.DictWriter(output, fieldnames=headers)
-            writer.writeheader()
+            writer = csv.writer(text)
+            writer.writerow(headers)
 
-            for record in data:
-                # Handle datetime objects
-                formatted_record = {}
-                for key, value in record.items():
-                    if isinstance(value, datetime):
-                        formatted_record[key] = value.strftime("%Y-%m-%d %H:%M:%S")
-                    else:
-                        formatted_record[key] = value
-                writer.writerow(formatted_record)
+            # The row loop runs inside the C csv module
+            writer.writerows(_csv_row(record, headers) for record in data)
+
+            text.flush()
 
             logger.info(f"Exported {len(data)} records to CSV")
 
-            return output.getvalue().encode('utf-8')
+            return output.getvalue()
 
         except Exception as e:
             logger.error(f"CSV export error: {str(e)}")
             raise
 
+    async def export_to_parquet(
+        self,
+        data: List[Dict[str, Any]],
+        filename: str = "export.parquet"
+    ) -> bytes:
+        """
+        Export data to Parquet format
+
+        Records are converted to columns once and serialized by PyArrow.
+        Odoo's False for empty non-boolean fields becomes null, and
+        relational values (lists, dicts) are written as text like in CSV.
+
+        Args:
+            data: List of records to export
+            filename: Output filename
+
+        Returns:
+            Parquet file content as bytes
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if not data:
+                return b""
+
+            columns = {}
+            for header in data[0].keys():
+                values = [record.get(header) for record in data]
+                if not all(value is None or isinstance(value, bool) for value in values):
+                    values = [
+                        None if value is False
+                        else str(value) if isinstance(value, (list, tuple, dict))
+                        else value
+                        for value in values
+                    ]
+                columns[header] = values
+
+            output = pa.BufferOutputStream()
+            pq.write_table(pa.Table.from_pydict(columns), output)
+
+            logger.info(f"Exported {len(data)} records to Parquet")
+
+            return output.getvalue().to_pybytes()
+
+        except ImportError:
+            logger.error("pyarrow not installed. Install with: pip install pyarrow")
+            raise
+        except Exception as e:
+            logger.error(f"Parquet export error: {str(e)}")
+            raise
+
     async def generate_sales_report(
         self,
         adapter: Any,
@@ -235,26 +383,33 @@ class ReportService:
                 ["state", "in", ["sale", "done"]]
             ]
 
+            if format == 'pdf':
+                # The PDF only needs record ids: search instead of search_read
+                record_ids = await adapter.call_method(
+                    model="sale.order",
+                    method="search",
+                    args=[domain]
+                )
+                return await self.generate_report(
+                    adapter=adapter,
+                    report_name="sale.report_saleorder",
+                    model="sale.order",
+                    record_ids=record_ids,
+                    format="pdf"
+                )
+
             orders = await adapter.search_read(
                 model="sale.order",
                 domain=domain,
-                fields=["name", "partner_id", "date_order", "amount_total", "state"]
+                fields=["id", "name", "partner_id", "date_order", "amount_total", "state"]
             )
 
             if format == 'xlsx':
                 return await self.export_to_excel(orders, "sales_report.xlsx")
             elif format == 'csv':
                 return await self.export_to_csv(orders, "sales_report.csv")
-            elif format == 'pdf':
-                # Generate PDF report
-                record_ids = [order['id'] for order in orders]
-                return await self.generate_report(
-                    adapter=adapter,
-                    report_name="sale.report_saleorder",
-                    model="sale.order",
-                    record_ids=record_ids,
-                    format="pdf"
-                )
+            elif format == 'parquet':
+                return await self.export_to_parquet(orders, "sales_report.parquet")
 
         except Exception as e:
             logger.error(f"Sales report error: {str(e)}")
@@ -296,6 +451,8 @@ class ReportService:
                 return await self.export_to_excel(products, "inventory_report.xlsx")
             elif format == 'csv':
                 return await self.export_to_csv(products, "inventory_report.csv")
+            elif format == 'parquet':
+                return await self.export_to_parquet(products, "inventory_report.parquet")
 
         except Exception as e:
             logger.error(f"Inventory report error: {str(e)}")
@@ -337,6 +494,8 @@ class ReportService:
                 return await self.export_to_excel(partners, "partners_report.xlsx")
             elif format == 'csv':
                 return await self.export_to_csv(partners, "partners_report.csv")
+            elif format == 'parquet':
+                return await self.export_to_parquet(partners, "partners_report.parquet")
 
         except Exception as e:
             logger.error(f"Partner report error: {str(e)}")
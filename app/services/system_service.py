@@ -3,15 +3,54 @@ System Service for managing external system operations
 
 This service orchestrates all CRUD operations, field mapping, and version handling
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Type
 from loguru import logger
+import hashlib
+from functools import partial
+import orjson
 from app.adapters.base_adapter import BaseAdapter
 from app.adapters.odoo_adapter import OdooAdapter
 from app.services.field_mapping_service import FieldMappingService
 from app.services.version_handler import VersionHandler
 from app.services.cache_service import CacheService
 from app.services.audit_service import AuditService
+from app.services.odoo.cache import SingleFlight
 import time
+from types import MappingProxyType
+
+
+# In-process metadata cache in front of Redis
+METADATA_L1_TTL = 300  # seconds
+METADATA_L1_MAX_SIZE = 1024
+
+
+def _read_cache_key(
+    system_id: str,
+    model: str,
+    domain: Optional[List],
+    fields: Optional[List[str]],
+    limit: Optional[int],
+    offset: Optional[int],
+    order: Optional[str]
+) -> str:
+    """
+    Cache key of a read query
+
+    The query is hashed from a canonical encoding so the key has a fixed
+    length; the plain "read:{system_id}:{model}:" prefix keeps the keys
+    readable and matchable by pattern.
+    """
+    payload = orjson.dumps(
+        {"domain": domain, "fields": fields, "limit": limit, "offset": offset, "order": order},
+        option=orjson.OPT_SORT_KEYS,
+        default=str
+    )
+    return f"read:{system_id}:{model}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
+
+def _model_tag(system_id: str, model: str) -> str:
+    """Cache tag of every cached read of a model"""
+    return f"model:{system_id}:{model}"
 
 
 class SystemService:
@@ -26,6 +65,11 @@ class SystemService:
     - Session management
     """
 
+    # Adapter classes by lower-case system type; extend with register_adapter
+    _ADAPTERS: Dict[str, Type[BaseAdapter]] = {
+        "odoo": OdooAdapter,
+    }
+
     def __init__(
         self,
         cache_service: CacheService,
@@ -36,7 +80,9 @@ class SystemService:
         self.field_mapping = FieldMappingService()
         self.version_handler = VersionHandler()
         self.adapters: Dict[str, BaseAdapter] = {}
-        self._system_id_cache: Dict[str, int] = {}  # Cache system_id -> db_id mapping
+        self._system_db_ids: Dict[str, int] = {}  # system_id -> System row id, set on connect
+        self._inflight = SingleFlight()  # pending reads by cache key
+        self._metadata_l1: Dict[str, Tuple[float, Dict[str, Any]]] = {}  # key -> (expires_at, metadata)
 
     def _get_adapter(
         self,
@@ -53,34 +99,50 @@ class SystemService:
         Returns:
             Adapter instance
         """
-        # Create adapter based on type
-        if system_type.lower() == "odoo":
-            return OdooAdapter(config)
-        # Add more adapters here
-        # elif system_type.lower() == "sap":
-        #     return SAPAdapter(config)
-        # elif system_type.lower() == "salesforce":
-        #     return SalesforceAdapter(config)
-        else:
-            raise ValueError(f"Unsupported system type: {system_type}")
+        try:
+            adapter_cls = self._ADAPTERS[system_type.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported system type: {system_type}") from None
+        return adapter_cls(config)
+
+    @classmethod
+    def register_adapter(cls, system_type: str, adapter_cls: Type[BaseAdapter]):
+        """
+        Register an adapter class for a system type
+
+        Args:
+            system_type: System type (odoo, sap, etc.)
+            adapter_cls: BaseAdapter subclass taking the system configuration
+
+        Example:
+            SystemService.register_adapter("sap", SAPAdapter)
+        """
+        cls._ADAPTERS[system_type.lower()] = adapter_cls
 
     async def connect_system(
         self,
         system_id: str,
         system_type: str,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        db_id: Optional[int] = None
     ) -> BaseAdapter:
         """
         Connect to external system
 
         Args:
             system_id: Unique system identifier
-            system_type: System type
+            system_type: System type (case-insensitive)
             config: Connection configuration
+            db_id: Database ID of the System row, used for audit logging
 
         Returns:
             Connected adapter instance
         """
+        # Normalized once; CRUD methods read adapter.system_type
+        system_type = system_type.strip().lower()
+        if not system_type:
+            raise ValueError("System type is required")
+
         adapter = self._get_adapter(system_type, config)
         await adapter.connect()
 
@@ -88,8 +150,12 @@ class SystemService:
         if "username" in config and "password" in config:
             await adapter.authenticate(config["username"], config["password"])
 
+        adapter.system_type = system_type
+
         # Store adapter
         self.adapters[system_id] = adapter
+        if db_id is not None:
+            self._system_db_ids[system_id] = db_id
 
         logger.info(f"Connected to system: {system_id} ({system_type})")
         return adapter
@@ -107,6 +173,7 @@ class SystemService:
         if system_id in self.adapters:
             await self.adapters[system_id].disconnect()
             del self.adapters[system_id]
+            self._system_db_ids.pop(system_id, None)
             logger.info(f"Disconnected from system: {system_id}")
             return True
         return False
@@ -120,7 +187,8 @@ class SystemService:
         use_universal_schema: bool = False,
         system_version: Optional[str] = None,
         ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        bypass_audit: bool = False
     ) -> Dict[str, Any]:
         """
         Create record in external system
@@ -134,22 +202,31 @@ class SystemService:
             system_version: System version for mapping
             ip_address: Client IP for audit
             user_agent: Client user agent for audit
+            bypass_audit: Skip the audit trail (bulk imports)
 
         Returns:
             Creation result with record ID
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         adapter = self.adapters.get(system_id)
 
         if not adapter:
             raise ValueError(f"System not connected: {system_id}")
 
+        audit_ctx = self._make_audit_ctx(
+            "create", model, bypass_audit,
+            user_id=user_id,
+            system_id=self._get_system_db_id(system_id),
+            ip_address=ip_address,
+            user_agent=user_agent
+        )
+
         try:
             # Transform from universal schema if needed
             if use_universal_schema and system_version:
                 data = await self.field_mapping.transform_to_system(
                     data,
-                    adapter.config.get("system_type", "odoo"),
+                    adapter.system_type,
                     system_version,
                     model
                 )
@@ -158,22 +235,18 @@ class SystemService:
             record_id = await adapter.create(model, data)
 
             # Calculate duration
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Audit log
-            await self.audit.log_operation(
-                user_id=user_id,
-                system_id=self._get_system_db_id(system_id),
-                action="create",
-                model=model,
-                record_id=str(record_id),
-                request_data=data,
-                response_data={"id": record_id},
-                status="success",
-                ip_address=ip_address,
-                user_agent=user_agent,
-                duration_ms=duration_ms
-            )
+            if audit_ctx is not None:
+                audit_ctx.update(
+                    record_id=str(record_id),
+                    request_data=MappingProxyType(data),
+                    response_data={"id": record_id},
+                    status="success",
+                    duration_ms=duration_ms
+                )
+                await self.audit.enqueue_operation(**audit_ctx)
 
             return {
                 "success": True,
@@ -182,21 +255,17 @@ class SystemService:
             }
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Audit log error
-            await self.audit.log_operation(
-                user_id=user_id,
-                system_id=self._get_system_db_id(system_id),
-                action="create",
-                model=model,
-                request_data=data,
-                status="error",
-                error_message=str(e),
-                ip_address=ip_address,
-                user_agent=user_agent,
-                duration_ms=duration_ms
-            )
+            if audit_ctx is not None:
+                audit_ctx.update(
+                    request_data=MappingProxyType(data),
+                    status="error",
+                    error_message=str(e),
+                    duration_ms=duration_ms
+                )
+                await self.audit.enqueue_operation(**audit_ctx)
 
             logger.error(f"Create record error: {str(e)}")
             raise
@@ -215,7 +284,8 @@ class SystemService:
         system_version: Optional[str] = None,
         use_cache: bool = True,
         ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        bypass_audit: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Read records from external system
@@ -234,90 +304,119 @@ class SystemService:
             use_cache: Whether to use caching
             ip_address: Client IP for audit
             user_agent: Client user agent for audit
+            bypass_audit: Skip the audit trail (bulk imports)
 
         Returns:
             List of records
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         adapter = self.adapters.get(system_id)
 
         if not adapter:
             raise ValueError(f"System not connected: {system_id}")
 
         # Check cache
-        cache_key = f"read:{system_id}:{model}:{domain}:{fields}:{limit}:{offset}"
+        cache_key = _read_cache_key(system_id, model, domain, fields, limit, offset, order)
         if use_cache:
             cached_result = await self.cache.get(cache_key)
             if cached_result:
                 logger.debug(f"Cache hit for read: {cache_key}")
                 return cached_result
 
+        audit_ctx = self._make_audit_ctx(
+            "read", model, bypass_audit,
+            user_id=user_id,
+            system_id=self._get_system_db_id(system_id),
+            ip_address=ip_address,
+            user_agent=user_agent
+        )
+
         try:
-            # Read records
-            records = await adapter.search_read(
-                model=model,
-                domain=domain,
-                fields=fields,
-                limit=limit,
-                offset=offset,
-                order=order
+            fetch = partial(
+                self._fetch_records,
+                adapter, system_id, model, domain, fields, limit, offset, order,
+                use_universal_schema, system_version, cache_key if use_cache else None
             )
-
-            # Transform to universal schema if needed
-            if use_universal_schema and system_version:
-                records = [
-                    await self.field_mapping.transform_to_universal(
-                        record,
-                        adapter.config.get("system_type", "odoo"),
-                        system_version,
-                        model
-                    )
-                    for record in records
-                ]
-
-            # Cache result (5 minutes for read operations)
             if use_cache:
-                await self.cache.set(cache_key, records, ttl=300)
+                # Concurrent misses on the same key share one adapter call,
+                # run in its own task so a cancelled caller does not cancel it.
+                # Joining callers get their own copy of the records
+                records = await self._inflight.run(cache_key, fetch, copy_result=True)
+            else:
+                records = await fetch()
 
             # Calculate duration
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Audit log
-            await self.audit.log_operation(
-                user_id=user_id,
-                system_id=self._get_system_db_id(system_id),
-                action="read",
-                model=model,
-                request_data={"domain": domain, "fields": fields},
-                response_data={"count": len(records)},
-                status="success",
-                ip_address=ip_address,
-                user_agent=user_agent,
-                duration_ms=duration_ms
-            )
+            if audit_ctx is not None:
+                audit_ctx.update(
+                    request_data={"domain": domain, "fields": fields},
+                    response_data={"count": len(records)},
+                    status="success",
+                    duration_ms=duration_ms
+                )
+                await self.audit.enqueue_operation(**audit_ctx)
 
             return records
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Audit log error
-            await self.audit.log_operation(
-                user_id=user_id,
-                system_id=self._get_system_db_id(system_id),
-                action="read",
-                model=model,
-                request_data={"domain": domain},
-                status="error",
-                error_message=str(e),
-                ip_address=ip_address,
-                user_agent=user_agent,
-                duration_ms=duration_ms
-            )
+            if audit_ctx is not None:
+                audit_ctx.update(
+                    request_data={"domain": domain},
+                    status="error",
+                    error_message=str(e),
+                    duration_ms=duration_ms
+                )
+                await self.audit.enqueue_operation(**audit_ctx)
 
             logger.error(f"Read records error: {str(e)}")
             raise
 
+    async def _fetch_records(
+        self,
+        adapter: BaseAdapter,
+        system_id: str,
+        model: str,
+        domain: Optional[List],
+        fields: Optional[List[str]],
+        limit: Optional[int],
+        offset: Optional[int],
+        order: Optional[str],
+        use_universal_schema: bool,
+        system_version: Optional[str],
+        cache_key: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Read records from the adapter and cache them when cache_key is given"""
+        records = await adapter.search_read(
+            model=model,
+            domain=domain,
+            fields=fields,
+            limit=limit,
+            offset=offset,
+            order=order
+        )
+
+        # Transform to universal schema if needed
+        if use_universal_schema and system_version:
+            records = await self.field_mapping.transform_batch_to_universal(
+                records,
+                adapter.system_type,
+                system_version,
+                model
+            )
+
+        # Cache result (5 minutes for read operations), tagged by model
+        if cache_key is not None:
+            await self.cache.set_tagged(
+                cache_key, records, [_model_tag(system_id, model)], ttl=300
+            )
+
+        return records
+
     async def update_record(
         self,
         user_id: int,
@@ -328,7 +427,8 @@ class SystemService:
         use_universal_schema: bool = False,
         system_version: Optional[str] = None,
         ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        bypass_audit: bool = False
     ) -> Dict[str, Any]:
         """
         Update record in external system
@@ -343,22 +443,31 @@ class SystemService:
             system_version: System version for mapping
             ip_address: Client IP for audit
             user_agent: Client user agent for audit
+            bypass_audit: Skip the audit trail (bulk imports)
 
         Returns:
             Update result
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         adapter = self.adapters.get(system_id)
 
         if not adapter:
             raise ValueError(f"System not connected: {system_id}")
 
+        audit_ctx = self._make_audit_ctx(
+            "update", model, bypass_audit,
+            user_id=user_id,
+            system_id=self._get_system_db_id(system_id),
+            ip_address=ip_address,
+            user_agent=user_agent
+        )
+
         try:
             # Transform from universal schema if needed
             if use_universal_schema and system_version:
                 data = await self.field_mapping.transform_to_system(
                     data,
-                    adapter.config.get("system_type", "odoo"),
+                    adapter.system_type,
                     system_version,
                     model
                 )
@@ -367,25 +476,21 @@ class SystemService:
             success = await adapter.write(model, record_id, data)
 
             # Invalidate cache
-            await self.cache.delete_pattern(f"read:{system_id}:{model}:*")
+            await self.cache.invalidate_tag(_model_tag(system_id, model))
 
             # Calculate duration
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Audit log
-            await self.audit.log_operation(
-                user_id=user_id,
-                system_id=self._get_system_db_id(system_id),
-                action="update",
-                model=model,
-                record_id=str(record_id),
-                request_data=data,
-                response_data={"success": success},
-                status="success",
-                ip_address=ip_address,
-                user_agent=user_agent,
-                duration_ms=duration_ms
-            )
+            if audit_ctx is not None:
+                audit_ctx.update(
+                    record_id=str(record_id),
+                    request_data=MappingProxyType(data),
+                    response_data={"success": success},
+                    status="success",
+                    duration_ms=duration_ms
+                )
+                await self.audit.enqueue_operation(**audit_ctx)
 
             return {
                 "success": success,
@@ -394,22 +499,18 @@ class SystemService:
             }
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Audit log error
-            await self.audit.log_operation(
-                user_id=user_id,
-                system_id=self._get_system_db_id(system_id),
-                action="update",
-                model=model,
-                record_id=str(record_id),
-                request_data=data,
-                status="error",
-                error_message=str(e),
-                ip_address=ip_address,
-                user_agent=user_agent,
-                duration_ms=duration_ms
-            )
+            if audit_ctx is not None:
+                audit_ctx.update(
+                    record_id=str(record_id),
+                    request_data=MappingProxyType(data),
+                    status="error",
+                    error_message=str(e),
+                    duration_ms=duration_ms
+                )
+                await self.audit.enqueue_operation(**audit_ctx)
 
             logger.error(f"Update record error: {str(e)}")
             raise
@@ -421,7 +522,8 @@ class SystemService:
         model: str,
         record_id: Any,
         ip_address: Optional[str] = None,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        bypass_audit: bool = False
     ) -> Dict[str, Any]:
         """
         Delete record from external system
@@ -433,39 +535,44 @@ class SystemService:
             record_id: Record ID to delete
             ip_address: Client IP for audit
             user_agent: Client user agent for audit
+            bypass_audit: Skip the audit trail (bulk imports)
 
         Returns:
             Deletion result
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         adapter = self.adapters.get(system_id)
 
         if not adapter:
             raise ValueError(f"System not connected: {system_id}")
 
+        audit_ctx = self._make_audit_ctx(
+            "delete", model, bypass_audit,
+            user_id=user_id,
+            system_id=self._get_system_db_id(system_id),
+            ip_address=ip_address,
+            user_agent=user_agent
+        )
+
         try:
             # Delete record
             success = await adapter.unlink(model, [record_id])
 
             # Invalidate cache
-            await self.cache.delete_pattern(f"read:{system_id}:{model}:*")
+            await self.cache.invalidate_tag(_model_tag(system_id, model))
 
             # Calculate duration
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Audit log
-            await self.audit.log_operation(
-                user_id=user_id,
-                system_id=self._get_system_db_id(system_id),
-                action="delete",
-                model=model,
-                record_id=str(record_id),
-                response_data={"success": success},
-                status="success",
-                ip_address=ip_address,
-                user_agent=user_agent,
-                duration_ms=duration_ms
-            )
+            if audit_ctx is not None:
+                audit_ctx.update(
+                    record_id=str(record_id),
+                    response_data={"success": success},
+                    status="success",
+                    duration_ms=duration_ms
+                )
+                await self.audit.enqueue_operation(**audit_ctx)
 
             return {
                 "success": success,
@@ -474,21 +581,17 @@ class SystemService:
             }
 
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
             # Audit log error
-            await self.audit.log_operation(
-                user_id=user_id,
-                system_id=self._get_system_db_id(system_id),
-                action="delete",
-                model=model,
-                record_id=str(record_id),
-                status="error",
-                error_message=str(e),
-                ip_address=ip_address,
-                user_agent=user_agent,
-                duration_ms=duration_ms
-            )
+            if audit_ctx is not None:
+                audit_ctx.update(
+                    record_id=str(record_id),
+                    status="error",
+                    error_message=str(e),
+                    duration_ms=duration_ms
+                )
+                await self.audit.enqueue_operation(**audit_ctx)
 
             logger.error(f"Delete record error: {str(e)}")
             raise
@@ -515,12 +618,17 @@ class SystemService:
         if not adapter:
             raise ValueError(f"System not connected: {system_id}")
 
-        # Check cache (metadata cached for 30 minutes)
+        # Check in-process cache, then Redis (metadata cached for 30 minutes)
         cache_key = f"metadata:{system_id}:{model}"
         if use_cache:
+            entry = self._metadata_l1.get(cache_key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+
             cached_result = await self.cache.get(cache_key)
             if cached_result:
                 logger.debug(f"Cache hit for metadata: {cache_key}")
+                self._remember_metadata(cache_key, cached_result)
                 return cached_result
 
         try:
@@ -529,6 +637,7 @@ class SystemService:
             # Cache metadata
             if use_cache:
                 await self.cache.set(cache_key, metadata, ttl=1800)
+                self._remember_metadata(cache_key, metadata)
 
             return metadata
 
@@ -536,19 +645,40 @@ class SystemService:
             logger.error(f"Get metadata error: {str(e)}")
             raise
 
+    def _remember_metadata(self, cache_key: str, metadata: Dict[str, Any]):
+        """Store metadata in the in-process cache, evicting the oldest entry when full"""
+        l1 = self._metadata_l1
+        l1.pop(cache_key, None)
+        if len(l1) >= METADATA_L1_MAX_SIZE:
+            del l1[next(iter(l1))]
+        l1[cache_key] = (time.monotonic() + METADATA_L1_TTL, metadata)
+
+    def _make_audit_ctx(
+        self,
+        action: str,
+        model: str,
+        bypass_audit: bool,
+        **fields: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the audit fields shared by the success and error entries
+
+        Returns:
+            Mutable dict of enqueue_operation kwargs, or None when the
+            action is not audited
+        """
+        if bypass_audit or not self.audit.is_enabled(action, model):
+            return None
+        return dict(action=action, model=model, **fields)
+
     def _get_system_db_id(self, system_id: str) -> Optional[int]:
         """
-        Get database ID for system from cache or return None
+        Get database ID for system, as recorded by connect_system
 
         Args:
             system_id: System identifier
 
         Returns:
-            Database ID or None if not found
+            Database ID or None if the system was connected without one
         """
-        # Try to get from cache (set when connecting)
-        cached_id = getattr(self, '_system_id_cache', {}).get(system_id)
-        if cached_id:
-            return cached_id
-        # Return None if not found (audit will handle it)
-        return None
+        return self._system_db_ids.get(system_id)
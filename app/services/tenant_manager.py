@@ -5,10 +5,13 @@ Manages multiple Odoo instances/databases with connection pooling
 """
 from typing import Dict, Optional, Any
 import asyncio
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from loguru import logger
 import httpx
+import orjson
 
 
 @dataclass
@@ -23,7 +26,9 @@ class TenantConfig:
         username: Odoo username
         api_key: Odoo API key (encrypted)
         timeout: Request timeout in seconds
-        max_connections: Maximum concurrent connections
+        max_connections: Maximum concurrent connections (all kept alive)
+        http2: Negotiate HTTP/2 (needs the h2 package and server support)
+        trust_env: Read proxy settings from the environment
         active: Whether tenant is active
         created_at: When tenant was created
         updated_at: When tenant was last updated
@@ -35,6 +40,8 @@ class TenantConfig:
     api_key: str = ""
     timeout: int = 30
     max_connections: int = 10
+    http2: bool = False
+    trust_env: bool = True
     active: bool = True
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
@@ -49,17 +56,47 @@ class ConnectionStats:
         total_requests: Total number of requests
         successful_requests: Number of successful requests
         failed_requests: Number of failed requests
-        avg_response_time: Average response time in seconds
+        total_duration_us: Summed duration of successful requests in microseconds
         last_request_at: Last request timestamp
         active_connections: Number of active connections
     """
     total_requests: int = 0
     successful_requests: int = 0
     failed_requests: int = 0
-    avg_response_time: float = 0.0
+    total_duration_us: int = 0
     last_request_at: Optional[datetime] = None
     active_connections: int = 0
 
+    @property
+    def avg_response_time_us(self) -> int:
+        """Average response time of successful requests in microseconds"""
+        if not self.successful_requests:
+            return 0
+        return self.total_duration_us // self.successful_requests
+
+    @property
+    def avg_response_time(self) -> float:
+        """Average response time of successful requests in seconds"""
+        if not self.successful_requests:
+            return 0.0
+        return self.total_duration_us / self.successful_requests / 1_000_000
+
+
+@asynccontextmanager
+async def _track_request(stats: ConnectionStats):
+    """
+    Count a request as an active connection for the duration of the block
+
+    Also stamps last_request_at on exit; this is the only wall-clock read
+    per request, durations use perf_counter_ns.
+    """
+    stats.active_connections += 1
+    try:
+        yield
+    finally:
+        stats.active_connections -= 1
+        stats.last_request_at = datetime.now()
+
 
 class OdooConnectionPool:
     """
@@ -142,38 +179,41 @@ class OdooConnectionPool:
             ValueError: If tenant not found or inactive
         """
         # Check if tenant exists
-        if tenant_id not in self.tenant_configs:
+        config = self.tenant_configs.get(tenant_id)
+        if config is None:
             raise ValueError(f"Tenant not found: {tenant_id}")
 
-        config = self.tenant_configs[tenant_id]
-
         # Check if tenant is active
         if not config.active:
             raise ValueError(f"Tenant is inactive: {tenant_id}")
 
-        # Ensure lock exists
-        if tenant_id not in self._locks:
-            self._locks[tenant_id] = asyncio.Lock()
+        # Fast path: the connection almost always exists already
+        client = self.connections.get(tenant_id)
+        if client is not None:
+            return client
 
-        # Get or create connection
-        async with self._locks[tenant_id]:
-            if tenant_id not in self.connections:
+        # Get or create connection (double-checked under the tenant lock)
+        async with self._locks.setdefault(tenant_id, asyncio.Lock()):
+            client = self.connections.get(tenant_id)
+            if client is None:
                 # Create new connection
                 client = httpx.AsyncClient(
                     base_url=config.odoo_url,
                     timeout=httpx.Timeout(config.timeout),
                     limits=httpx.Limits(
                         max_connections=config.max_connections,
-                        max_keepalive_connections=config.max_connections // 2
+                        max_keepalive_connections=config.max_connections,
+                        keepalive_expiry=30.0
                     ),
-                    http2=True,  # Enable HTTP/2
+                    http2=config.http2,
+                    trust_env=config.trust_env,
                     follow_redirects=True
                 )
 
                 self.connections[tenant_id] = client
                 logger.debug(f"Created connection for tenant: {tenant_id}")
 
-            return self.connections[tenant_id]
+            return client
 
     async def execute_request(
         self,
@@ -202,44 +242,24 @@ class OdooConnectionPool:
                 json={...}
             )
         """
-        start_time = datetime.now()
-        stats = self.stats.get(tenant_id, ConnectionStats())
-
-        try:
-            # Get connection
-            client = await self.get_connection(tenant_id)
-
-            # Update active connections
-            stats.active_connections += 1
+        stats = self.stats.get(tenant_id)
+        if stats is None:
+            raise ValueError(f"Tenant not found: {tenant_id}")
 
-            # Execute request
-            response = await client.request(method, endpoint, **kwargs)
-            response.raise_for_status()
+        start_ns = time.perf_counter_ns()
 
-            # Update statistics
-            stats.total_requests += 1
-            stats.successful_requests += 1
-            stats.last_request_at = datetime.now()
-
-            # Update average response time
-            duration = (datetime.now() - start_time).total_seconds()
-            stats.avg_response_time = (
-                (stats.avg_response_time * (stats.total_requests - 1) + duration)
-                / stats.total_requests
-            )
-
-            logger.debug(
-                f"Request successful for {tenant_id}: "
-                f"{method} {endpoint} ({duration:.2f}s)"
-            )
+        try:
+            async with _track_request(stats):
+                # Get connection
+                client = await self.get_connection(tenant_id)
 
-            return response.json()
+                # Execute request
+                data = await self._send(client, method, endpoint, **kwargs)
 
         except Exception as e:
-            # Update statistics
+            # Update statistics (no await between these updates)
             stats.total_requests += 1
             stats.failed_requests += 1
-            stats.last_request_at = datetime.now()
 
             logger.error(
                 f"Request failed for {tenant_id}: "
@@ -248,9 +268,48 @@ class OdooConnectionPool:
 
             raise
 
-        finally:
-            # Decrement active connections
-            stats.active_connections = max(0, stats.active_connections - 1)
+        # Update statistics (no await between these updates)
+        duration_us = (time.perf_counter_ns() - start_ns) // 1000
+        stats.total_requests += 1
+        stats.successful_requests += 1
+        # Summed exactly; the mean is derived when read
+        stats.total_duration_us += duration_us
+
+        logger.debug(
+            f"Request successful for {tenant_id}: "
+            f"{method} {endpoint} ({duration_us / 1_000_000:.2f}s)"
+        )
+
+        return data
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        endpoint: str,
+        json: Any = None,
+        **kwargs
+    ) -> Any:
+        """
+        Send a request with orjson encoding of the JSON body and response
+
+        Args:
+            client: Tenant HTTP client
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            json: JSON payload, sent as the request body
+            **kwargs: Additional request parameters
+
+        Returns:
+            Decoded response body
+        """
+        if json is not None:
+            kwargs["content"] = orjson.dumps(json)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+
+        response = await client.request(method, endpoint, **kwargs)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def health_check(self, tenant_id: str) -> bool:
         """
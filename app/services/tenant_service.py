@@ -1,27 +1,105 @@
 """
 Tenant service for tenant business logic
 """
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from uuid import UUID
+from loguru import logger
+import asyncio
 import httpx
+import secrets
 
+from app.adapters.odoo_adapter import OdooAdapter
 from app.repositories.tenant_repository import TenantRepository
+from app.repositories.tenant_user_repository import TenantUserRepository
 from app.repositories.plan_repository import PlanRepository
-from app.models.tenant import Tenant, TenantStatus
+from app.models.tenant import Tenant, TenantStatus, normalize_slug
+from app.models.tenant_user import TenantUser
 from app.core.encryption import encryption_service
+from app.core.security import get_password_hash
+from app.services.cache_service import CacheService
+from app.services.odoo.base import get_shared_client
+from app.services.odoo.cache import TTLCache
 from fastapi import HTTPException, status
 
 
+# Tenant statistics are cached briefly for polling dashboards and dropped
+# whenever a tenant is created or changes status
+TENANT_STATS_CACHE_KEY = "tenant:stats"
+TENANT_STATS_CACHE_TTL = 30  # seconds
+
+# Upper bound on one page of list_tenants
+TENANT_LIST_MAX_LIMIT = 500
+
+# Columns update_tenant may change; anything else in the payload (the
+# primary key, created_by, timestamps, ...) is ignored
+TENANT_UPDATABLE_FIELDS = frozenset({
+    "name", "slug", "description", "contact_email", "contact_phone",
+    "odoo_url", "odoo_database", "odoo_version", "odoo_username", "odoo_password",
+    "plan_id", "status", "trial_ends_at", "subscription_ends_at",
+    "max_requests_per_day", "max_requests_per_hour", "max_users",
+    "allowed_models", "allowed_features",
+})
+
+# Decrypted Odoo passwords keyed by ciphertext, kept briefly to skip the
+# Fernet decrypt on repeated connections for the same tenant
+_password_cache = TTLCache(maxsize=512, ttl=300, name="odoo_password")
+
+# Odoo sessions from successful connection tests, keyed by tenant ID, so
+# repeated tests resume the session instead of logging in again
+_auth_cache = TTLCache(maxsize=1024, ttl=1800, name="odoo_auth")
+
+# Tenant fields that invalidate a cached Odoo session when changed
+_ODOO_CREDENTIAL_FIELDS = ("odoo_url", "odoo_database", "odoo_username", "odoo_password")
+
+
+def decrypt_odoo_password(encrypted_password: str) -> str:
+    """
+    Decrypt an Odoo password, caching the result by ciphertext
+
+    Raises:
+        cryptography.fernet.InvalidToken: If the value is not a valid token
+    """
+    password = _password_cache.get(encrypted_password)
+    if password is None:
+        password = encryption_service.decrypt_value(encrypted_password)
+        _password_cache.set(encrypted_password, password)
+    return password
+
+
 class TenantService:
     """Service for tenant operations"""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: Optional[CacheService] = None):
         self.session = session
+        self.cache = cache
         self.tenant_repo = TenantRepository(session)
         self.plan_repo = PlanRepository(session)
 
+    async def _raise_if_slug_taken(self, slug: str, exclude_id: Optional[UUID] = None):
+        """
+        Translate a failed insert or update into a 400 when the slug is taken
+
+        Called after an IntegrityError, so the session is rolled back first.
+
+        Raises:
+            HTTPException: If another tenant already uses the slug
+        """
+        await self.session.rollback()
+        if await self.tenant_repo.is_slug_taken(slug, exclude_id=exclude_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Slug already taken"
+            )
+
+    async def _invalidate_statistics(self):
+        """Drop cached tenant statistics after a tenant is added or changes status"""
+        if self.cache is not None:
+            await self.cache.delete(TENANT_STATS_CACHE_KEY)
+
     async def create_tenant(
         self,
         name: str,
@@ -56,13 +134,6 @@ class TenantService:
         Raises:
             HTTPException: If slug is taken or plan doesn't exist
         """
-        # Check if slug is taken
-        if await self.tenant_repo.is_slug_taken(slug):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Slug already taken"
-            )
-
         # Verify plan exists
         plan = await self.plan_repo.get_by_id_uuid(plan_id)
         if not plan:
@@ -89,7 +160,14 @@ class TenantService:
             **kwargs
         )
 
-        return await self.tenant_repo.create(tenant)
+        # The unique constraint on tenants.slug rejects duplicates
+        try:
+            tenant = await self.tenant_repo.create(tenant)
+        except IntegrityError:
+            await self._raise_if_slug_taken(slug)
+            raise
+        await self._invalidate_statistics()
+        return tenant
 
     async def get_tenant(self, tenant_id: UUID) -> Optional[Tenant]:
         """
@@ -101,7 +179,7 @@ class TenantService:
         Returns:
             Tenant instance or None
         """
-        return await self.tenant_repo.get_by_id_uuid(tenant_id)
+        return await self.tenant_repo.get_or_none(tenant_id)
 
     async def get_tenant_by_slug(self, slug: str) -> Optional[Tenant]:
         """
@@ -119,25 +197,30 @@ class TenantService:
         self,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[TenantStatus] = None
+        status: Optional[TenantStatus] = None,
+        after: Optional[UUID] = None
     ) -> List[Tenant]:
         """
         List tenants with pagination and optional status filter
 
+        Pass the ID of the last tenant of a page as after to get the next
+        page without the cost of a large offset.
+
         Args:
             skip: Number of records to skip
-            limit: Maximum number of records to return
+            limit: Maximum number of records to return (at most TENANT_LIST_MAX_LIMIT)
             status: Optional status filter
+            after: ID of the last tenant of the previous page
 
         Returns:
-            List of tenants
+            List of tenants, newest first
         """
-        filters = {"status": status} if status else None
-        return await self.tenant_repo.get_multi(
-            skip=skip,
+        limit = min(max(limit, 1), TENANT_LIST_MAX_LIMIT)
+        return await self.tenant_repo.list_page(
+            after=after,
             limit=limit,
-            filters=filters,
-            order_by="-created_at"
+            status=status,
+            skip=skip
         )
 
     async def update_tenant(
@@ -158,20 +241,18 @@ class TenantService:
         Raises:
             HTTPException: If slug is already taken by another tenant
         """
-        tenant = await self.tenant_repo.get_by_id_uuid(tenant_id)
-        if not tenant:
-            return None
-
-        # Check slug uniqueness if updating slug
-        if "slug" in data and data["slug"] != tenant.slug:
-            if await self.tenant_repo.is_slug_taken(data["slug"], exclude_id=tenant_id):
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Slug already taken"
-                )
+        data = {key: value for key, value in data.items() if key in TENANT_UPDATABLE_FIELDS}
+        if not data:
+            return await self.tenant_repo.get_or_none(tenant_id)
+
+        # A bulk UPDATE skips the model's slug validator
+        if data.get("slug") is not None:
+            data["slug"] = normalize_slug(data["slug"])
 
         # Encrypt password if updating
         if "odoo_password" in data:
+            # The old ciphertext is not loaded, so drop every cached decryption
+            _password_cache.clear()
             data["odoo_password"] = encryption_service.encrypt_value(data["odoo_password"])
 
         # Convert timezone-aware datetime to naive for database
@@ -182,13 +263,18 @@ class TenantService:
                     # Remove timezone info (convert to naive datetime)
                     data[field] = data[field].replace(tzinfo=None)
 
-        # Update fields
-        for key, value in data.items():
-            if hasattr(tenant, key):
-                setattr(tenant, key, value)
-
-        await self.session.commit()
-        await self.session.refresh(tenant)
+        # One UPDATE ... RETURNING; the unique constraint on tenants.slug
+        # rejects duplicates
+        try:
+            tenant = await self.tenant_repo.update(tenant_id, data)
+        except IntegrityError:
+            if "slug" in data:
+                await self._raise_if_slug_taken(data["slug"], exclude_id=tenant_id)
+            raise
+        if tenant is not None and "status" in data:
+            await self._invalidate_statistics()
+        if any(field in data for field in _ODOO_CREDENTIAL_FIELDS):
+            _auth_cache.invalidate_key(tenant_id)
         return tenant
 
     async def suspend_tenant(self, tenant_id: UUID) -> bool:
@@ -201,12 +287,10 @@ class TenantService:
         Returns:
             True if suspended, False if tenant not found
         """
-        tenant = await self.tenant_repo.get_by_id_uuid(tenant_id)
-        if not tenant:
+        if not await self.tenant_repo.set_status(tenant_id, TenantStatus.SUSPENDED):
             return False
 
-        tenant.status = TenantStatus.SUSPENDED
-        await self.session.commit()
+        await self._invalidate_statistics()
         return True
 
     async def activate_tenant(self, tenant_id: UUID) -> bool:
@@ -219,12 +303,10 @@ class TenantService:
         Returns:
             True if activated, False if tenant not found
         """
-        tenant = await self.tenant_repo.get_by_id_uuid(tenant_id)
-        if not tenant:
+        if not await self.tenant_repo.set_status(tenant_id, TenantStatus.ACTIVE):
             return False
 
-        tenant.status = TenantStatus.ACTIVE
-        await self.session.commit()
+        await self._invalidate_statistics()
         return True
 
     async def delete_tenant(self, tenant_id: UUID) -> bool:
@@ -237,15 +319,34 @@ class TenantService:
         Returns:
             True if deleted, False if tenant not found
         """
-        tenant = await self.tenant_repo.get_by_id_uuid(tenant_id)
-        if not tenant:
+        if not await self.tenant_repo.set_status(tenant_id, TenantStatus.DELETED, deleted_at=datetime.utcnow()):
             return False
 
-        tenant.status = TenantStatus.DELETED
-        tenant.deleted_at = datetime.utcnow()
-        await self.session.commit()
+        await self._invalidate_statistics()
         return True
 
+    async def _authenticate_odoo(self, adapter, tenant, password: str) -> Dict[str, Any]:
+        """
+        Authenticate the tenant's Odoo adapter, resuming a cached session if it is still valid
+
+        Returns:
+            The adapter's authenticate result
+        """
+        cached = _auth_cache.get(tenant.id)
+        if cached is not None:
+            if await adapter.resume_session(cached["session_id"], cached["uid"]):
+                return {"success": True, **cached}
+            _auth_cache.invalidate_key(tenant.id)
+
+        auth_result = await adapter.authenticate(tenant.odoo_username, password)
+        if auth_result.get("success") and auth_result.get("session_id"):
+            _auth_cache.set(tenant.id, {
+                "uid": auth_result.get("uid"),
+                "session_id": auth_result["session_id"],
+                "user_context": auth_result.get("user_context", {})
+            })
+        return auth_result
+
     async def test_odoo_connection(self, tenant_id: UUID) -> Dict[str, Any]:
         """
         Test Odoo connection for a tenant with full authentication and database verification
@@ -266,10 +367,8 @@ class TenantService:
         Raises:
             HTTPException: If tenant not found
         """
-        from loguru import logger
-        from app.adapters.odoo_adapter import OdooAdapter
-        
-        tenant = await self.tenant_repo.get_by_id_uuid(tenant_id)
+        # Only the connection columns are loaded, as a plain row
+        tenant = await self.tenant_repo.get_odoo_credentials(tenant_id)
         if not tenant:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -290,7 +389,7 @@ class TenantService:
             # Use OdooAdapter for proper authentication (same as /api/v1/auth/login)
             # Decrypt password for Odoo authentication
             try:
-                decrypted_password = encryption_service.decrypt_value(tenant.odoo_password)
+                decrypted_password = decrypt_odoo_password(tenant.odoo_password)
                 logger.info(f"[TEST CONNECTION] Password decrypted successfully")
             except Exception as decrypt_error:
                 # If decryption fails, try using as-is (might be plain text from old records or hash)
@@ -305,46 +404,57 @@ class TenantService:
             }
             
             adapter = OdooAdapter(odoo_config)
-            
-            # Step 1: Test basic connection first
-            try:
-                import httpx
-                async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
-                    # Try to reach Odoo
-                    test_url = f"{tenant.odoo_url.rstrip('/')}/web"
-                    try:
-                        test_response = await client.get(test_url, timeout=10.0)
-                        if test_response.status_code in [200, 301, 302, 303, 307, 308]:
-                            result["details"]["connection_reachable"] = True
-                            logger.info(f"Odoo instance is reachable: {tenant.odoo_url}")
-                        else:
-                            result["details"]["connection_reachable"] = False
-                            logger.warning(f"Odoo returned status {test_response.status_code}")
-                    except httpx.TimeoutException:
-                        result["details"]["connection_reachable"] = False
-                        result["success"] = False
-                        result["message"] = "Connection test failed: Timeout - Odoo server is not responding. Please check the URL and network connectivity."
-                        result["details"]["timeout"] = True
-                        return result
-                    except httpx.RequestError as e:
-                        result["details"]["connection_reachable"] = False
-                        result["success"] = False
-                        result["message"] = f"Connection test failed: Cannot reach Odoo instance - {str(e)}. Please check the URL: {tenant.odoo_url}"
-                        result["details"]["connection_error"] = str(e)
-                        return result
-            except Exception as conn_error:
-                logger.warning(f"Connection test warning: {str(conn_error)}")
+            base_url = tenant.odoo_url.rstrip('/')
+
+            logger.info(f"[TEST CONNECTION] Starting authentication process")
+            logger.info(f"[TEST CONNECTION] Odoo URL: {tenant.odoo_url}")
+            logger.info(f"[TEST CONNECTION] Database: {tenant.odoo_database}")
+            logger.info(f"[TEST CONNECTION] Username: {tenant.odoo_username}")
+            logger.info(f"[TEST CONNECTION] Password: {'*' * len(decrypted_password) if decrypted_password else 'None'}")
+
+            # Reachability probe, authentication and version lookup are
+            # independent round trips, so run them concurrently (version_info
+            # needs no session) on the pooled Odoo client, which keeps its
+            # connections alive between tests. The probe is a HEAD without
+            # redirects: a 3xx already proves the server is up, and the
+            # web client's HTML page is never downloaded
+            client = get_shared_client()
+            test_response, version_response, auth_result = await asyncio.gather(
+                client.head(f"{base_url}/web", timeout=10.0, follow_redirects=False),
+                client.post(f"{base_url}/web/webclient/version_info", json={}, timeout=10.0),
+                self._authenticate_odoo(adapter, tenant, decrypted_password),
+                return_exceptions=True
+            )
+
+            # Step 1: Check basic connection
+            if isinstance(test_response, (httpx.TimeoutException, httpx.RequestError)):
+                result["details"]["connection_reachable"] = False
+                result["success"] = False
+                if isinstance(test_response, httpx.TimeoutException):
+                    result["message"] = "Connection test failed: Timeout - Odoo server is not responding. Please check the URL and network connectivity."
+                    result["details"]["timeout"] = True
+                else:
+                    result["message"] = f"Connection test failed: Cannot reach Odoo instance - {str(test_response)}. Please check the URL: {tenant.odoo_url}"
+                    result["details"]["connection_error"] = str(test_response)
+                try:
+                    await adapter.disconnect()
+                except Exception:
+                    pass
+                return result
+            elif isinstance(test_response, Exception):
+                logger.warning(f"Connection test warning: {str(test_response)}")
                 # Continue anyway - authentication will reveal the real issue
-            
+            elif test_response.status_code in [200, 301, 302, 303, 307, 308]:
+                result["details"]["connection_reachable"] = True
+                logger.info(f"Odoo instance is reachable: {tenant.odoo_url}")
+            else:
+                result["details"]["connection_reachable"] = False
+                logger.warning(f"Odoo returned status {test_response.status_code}")
+
             # Step 2: Authenticate
             try:
-                logger.info(f"[TEST CONNECTION] Starting authentication process")
-                logger.info(f"[TEST CONNECTION] Odoo URL: {tenant.odoo_url}")
-                logger.info(f"[TEST CONNECTION] Database: {tenant.odoo_database}")
-                logger.info(f"[TEST CONNECTION] Username: {tenant.odoo_username}")
-                logger.info(f"[TEST CONNECTION] Password: {'*' * len(decrypted_password) if decrypted_password else 'None'}")
-                
-                auth_result = await adapter.authenticate(tenant.odoo_username, decrypted_password)
+                if isinstance(auth_result, Exception):
+                    raise auth_result
                 
                 logger.info(f"[TEST CONNECTION] Authentication result: success={auth_result.get('success')}, has_uid={bool(auth_result.get('uid'))}")
                 
@@ -417,34 +527,21 @@ class TenantService:
                     }
                     result["details"]["query_error"] = str(query_error)
 
-                # Step 4: Try to get Odoo version using authenticated session
+                # Step 4: Read the Odoo version fetched alongside authentication
                 try:
-                    import httpx
-                    version_url = f"{tenant.odoo_url.rstrip('/')}/web/webclient/version_info"
-                    
-                    # Use the authenticated session from adapter
-                    headers = {
-                        "Content-Type": "application/json",
-                    }
-                    cookies = {}
-                    
-                    # Add session cookie if available
-                    if session_id:
-                        cookies["session_id"] = session_id
-                    
-                    async with httpx.AsyncClient(timeout=10.0, cookies=cookies) as client:
-                        version_response = await client.post(version_url, headers=headers, json={})
-                        if version_response.status_code == 200:
-                            version_data = version_response.json()
-                            if isinstance(version_data, dict) and "result" in version_data:
-                                version_info = version_data["result"]
-                                result["version"] = version_info.get("server_version", "Unknown")
-                                result["details"]["server_serie"] = version_info.get("server_serie")
-                                logger.info(f"Detected Odoo version: {result['version']}")
-                            else:
-                                result["version"] = version_data.get("server_version", "Unknown")
-                                result["details"]["server_serie"] = version_data.get("server_serie")
-                                logger.info(f"Detected Odoo version: {result['version']}")
+                    if isinstance(version_response, Exception):
+                        raise version_response
+                    if version_response.status_code == 200:
+                        version_data = version_response.json()
+                        if isinstance(version_data, dict) and "result" in version_data:
+                            version_info = version_data["result"]
+                            result["version"] = version_info.get("server_version", "Unknown")
+                            result["details"]["server_serie"] = version_info.get("server_serie")
+                            logger.info(f"Detected Odoo version: {result['version']}")
+                        else:
+                            result["version"] = version_data.get("server_version", "Unknown")
+                            result["details"]["server_serie"] = version_data.get("server_serie")
+                            logger.info(f"Detected Odoo version: {result['version']}")
                 except Exception as version_error:
                     logger.warning(f"Could not get version info: {str(version_error)}")
                     # Version info is optional, try alternative method
@@ -469,17 +566,10 @@ class TenantService:
                 
                 # Update tenant with Odoo version if detected
                 if result.get("version") and tenant.odoo_version != result["version"]:
-                    tenant.odoo_version = result["version"]
-                    await self.session.commit()
+                    await self.tenant_repo.set_odoo_version(tenant.id, result["version"])
                     logger.info(f"Updated tenant {tenant.name} with Odoo version: {result['version']}")
                 
                 # Create admin user automatically if not exists
-                from app.repositories.tenant_user_repository import TenantUserRepository
-                from app.core.security import get_password_hash
-                from app.models.tenant_user import TenantUser
-                from sqlalchemy import select
-                import secrets
-                
                 tenant_user_repo = TenantUserRepository(self.session)
                 
                 # Check if admin user already exists for this tenant
@@ -569,19 +659,28 @@ class TenantService:
         """
         Get overall tenant statistics
 
+        Served from the cache for up to TENANT_STATS_CACHE_TTL seconds
+        when the service has one.
+
         Returns:
             Dictionary with tenant statistics
         """
-        total = await self.tenant_repo.count()
-        active = await self.tenant_repo.count_by_status(TenantStatus.ACTIVE)
-        suspended = await self.tenant_repo.count_by_status(TenantStatus.SUSPENDED)
-        trial = await self.tenant_repo.count_by_status(TenantStatus.TRIAL)
-        deleted = await self.tenant_repo.count_by_status(TenantStatus.DELETED)
-
-        return {
-            "total": total,
-            "active": active,
-            "suspended": suspended,
-            "trial": trial,
-            "deleted": deleted
+        if self.cache is not None:
+            cached = await self.cache.get(TENANT_STATS_CACHE_KEY)
+            if cached is not None:
+                return cached
+
+        counts = await self.tenant_repo.count_grouped_by_status()
+
+        statistics = {
+            "total": sum(counts.values()),
+            "active": counts.get(TenantStatus.ACTIVE, 0),
+            "suspended": counts.get(TenantStatus.SUSPENDED, 0),
+            "trial": counts.get(TenantStatus.TRIAL, 0),
+            "deleted": counts.get(TenantStatus.DELETED, 0)
         }
+
+        if self.cache is not None:
+            await self.cache.set(TENANT_STATS_CACHE_KEY, statistics, ttl=TENANT_STATS_CACHE_TTL)
+
+        return statistics
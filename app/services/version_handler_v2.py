@@ -3,9 +3,9 @@ Enhanced Version Handler for Odoo 13.0 -> 19.0
 
 Supports automatic multi-hop migration
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Mapping, Optional, List
 from loguru import logger
-from app.services.odoo_versions import ODOO_VERSION_RULES, get_migration_path
+from app.services.odoo_versions import ODOO_VERSION_RULES, Rule, get_migration_path, get_rules
 
 
 class EnhancedVersionHandler:
@@ -60,10 +60,8 @@ class EnhancedVersionHandler:
         if from_version == to_version:
             return data
 
-        migration_key = f"{from_version}_to_{to_version}"
-
         # Try direct migration first
-        rules = self._get_migration_rules(system_type, model, migration_key)
+        rules = self._get_migration_rules(system_type, model, from_version, to_version)
 
         if rules:
             logger.info(f"Direct migration: {from_version} -> {to_version}")
@@ -115,8 +113,7 @@ class EnhancedVersionHandler:
             current_version = migration_path[i]
             next_version = migration_path[i + 1]
 
-            migration_key = f"{current_version}_to_{next_version}"
-            rules = self._get_migration_rules("odoo", model, migration_key)
+            rules = self._get_migration_rules("odoo", model, current_version, next_version)
 
             if rules:
                 logger.debug(f"Applying migration: {current_version} -> {next_version}")
@@ -130,20 +127,24 @@ class EnhancedVersionHandler:
         self,
         system_type: str,
         model: str,
-        migration_key: str
-    ) -> Optional[Dict]:
+        from_version: str,
+        to_version: str
+    ) -> Optional[Mapping[str, Rule]]:
         """Get migration rules for specific path"""
+        if system_type == "odoo":
+            return get_rules(model, from_version, to_version)
+
         return (
             self.version_rules
             .get(system_type, {})
             .get(model, {})
-            .get(migration_key, None)
+            .get(f"{from_version}_to_{to_version}", None)
         )
 
     async def _apply_migration_rules(
         self,
         data: Dict[str, Any],
-        rules: Dict[str, Any]
+        rules: Mapping[str, Rule]
     ) -> Dict[str, Any]:
         """
         Apply migration rules to data
@@ -164,31 +165,31 @@ class EnhancedVersionHandler:
             old_value = migrated_data[old_field]
 
             # Handle field rename
-            if rule.get("rename_to"):
-                new_field = rule["rename_to"]
+            if rule.rename_to:
+                new_field = rule.rename_to
                 migrated_data[new_field] = old_value
                 del migrated_data[old_field]
                 logger.debug(f"Renamed: {old_field} -> {new_field}")
 
             # Handle field removal
-            elif rule.get("removed"):
+            elif rule.removed:
                 del migrated_data[old_field]
                 logger.debug(f"Removed: {old_field}")
 
                 # Apply replacement if provided
-                if rule.get("replace_with"):
-                    migrated_data.update(rule["replace_with"])
+                if rule.replace_with:
+                    migrated_data.update(rule.replace_with)
 
             # Handle value mapping
-            elif rule.get("value_mapping"):
-                value_map = rule["value_mapping"]
+            elif rule.value_mapping:
+                value_map = rule.value_mapping
                 if old_value in value_map:
                     migrated_data[old_field] = value_map[old_value]
                     logger.debug(f"Mapped: {old_field} {old_value} -> {value_map[old_value]}")
 
             # Handle warnings
-            if rule.get("warning"):
-                logger.warning(f"Migration warning for {old_field}: {rule['warning']}")
+            if rule.warning:
+                logger.warning(f"Migration warning for {old_field}: {rule.warning}")
 
         return migrated_data
 
@@ -238,9 +239,7 @@ class EnhancedVersionHandler:
         for i in range(len(migration_path) - 1):
             current_version = migration_path[i]
             next_version = migration_path[i + 1]
-            migration_key = f"{current_version}_to_{next_version}"
-
-            rules = self._get_migration_rules(system_type, model, migration_key)
+            rules = self._get_migration_rules(system_type, model, current_version, next_version)
 
             if rules:
                 step_changes = self._analyze_rules(rules)
@@ -266,7 +265,7 @@ class EnhancedVersionHandler:
             "complexity": len(steps)
         }
 
-    def _analyze_rules(self, rules: Dict[str, Any]) -> Dict[str, List]:
+    def _analyze_rules(self, rules: Mapping[str, Rule]) -> Dict[str, List]:
         """Analyze rules and categorize changes"""
         changes = {
             "renamed_fields": [],
@@ -276,22 +275,22 @@ class EnhancedVersionHandler:
         }
 
         for field, rule in rules.items():
-            if rule.get("rename_to"):
+            if rule.rename_to:
                 changes["renamed_fields"].append({
                     "old": field,
-                    "new": rule["rename_to"]
+                    "new": rule.rename_to
                 })
-            if rule.get("removed"):
+            if rule.removed:
                 changes["removed_fields"].append(field)
-            if rule.get("value_mapping"):
+            if rule.value_mapping:
                 changes["value_mappings"].append({
                     "field": field,
-                    "mapping": rule["value_mapping"]
+                    "mapping": rule.value_mapping
                 })
-            if rule.get("warning"):
+            if rule.warning:
                 changes["warnings"].append({
                     "field": field,
-                    "message": rule["warning"]
+                    "message": rule.warning
                 })
 
         return changes
@@ -1,22 +1,29 @@
 """
 Pytest fixtures for Odoo operation tests
 """
-import pytest
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from app.services.odoo import (
-    OdooOperationsService,
-    SearchOperations,
-    CRUDOperations,
     AdvancedOperations,
+    CRUDOperations,
+    CustomOperations,
     NameOperations,
-    ViewOperations,
-    WebOperations,
     PermissionOperations,
+    SearchOperations,
     UtilityOperations,
-    CustomOperations,
+    ViewOperations,
+    WebOperations,
+)
+from app.services.odoo.cache import (
+    count_cache,
+    fields_cache,
+    known_ids_cache,
+    view_cache,
+    xmlid_cache,
 )
-
 
 # Test Odoo credentials
 TEST_ODOO_URL = "https://demo.odoo.com"
@@ -25,6 +32,16 @@ TEST_ODOO_USER = "admin"
 TEST_ODOO_PASS = "admin"
 
 
+@pytest.fixture(autouse=True)
+def clear_odoo_caches():
+    """Keep module-level Odoo caches from leaking between tests"""
+    for cache in (count_cache, fields_cache, known_ids_cache, view_cache, xmlid_cache):
+        cache.clear()
+    yield
+    for cache in (count_cache, fields_cache, known_ids_cache, view_cache, xmlid_cache):
+        cache.clear()
+
+
 @pytest.fixture
 def odoo_credentials():
     """Return test Odoo credentials"""
@@ -113,6 +130,7 @@ def create_json_response(data, status_code=200):
     response.status_code = status_code
     response.headers = {"content-type": "application/json"}
     response.json.return_value = {"jsonrpc": "2.0", "result": data}
+    response.content = json.dumps(response.json.return_value).encode()
     response.raise_for_status = MagicMock()
     return response
 
@@ -130,5 +148,6 @@ def create_error_response(error_message, error_code=None):
             "data": {}
         }
     }
+    response.content = json.dumps(response.json.return_value).encode()
     response.raise_for_status = MagicMock()
     return response
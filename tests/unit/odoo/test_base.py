@@ -0,0 +1,232 @@
+"""
+Unit tests for the base Odoo Operations Service
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.odoo.base import OdooOperationsService, _build_call_kw_payload
+
+
+@pytest.fixture
+def base_service():
+    """Create an authenticated base service instance for testing"""
+    service = OdooOperationsService(
+        odoo_url="https://demo.odoo.com",
+        database="demo",
+        username="admin",
+        password="admin"
+    )
+    service._uid = 2
+    service._session_id = "test-session"
+    return service
+
+
+class TestCallKwPayload:
+    """Tests for the precomputed call_kw envelope"""
+
+    def test_payload_is_valid_jsonrpc(self):
+        """Test the built payload decodes to a standard JSON-RPC call"""
+        payload = _build_call_kw_payload(
+            "res.partner", "search_read", [[["is_company", "=", True]]], {"limit": 5}
+        )
+
+        assert json.loads(payload) == {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "id": 1,
+            "params": {
+                "model": "res.partner",
+                "method": "search_read",
+                "args": [[["is_company", "=", True]]],
+                "kwargs": {"limit": 5}
+            }
+        }
+
+    def test_payload_encodes_dates_and_decimals_for_odoo(self):
+        """Test dates use Odoo's server format and Decimals become numbers"""
+        from datetime import date, datetime, timedelta, timezone
+        from decimal import Decimal
+
+        payload = _build_call_kw_payload("sale.order", "write", [[1], {
+            "date_order": datetime(2024, 1, 2, 5, 4, 5, tzinfo=timezone(timedelta(hours=2))),
+            "validity_date": date(2024, 1, 31),
+            "amount": Decimal("12.50"),
+        }], {})
+
+        values = json.loads(payload)["params"]["args"][1]
+        assert values == {
+            "date_order": "2024-01-02 03:04:05",
+            "validity_date": "2024-01-31",
+            "amount": 12.5,
+        }
+
+    @pytest.mark.asyncio
+    async def test_execute_kw_posts_payload(self, base_service):
+        """Test _execute_kw sends the prebuilt payload to call_kw"""
+        from tests.unit.odoo.conftest import create_json_response
+
+        client = AsyncMock()
+        client.post.return_value = create_json_response([1, 2, 3])
+
+        with patch.object(base_service, '_get_client', AsyncMock(return_value=client)):
+            result = await base_service._execute_kw("res.partner", "search", [[]])
+
+        assert result == [1, 2, 3]
+        url = client.post.call_args[0][0]
+        body = json.loads(client.post.call_args[1]['content'])
+        assert url == "https://demo.odoo.com/web/dataset/call_kw"
+        assert body["params"]["method"] == "search"
+        assert body["params"]["kwargs"]["context"]["uid"] == 2
+
+    @pytest.mark.asyncio
+    async def test_services_share_client_and_send_own_session(self, base_service):
+        """Test the pooled client is shared and each service sends its own session"""
+        import httpx
+
+        from app.services.odoo.base import close_shared_client
+        from tests.unit.odoo.conftest import create_json_response
+
+        other = OdooOperationsService(
+            odoo_url="https://demo.odoo.com",
+            database="demo",
+            username="demo",
+            password="demo",
+            session_id="other-session"
+        )
+        other._uid = 3
+        try:
+            shared = await base_service._get_client()
+            assert await other._get_client() is shared
+
+            # Set-Cookie headers from Odoo must not leak into the shared jar
+            request = httpx.Request("POST", "https://demo.odoo.com/web/session/authenticate")
+            shared.cookies.extract_cookies(
+                httpx.Response(200, headers={"Set-Cookie": "session_id=leak"}, request=request)
+            )
+            assert not shared.cookies
+
+            with patch.object(shared, 'post', AsyncMock(return_value=create_json_response(True))) as post:
+                await other._execute_kw("res.partner", "search", [[]])
+
+            assert post.call_args[1]['headers']['Cookie'] == "session_id=other-session"
+        finally:
+            await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_execute_kw_does_not_mutate_caller_context(self, base_service):
+        """Test base context and uid are merged into a copy of the caller's context"""
+        from app.services.odoo.base import EMPTY_DICT
+        from tests.unit.odoo.conftest import create_json_response
+
+        client = AsyncMock()
+        client.post.return_value = create_json_response(True)
+        context = {"active_test": False}
+
+        with patch.object(base_service, '_get_client', AsyncMock(return_value=client)):
+            await base_service._execute_kw("res.partner", "search", [[]], {"context": context})
+            await base_service._execute_kw("res.partner", "search", [[]], EMPTY_DICT)
+
+        body = json.loads(client.post.call_args_list[0][1]['content'])
+        assert body["params"]["kwargs"]["context"]["active_test"] is False
+        assert body["params"]["kwargs"]["context"]["uid"] == 2
+        assert context == {"active_test": False}
+        assert dict(EMPTY_DICT) == {}
+
+    @pytest.mark.asyncio
+    async def test_execute_kw_raises_on_error_response(self, base_service):
+        """Test JSON-RPC errors are decoded and raised as OdooExecutionError"""
+        from app.services.odoo.base import OdooExecutionError
+        from tests.unit.odoo.conftest import create_error_response
+
+        client = AsyncMock()
+        client.post.return_value = create_error_response("Something went wrong")
+
+        with patch.object(base_service, '_get_client', AsyncMock(return_value=client)):
+            with pytest.raises(OdooExecutionError):
+                await base_service._execute_kw("res.partner", "search", [[]])
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_count_cache(self, base_service):
+        """Test a successful write drops cached counts for the model"""
+        from app.services.odoo.cache import count_cache
+        from tests.unit.odoo.conftest import create_json_response
+
+        count_cache.set((base_service._cache_scope, "res.partner", b"d", b"c"), 5)
+        count_cache.set((base_service._cache_scope, "sale.order", b"d", b"c"), 3)
+
+        client = AsyncMock()
+        client.post.return_value = create_json_response(True)
+
+        with patch.object(base_service, '_get_client', AsyncMock(return_value=client)):
+            await base_service._execute_kw("res.partner", "write", [[1], {"name": "X"}])
+
+        assert (base_service._cache_scope, "res.partner", b"d", b"c") not in count_cache
+        assert (base_service._cache_scope, "sale.order", b"d", b"c") in count_cache
+
+    @pytest.mark.asyncio
+    async def test_rpc_semaphore_shared_per_endpoint(self, base_service):
+        """Test services for the same endpoint share one RPC semaphore"""
+        from app.services.odoo.base import _get_rpc_semaphore
+
+        other = OdooOperationsService(
+            odoo_url="https://demo.odoo.com/",
+            database="other",
+            username="user",
+            password="pass"
+        )
+
+        assert _get_rpc_semaphore(base_service.odoo_url) is _get_rpc_semaphore(other.odoo_url)
+        assert _get_rpc_semaphore("https://other.odoo.com") is not _get_rpc_semaphore(
+            base_service.odoo_url
+        )
+
+    def test_rpc_semaphore_per_event_loop(self, monkeypatch):
+        """Test contended endpoint semaphores work from a second event loop"""
+        from app.services.odoo import base
+        from app.services.odoo.base import _get_rpc_semaphore
+
+        monkeypatch.setattr(base.settings, "ODOO_MAX_INFLIGHT", 1)
+
+        async def contend():
+            async def hold():
+                async with _get_rpc_semaphore("https://loops.odoo.com"):
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(hold(), hold())
+            return _get_rpc_semaphore("https://loops.odoo.com")
+
+        results = []
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                results.append(loop.run_until_complete(contend()))
+            finally:
+                loop.close()
+        first, second = results
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_reads_remember_ids_and_unlink_forgets(self, base_service):
+        """Test read results feed the known-ids cache and unlink clears it"""
+        from app.services.odoo.cache import known_ids_cache
+        from tests.unit.odoo.conftest import create_json_response
+
+        scope = base_service._cache_scope
+        client = AsyncMock()
+        client.post.side_effect = [
+            create_json_response([{'id': 4, 'name': 'A'}, {'id': 5, 'name': 'B'}]),
+            create_json_response(True),
+        ]
+
+        with patch.object(base_service, '_get_client', AsyncMock(return_value=client)):
+            await base_service._execute_kw("res.partner", "search_read", [[]])
+            assert (scope, "res.partner", 4) in known_ids_cache
+
+            await base_service._execute_kw("res.partner", "unlink", [[4]])
+
+        assert (scope, "res.partner", 4) not in known_ids_cache
+        assert (scope, "res.partner", 5) in known_ids_cache
@@ -0,0 +1,105 @@
+"""
+Unit tests for Name Operations
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.odoo.name_ops import NameOperations
+
+
+@pytest.fixture
+def name_service():
+    """Create name service instance for testing"""
+    return NameOperations(
+        odoo_url="https://demo.odoo.com",
+        database="demo",
+        username="admin",
+        password="admin"
+    )
+
+
+class TestNameOperations:
+    """Tests for NameOperations class"""
+
+    @pytest.mark.asyncio
+    async def test_name_search_returns_pairs(self, name_service):
+        """Test name_search returns the RPC pairs unchanged"""
+        with patch.object(name_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [[1, 'Ahmed Company'], [5, 'Ahmed Trading']]
+
+            result = await name_service.name_search('res.partner', name='Ahmed')
+
+            assert result == [[1, 'Ahmed Company'], [5, 'Ahmed Trading']]
+            assert mock_execute.call_args[1]['method'] == 'name_search'
+
+    @pytest.mark.asyncio
+    async def test_name_get_reads_display_name(self, name_service):
+        """Test name_get reads display_name instead of calling name_get"""
+        with patch.object(name_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [
+                {'id': 1, 'display_name': 'Company A'},
+                {'id': 2, 'display_name': 'John Doe'}
+            ]
+
+            result = await name_service.name_get('res.partner', [1, 2])
+
+            assert result == [(1, 'Company A'), (2, 'John Doe')]
+            call_args = mock_execute.call_args[1]
+            assert call_args['method'] == 'read'
+            assert call_args['args'] == [[1, 2], ['display_name']]
+
+    @pytest.mark.asyncio
+    async def test_name_get_legacy(self, name_service):
+        """Test use_name_get falls back to the name_get method"""
+        with patch.object(name_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [[1, 'Company A']]
+
+            result = await name_service.name_get('res.partner', [1], use_name_get=True)
+
+            assert result == [[1, 'Company A']]
+            assert mock_execute.call_args[1]['method'] == 'name_get'
+
+    @pytest.mark.asyncio
+    async def test_name_get_empty_ids(self, name_service):
+        """Test name_get skips the RPC for empty ids"""
+        with patch.object(name_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            result = await name_service.name_get('res.partner', [])
+
+            assert result == []
+            mock_execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_display_names(self, name_service):
+        """Test get_display_names maps ids to names"""
+        with patch.object(name_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [
+                {'id': 1, 'display_name': 'Company A'},
+                {'id': 3, 'display_name': 'Jane Smith'}
+            ]
+
+            result = await name_service.get_display_names('res.partner', [1, 3])
+
+            assert result == {1: 'Company A', 3: 'Jane Smith'}
+
+    @pytest.mark.asyncio
+    async def test_name_get_uses_request_cache(self, name_service):
+        """Test names cached in the request scope are not fetched again"""
+        from app.services.odoo.cache import NAME_CACHE
+
+        token = NAME_CACHE.set({})
+        try:
+            with patch.object(name_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+                mock_execute.side_effect = [
+                    [{'id': 1, 'display_name': 'Company A'}],
+                    [{'id': 2, 'display_name': 'John Doe'}],
+                ]
+
+                first = await name_service.name_get('res.partner', [1])
+                second = await name_service.get_display_names('res.partner', [1, 2])
+
+                assert first == [(1, 'Company A')]
+                assert second == {1: 'Company A', 2: 'John Doe'}
+                assert mock_execute.call_args_list[1][1]['args'] == [[2], ['display_name']]
+        finally:
+            NAME_CACHE.reset(token)
@@ -0,0 +1,123 @@
+"""
+Unit tests for Permission Operations
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.core.exceptions import OdooTimeoutException
+from app.services.odoo import permission_ops
+from app.services.odoo.base import OdooExecutionError
+from app.services.odoo.permission_ops import PermissionOperations
+
+
+@pytest.fixture
+def permission_service():
+    """Create permission service instance for testing"""
+    permission_ops._legacy_rule_check_endpoints.clear()
+    permission_ops._no_bulk_permission_endpoints.clear()
+    yield PermissionOperations(
+        odoo_url="https://demo.odoo.com",
+        database="demo",
+        username="admin",
+        password="admin"
+    )
+    permission_ops._legacy_rule_check_endpoints.clear()
+    permission_ops._no_bulk_permission_endpoints.clear()
+
+
+class TestPermissionOperations:
+    """Tests for PermissionOperations class"""
+
+    @pytest.mark.asyncio
+    async def test_check_access_rules_uses_has_access(self, permission_service):
+        """Test record rule checks use the boolean has_access method"""
+        with patch.object(permission_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = False
+
+            result = await permission_service.check_access_rules('sale.order', [1, 2], 'unlink')
+
+            assert result is False
+            assert mock_execute.call_args[1]['method'] == 'has_access'
+            assert mock_execute.call_args[1]['args'] == [[1, 2], 'unlink']
+
+    @pytest.mark.asyncio
+    async def test_check_access_rules_legacy_fallback(self, permission_service):
+        """Test servers without has_access fall back to check_access_rule once"""
+        missing = OdooExecutionError(
+            "The method 'has_access' does not exist",
+            data={"error_type": "method_not_found"}
+        )
+
+        with patch.object(permission_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = [missing, None, None]
+
+            assert await permission_service.check_access_rules('sale.order', [1], 'write') is True
+            assert await permission_service.check_access_rules('sale.order', [1], 'write') is True
+
+            methods = [call[1]['method'] for call in mock_execute.call_args_list]
+            assert methods == ['has_access', 'check_access_rule', 'check_access_rule']
+
+    @pytest.mark.asyncio
+    async def test_get_user_permissions_bulk(self, permission_service):
+        """Test permissions for many models come from one bulk RPC"""
+        expected = {
+            'sale.order': {'create': True, 'read': True, 'write': True, 'unlink': False}
+        }
+
+        with patch.object(permission_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = expected
+
+            result = await permission_service.get_user_permissions(['sale.order'])
+
+            assert result == expected
+            mock_execute.assert_called_once()
+            assert mock_execute.call_args[1]['model'] == 'bridgecore.perms'
+
+    @pytest.mark.asyncio
+    async def test_get_user_permissions_fallback(self, permission_service):
+        """Test endpoints without the bulk helper fan out per model"""
+        async def execute(**kwargs):
+            if kwargs['model'] == 'bridgecore.perms':
+                raise OdooExecutionError(
+                    "Odoo Server Error",
+                    data={"name": "builtins.KeyError", "message": "'bridgecore.perms'"}
+                )
+            return kwargs['args'] != ['unlink']
+
+        with patch.object(permission_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = execute
+
+            result = await permission_service.get_user_permissions(['sale.order', 'res.partner'])
+
+            assert result == {
+                'sale.order': {'create': True, 'read': True, 'write': True, 'unlink': False},
+                'res.partner': {'create': True, 'read': True, 'write': True, 'unlink': False},
+            }
+            assert 'https://demo.odoo.com' in permission_ops._no_bulk_permission_endpoints
+
+    @pytest.mark.asyncio
+    async def test_get_user_permissions_transient_error_keeps_bulk(self, permission_service):
+        """Test timeouts and other server errors do not disable the bulk path"""
+        with patch.object(permission_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = OdooTimeoutException(timeout=30, operation="bridgecore.perms")
+
+            with pytest.raises(OdooTimeoutException):
+                await permission_service.get_user_permissions(['sale.order'])
+
+            mock_execute.side_effect = [OdooExecutionError("Odoo Server Error"), True, True, True, True]
+            result = await permission_service.get_user_permissions(['sale.order'])
+
+            assert result == {'sale.order': {'create': True, 'read': True, 'write': True, 'unlink': True}}
+            assert 'https://demo.odoo.com' not in permission_ops._no_bulk_permission_endpoints
+
+    @pytest.mark.asyncio
+    async def test_get_user_permissions_rejects_non_dict(self, permission_service):
+        """Test a malformed bulk result is an error, not a reason to blacklist"""
+        with patch.object(permission_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [True]
+
+            with pytest.raises(OdooExecutionError):
+                await permission_service.get_user_permissions(['sale.order'])
+
+            assert 'https://demo.odoo.com' not in permission_ops._no_bulk_permission_endpoints
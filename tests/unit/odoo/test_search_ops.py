@@ -1,8 +1,10 @@
 """
 Unit tests for Search Operations
 """
+from unittest.mock import AsyncMock, patch
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+
 from app.services.odoo.search_ops import SearchOperations
 
 
@@ -191,3 +193,67 @@ class TestSearchOperations:
             )
 
             assert result == []
+
+    @pytest.mark.asyncio
+    async def test_search_count_is_cached(self, search_service):
+        """Test repeated search_count calls are served from the cache"""
+        with patch.object(search_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = 7
+
+            first = await search_service.search_count('res.partner', [['active', '=', True]])
+            second = await search_service.search_count('res.partner', [['active', '=', True]])
+
+            assert first == second == 7
+            mock_execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_search_count_cache_bypass(self, search_service):
+        """Test use_cache=False always hits Odoo"""
+        with patch.object(search_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = 7
+
+            await search_service.search_count('res.partner', [], use_cache=False)
+            await search_service.search_count('res.partner', [], use_cache=False)
+
+            assert mock_execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_read_coalesces_concurrent_calls(self, search_service):
+        """Test identical concurrent search_read calls share one RPC"""
+        import asyncio
+
+        async def slow_execute(**kwargs):
+            await asyncio.sleep(0.01)
+            return [{'id': 1, 'name': 'Partner 1'}]
+
+        with patch.object(search_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = slow_execute
+
+            first, second = await asyncio.gather(
+                search_service.search_read('res.partner', [], fields=['name']),
+                search_service.search_read('res.partner', [], fields=['name'])
+            )
+
+            assert first == second == [{'id': 1, 'name': 'Partner 1'}]
+            assert first is not second
+            mock_execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_search_read_batches(self, search_service):
+        """Test iter_search_read pages through records in batches"""
+        with patch.object(search_service, 'search_read', new_callable=AsyncMock) as mock_read:
+            mock_read.side_effect = [
+                [{'id': 1}, {'id': 2}],
+                [{'id': 3}]
+            ]
+
+            records = [r async for r in search_service.iter_search_read('res.partner', batch_size=2)]
+
+            assert records == [{'id': 1}, {'id': 2}, {'id': 3}]
+            assert [c[1]['offset'] for c in mock_read.call_args_list] == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_paginated_search_read_rejects_invalid_page_size(self, search_service):
+        """Test paginated_search_read validates page_size"""
+        with pytest.raises(ValueError):
+            await search_service.paginated_search_read('res.partner', page_size=0)
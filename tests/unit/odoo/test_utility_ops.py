@@ -0,0 +1,134 @@
+"""
+Unit tests for Utility Operations
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.odoo.utility_ops import UtilityOperations
+
+
+@pytest.fixture
+def utility_service():
+    """Create utility service instance for testing"""
+    return UtilityOperations(
+        odoo_url="https://demo.odoo.com",
+        database="demo",
+        username="admin",
+        password="admin"
+    )
+
+
+class TestUtilityOperations:
+    """Tests for UtilityOperations class"""
+
+    @pytest.mark.asyncio
+    async def test_validate_references(self, utility_service):
+        """Test references are classified into valid and invalid"""
+        async def execute(**kwargs):
+            return {'res.partner': [1, 2], 'product.product': [10]}[kwargs['model']]
+
+        with patch.object(utility_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = execute
+
+            result = await utility_service.validate_references([
+                {'model': 'res.partner', 'ids': [1, 2]},
+                {'model': 'product.product', 'ids': [10, 20]}
+            ])
+
+            assert [r['model'] for r in result['valid']] == ['res.partner']
+            assert result['invalid'][0]['missing'] == [20]
+            assert mock_execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_validate_references_fail_fast(self, utility_service):
+        """Test fail_fast stops at the first reference with missing ids"""
+        async def execute(**kwargs):
+            return {'res.partner': [1], 'product.product': [10]}[kwargs['model']]
+
+        with patch.object(utility_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = execute
+
+            result = await utility_service.validate_references([
+                {'model': 'res.partner', 'ids': [1, 2]},
+                {'model': 'product.product', 'ids': [10]}
+            ], fail_fast=True)
+
+            assert result['valid'] == []
+            assert [r['missing'] for r in result['invalid']] == [[2]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_exists_single_are_batched(self, utility_service):
+        """Test concurrent exists_single calls on one model share one RPC"""
+        import asyncio
+
+        with patch.object(utility_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [1, 3]
+
+            results = await asyncio.gather(*[
+                utility_service.exists_single('res.partner', record_id)
+                for record_id in (1, 2, 3)
+            ])
+
+            assert results == [True, False, True]
+            mock_execute.assert_called_once()
+            assert mock_execute.call_args[1]['args'] == [[1, 2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_exists_skips_recently_read_ids(self, utility_service):
+        """Test ids returned by a recent read are known to exist without an RPC"""
+        from app.services.odoo.cache import remember_ids
+
+        remember_ids(utility_service._cache_scope, 'res.partner', [1, 2])
+
+        with patch.object(utility_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = []
+
+            result = await utility_service.exists('res.partner', [1, 2, 3])
+
+            assert result == [1, 2]
+            assert mock_execute.call_args[1]['args'] == [[3]]
+
+    @pytest.mark.asyncio
+    async def test_get_xmlids_batches_and_caches(self, utility_service):
+        """Test concurrent get_xmlid calls share one RPC and are cached both ways"""
+        import asyncio
+
+        with patch.object(utility_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = [
+                {'module': 'base', 'name': 'us', 'res_id': 1},
+                {'module': 'base', 'name': 'ca', 'res_id': 2},
+            ]
+
+            results = await asyncio.gather(*[
+                utility_service.get_xmlid('res.country', record_id)
+                for record_id in (1, 2, 3)
+            ])
+            again = await utility_service.get_xmlids('res.country', [1, 3])
+            resolved = await utility_service.resolve_xmlid('base.ca')
+
+            assert results == ['base.us', 'base.ca', None]
+            assert again == {1: 'base.us', 3: None}
+            assert resolved == ('res.country', 2)
+            mock_execute.assert_called_once()
+            assert mock_execute.call_args[1]['args'] == [[
+                ['model', '=', 'res.country'], ['res_id', 'in', [1, 2, 3]]
+            ]]
+
+    def test_invalidate_and_set_cache_size(self, utility_service):
+        """Test cached ids can be dropped per model and the caches resized"""
+        from app.services.odoo.cache import known_ids_cache, remember_ids
+
+        scope = utility_service._cache_scope
+        remember_ids(scope, 'res.partner', [1, 2, 3])
+        remember_ids(scope, 'sale.order', [1])
+
+        assert utility_service.invalidate('sale.order') == 1
+
+        utility_service.set_cache_size(2)
+        try:
+            assert len(known_ids_cache) == 2
+            assert (scope, 'res.partner', 1) not in known_ids_cache
+            assert known_ids_cache.stats()['evictions'] == 1
+        finally:
+            utility_service.set_cache_size(10000)
@@ -0,0 +1,264 @@
+"""
+Unit tests for View Operations
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.odoo.cache import fields_cache
+from app.services.odoo.view_ops import ViewOperations
+
+
+@pytest.fixture
+def view_service():
+    """Create view service instance for testing"""
+    return ViewOperations(
+        odoo_url="https://demo.odoo.com",
+        database="demo",
+        username="admin",
+        password="admin"
+    )
+
+
+class TestViewOperations:
+    """Tests for ViewOperations class"""
+
+    @pytest.mark.asyncio
+    async def test_fields_get_is_cached(self, view_service):
+        """Test repeated fields_get calls are served from the metadata cache"""
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {'name': {'type': 'char', 'string': 'Name'}}
+
+            first = await view_service.fields_get('res.partner', ['name'], ['type', 'string'])
+            second = await view_service.fields_get('res.partner', ['name'], ['string', 'type'])
+
+            assert first == second == {'name': {'type': 'char', 'string': 'Name'}}
+            mock_execute.assert_called_once()
+            assert fields_cache.stats()['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_fields_get_returns_private_copy(self, view_service):
+        """Test mutating a fields_get result does not change the cached entry"""
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {'name': {'type': 'char', 'string': 'Name'}}
+
+            first = await view_service.fields_get('res.partner')
+            first['name'].pop('string')
+            first['email'] = {'type': 'char'}
+            second = await view_service.fields_get('res.partner')
+
+            assert second == {'name': {'type': 'char', 'string': 'Name'}}
+            mock_execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_fields(self, view_service):
+        """Test invalidate_fields forces the next call back to Odoo"""
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {'name': {'type': 'char'}}
+
+            await view_service.fields_get('res.partner')
+            assert await view_service.invalidate_fields('res.partner') == 1
+            await view_service.fields_get('res.partner')
+
+            assert mock_execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_view_is_cached(self, view_service):
+        """Test repeated get_view calls with the same options hit the view cache"""
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {'arch': '<form/>', 'id': 7}
+
+            first = await view_service.get_view('res.partner', options={'toolbar': True})
+            second = await view_service.get_view('res.partner', options={'toolbar': True})
+            await view_service.get_view('res.partner', view_type='list')
+
+            assert first == second == {'arch': '<form/>', 'id': 7}
+            assert mock_execute.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_view_write_invalidates_view_cache(self, view_service):
+        """Test writing ir.ui.view drops cached views for the instance"""
+        from app.services.odoo.cache import view_cache
+
+        view_cache.set((view_service._cache_scope, 'res.partner', 'get_view', b'k'), {'arch': ''})
+
+        from tests.unit.odoo.conftest import create_json_response
+        client = AsyncMock()
+        client.post.return_value = create_json_response(True)
+        view_service._uid = 2
+        view_service._session_id = "test-session"
+
+        with patch.object(view_service, '_get_client', AsyncMock(return_value=client)):
+            await view_service._execute_kw('ir.ui.view', 'write', [[1], {'arch': '<form/>'}])
+
+        assert len(view_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_view_write_invalidates_disk_cache(self, view_service, tmp_path):
+        """Test a view reloaded after a write is not served stale from disk"""
+        from app.services.odoo import base, view_ops
+        from app.services.odoo.cache import view_cache
+        from app.services.odoo.disk_cache import DiskCache
+        from tests.unit.odoo.conftest import create_json_response
+
+        client = AsyncMock()
+        client.post.side_effect = [
+            create_json_response({'arch': '<form/>', 'id': 7}),
+            create_json_response(True),
+            create_json_response({'arch': '<form><field name="name"/></form>', 'id': 7}),
+        ]
+        view_service._uid = 2
+        view_service._session_id = "test-session"
+        view_service._server_version = "17.0"
+        disk = DiskCache(str(tmp_path))
+
+        with patch.object(view_ops, 'metadata_disk_cache', disk), \
+                patch.object(base, 'metadata_disk_cache', disk), \
+                patch.object(view_service, '_get_client', AsyncMock(return_value=client)):
+            await view_service.get_view('res.partner')
+            await view_service._execute_kw('ir.ui.view', 'write', [[7], {'arch': '<form/>'}])
+            view_cache.clear()
+            reloaded = await view_service.get_view('res.partner')
+
+        assert reloaded['arch'] == '<form><field name="name"/></form>'
+        assert client.post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fields_get_share_one_rpc(self, view_service):
+        """Test concurrent identical fields_get misses are coalesced"""
+        import asyncio
+
+        async def slow_execute(**kwargs):
+            await asyncio.sleep(0.01)
+            return {'name': {'type': 'char'}}
+
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = slow_execute
+
+            results = await asyncio.gather(*[
+                view_service.fields_get('res.partner', ['name']) for _ in range(5)
+            ])
+
+            assert all(r == {'name': {'type': 'char'}} for r in results)
+            mock_execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fields_get_served_from_disk_cache(self, view_service, tmp_path):
+        """Test a fresh memory cache is filled from the persistent cache"""
+        from app.services.odoo import view_ops
+        from app.services.odoo.cache import fields_cache
+        from app.services.odoo.disk_cache import DiskCache
+
+        view_service._uid = 2
+        view_service._session_id = "test-session"
+        view_service._server_version = "17.0"
+        disk = DiskCache(str(tmp_path))
+
+        with patch.object(view_ops, 'metadata_disk_cache', disk), \
+                patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {'name': {'type': 'char'}}
+
+            first = await view_service.fields_get('res.partner', ['name'])
+            fields_cache.clear()
+            second = await view_service.fields_get('res.partner', ['name'])
+
+            assert first == second == {'name': {'type': 'char'}}
+            mock_execute.assert_called_once()
+
+            await view_service.invalidate_fields('res.partner')
+            await view_service.fields_get('res.partner', ['name'])
+            assert mock_execute.call_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_fields_get_many(self, view_service):
+        """Test fields_get_many returns one result per request, in order"""
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = [{'name': {'type': 'char'}}, {'amount': {'type': 'float'}}]
+
+            result = await view_service.fields_get_many([
+                {'model': 'res.partner'},
+                {'model': 'sale.order'},
+            ])
+
+            assert result == [{'name': {'type': 'char'}}, {'amount': {'type': 'float'}}]
+            assert [c[1]['model'] for c in mock_execute.call_args_list] == ['res.partner', 'sale.order']
+
+    @pytest.mark.asyncio
+    async def test_field_lookups_share_one_model_fetch(self, view_service):
+        """Test get_field_info and get_selection_values reuse one fields_get"""
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {
+                'name': {'type': 'char'},
+                'state': {'type': 'selection', 'selection': [['draft', 'Quotation']]},
+            }
+
+            await view_service.prefetch_models(['sale.order'])
+            info = await view_service.get_field_info('sale.order', 'name')
+            states = await view_service.get_selection_values('sale.order', 'state')
+
+            assert info == {'type': 'char'}
+            assert states == [['draft', 'Quotation']]
+            mock_execute.assert_called_once()
+
+            info['type'] = 'text'
+            states[0][1] = 'Draft'
+            assert await view_service.get_field_info('sale.order', 'name') == {'type': 'char'}
+            assert await view_service.get_selection_values('sale.order', 'state') == [['draft', 'Quotation']]
+
+    @pytest.mark.asyncio
+    async def test_field_lookup_without_prefetch_requests_one_field(self, view_service):
+        """Test get_field_info only fetches the requested field when the model is not cached"""
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {'name': {'type': 'char'}}
+
+            info = await view_service.get_field_info('res.partner', 'name')
+
+            assert info == {'type': 'char'}
+            assert mock_execute.call_args.kwargs['kwargs'] == {'allfields': ['name']}
+
+    @pytest.mark.asyncio
+    async def test_cached_view_returns_private_copy(self, view_service):
+        """Test mutating a get_view result does not change the cached view"""
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {'arch': '<form/>', 'models': {'res.partner': ['name']}}
+
+            first = await view_service.get_view('res.partner')
+            first['models']['res.partner'].append('email')
+            second = await view_service.get_view('res.partner')
+
+            assert second == {'arch': '<form/>', 'models': {'res.partner': ['name']}}
+            mock_execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("server_version, method", [
+        ("17.0+e", "get_view"),
+        ("saas~16.3", "get_view"),
+        ("15.0", "fields_view_get"),
+    ])
+    async def test_get_view_compat_dispatches_on_version(self, view_service, server_version, method):
+        """Test get_view_compat picks the view method the server supports"""
+        view_service._uid = 2
+        view_service._session_id = "test-session"
+        view_service._server_version = server_version
+
+        with patch.object(view_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.return_value = {'arch': '<form/>'}
+
+            await view_service.get_view_compat('res.partner', options={'toolbar': True})
+
+            assert mock_execute.call_args[1]['method'] == method
+
+class TestDiskCache:
+    """Tests for the persistent metadata cache"""
+
+    def test_round_trip_and_expiry(self, tmp_path):
+        """Test values survive a reopen and expire after the TTL"""
+        from app.services.odoo.disk_cache import DiskCache, disk_key
+
+        key = disk_key("17.0", ("scope", "res.partner", "fields_get"))
+        DiskCache(str(tmp_path)).set("scope", "res.partner", key, {'name': {'type': 'char'}})
+
+        assert DiskCache(str(tmp_path)).get(key) == {'name': {'type': 'char'}}
+        assert DiskCache(str(tmp_path), ttl=0).get(key) is None
+        assert DiskCache(str(tmp_path)).get(disk_key("18.0", ("scope", "res.partner", "fields_get"))) is None
@@ -0,0 +1,81 @@
+"""
+Unit tests for Web Operations
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.odoo.web_ops import WebOperations
+
+
+@pytest.fixture
+def web_service():
+    """Create web service instance for testing"""
+    return WebOperations(
+        odoo_url="https://demo.odoo.com",
+        database="demo",
+        username="admin",
+        password="admin"
+    )
+
+
+class TestWebOperations:
+    """Tests for WebOperations class"""
+
+    @pytest.mark.asyncio
+    async def test_web_read_many(self, web_service):
+        """Test web_read_many returns one result per request, in order"""
+        with patch.object(web_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = [[{'id': 1, 'name': 'SO001'}], [{'id': 7, 'email': 'a@b.c'}]]
+
+            result = await web_service.web_read_many([
+                {'model': 'sale.order', 'ids': [1], 'specification': {'name': {}}},
+                {'model': 'res.partner', 'ids': [7], 'specification': {'email': {}}},
+            ])
+
+            assert result == [[{'id': 1, 'name': 'SO001'}], [{'id': 7, 'email': 'a@b.c'}]]
+
+    @pytest.mark.asyncio
+    async def test_iter_web_search_read_fetches_all_pages_in_order(self, web_service):
+        """Test iter_web_search_read walks every page and keeps page order"""
+        import asyncio
+
+        async def fake_execute(**kwargs):
+            offset = kwargs['kwargs']['offset']
+            # Later pages answer first
+            await asyncio.sleep(0.001 * (10 - offset))
+            ids = range(offset + 1, min(offset + 2, 5) + 1)
+            return {'records': [{'id': i} for i in ids], 'length': 5}
+
+        with patch.object(web_service, '_execute_kw', new_callable=AsyncMock) as mock_execute:
+            mock_execute.side_effect = fake_execute
+
+            records = [
+                record async for record in web_service.iter_web_search_read(
+                    'res.partner', page_size=2, concurrency=2
+                )
+            ]
+
+            assert [r['id'] for r in records] == [1, 2, 3, 4, 5]
+            assert mock_execute.call_count == 3
+
+    def test_build_specification(self, web_service):
+        """Test build_specification produces plain and nested field entries"""
+        spec = web_service.build_specification(
+            fields=['name', 'amount_total'],
+            relations={'partner_id': ['name', 'email']}
+        )
+
+        assert spec == {
+            'name': {},
+            'amount_total': {},
+            'partner_id': {'fields': {'name': {}, 'email': {}}}
+        }
+
+    def test_build_specification_entries_are_independent(self, web_service):
+        """Test nesting into one field entry leaves other fields and calls untouched"""
+        spec = web_service.build_specification(fields=['name', 'partner_id'])
+        spec['partner_id']['fields'] = {'name': {}}
+
+        assert spec['name'] == {}
+        assert web_service.build_specification(fields=['name']) == {'name': {}}
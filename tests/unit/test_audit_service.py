@@ -0,0 +1,240 @@
+"""
+Audit service tests
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.models.audit_log import AuditLog
+from app.services import audit_service as audit_service_module
+from app.services.audit_service import (
+    AuditBatcher,
+    AuditService,
+    audit_row_hash,
+    verify_audit_chain,
+)
+
+
+def _session_factory(batches, fail=lambda rows: False):
+    """Session factory recording the rows of every bulk insert; fail(rows) makes an insert raise"""
+    @asynccontextmanager
+    async def factory():
+        session = MagicMock()
+
+        async def execute(stmt, rows=None):
+            if rows is None:
+                # Chain lock and last chain hash lookup
+                return MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+            if fail(rows):
+                raise ConnectionError("database unavailable")
+            batches.append([{k: v for k, v in row.items() if k not in ("prev_hash", "hash")} for row in rows])
+
+        session.execute = execute
+        session.commit = AsyncMock()
+        yield session
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_batcher_writes_full_batches():
+    """Test rows are written in batches of max_batch"""
+    batches = []
+    batcher = AuditBatcher(max_batch=2, interval=60, session_factory=_session_factory(batches))
+    batcher.start()
+
+    for i in range(5):
+        assert batcher.enqueue({"action": "read", "record_id": str(i)})
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    await batcher.stop()
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [row["record_id"] for batch in batches for row in batch] == ["0", "1", "2", "3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_on_interval():
+    """Test a partial batch is written after the interval"""
+    batches = []
+    batcher = AuditBatcher(max_batch=100, interval=0.01, session_factory=_session_factory(batches))
+    batcher.start()
+
+    batcher.enqueue({"action": "create"})
+    await asyncio.sleep(0.05)
+
+    assert batches == [[{"action": "create"}]]
+    await batcher.stop()
+
+
+@pytest.mark.asyncio
+async def test_batcher_retries_failed_batch(monkeypatch):
+    """Test a batch that fails transiently is retried instead of dropped"""
+    monkeypatch.setattr(audit_service_module, "AUDIT_RETRY_BACKOFF", 0)
+    batches = []
+    failures = iter([True, False])
+    batcher = AuditBatcher(session_factory=_session_factory(batches, fail=lambda rows: next(failures)))
+
+    await batcher._write([{"action": "create"}, {"action": "update"}])
+
+    assert batches == [[{"action": "create"}, {"action": "update"}]]
+
+
+@pytest.mark.asyncio
+async def test_batcher_isolates_rows_that_keep_failing(monkeypatch):
+    """Test a batch that keeps failing is written row by row and losses are counted"""
+    monkeypatch.setattr(audit_service_module, "AUDIT_RETRY_BACKOFF", 0)
+    lost = MagicMock()
+    monkeypatch.setattr(audit_service_module, "record_audit_entries_lost", lost)
+    batches = []
+    factory = _session_factory(batches, fail=lambda rows: any(row["action"] == "bad" for row in rows))
+    batcher = AuditBatcher(session_factory=factory)
+
+    await batcher._write([{"action": "create"}, {"action": "bad"}, {"action": "update"}])
+
+    assert batches == [[{"action": "create"}], [{"action": "update"}]]
+    lost.assert_called_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_operation_without_batcher_logs_directly():
+    """Test operations are written at once when no batcher runs"""
+    repo = MagicMock()
+    repo.create = AsyncMock()
+    repo.lock_chain_head = AsyncMock(return_value=None)
+    service = AuditService(repo, batcher=AuditBatcher())
+
+    await service.enqueue_operation(user_id=1, system_id=None, action="delete", model="res.partner")
+
+    repo.create.assert_awaited_once()
+    assert repo.create.await_args.args[0].action == "delete"
+    # Direct writes stay off the chain lock
+    repo.lock_chain_head.assert_not_awaited()
+    assert repo.create.await_args.args[0].hash is None
+
+
+def test_is_enabled():
+    """Test actions and models are filtered by the configured sets"""
+    service = AuditService(MagicMock())
+    service.enabled_actions = frozenset({"create", "update"})
+    service.excluded_models = frozenset({"bus.bus"})
+
+    assert service.is_enabled("create", "res.partner")
+    assert not service.is_enabled("read", "res.partner")
+    assert not service.is_enabled("update", "bus.bus")
+
+
+@pytest.mark.asyncio
+async def test_system_service_bypass_audit():
+    """Test bypass_audit skips the audit trail"""
+    from app.services.system_service import SystemService
+
+    audit = MagicMock()
+    audit.is_enabled = MagicMock(return_value=True)
+    audit.enqueue_operation = AsyncMock()
+    service = SystemService(MagicMock(), audit)
+    adapter = MagicMock()
+    adapter.create = AsyncMock(return_value=42)
+    service.adapters["odoo"] = adapter
+
+    await service.create_record(1, "odoo", "res.partner", {"name": "A"}, bypass_audit=True)
+    audit.enqueue_operation.assert_not_awaited()
+
+    await service.create_record(1, "odoo", "res.partner", {"name": "A"})
+    audit.enqueue_operation.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_bulk_log_operations_hash_chain():
+    """Test batches extend the stored hash chain and tampering breaks it"""
+    repo = MagicMock()
+    repo.lock_chain_head = AsyncMock(return_value="ab" * 32)
+    repo.insert_many = AsyncMock()
+    service = AuditService(repo)
+    rows = [
+        {"user_id": 1, "action": "create", "status": "success", "request_data": {"name": "A"}},
+        {"user_id": 1, "action": "delete", "status": "error", "error_message": "boom"},
+    ]
+
+    await service.bulk_log_operations(rows)
+
+    assert rows[0]["prev_hash"] == "ab" * 32
+    assert rows[1]["prev_hash"] == rows[0]["hash"]
+    assert len(rows[1]["hash"]) == 64
+    entries = [AuditLog(id=i, **row) for i, row in enumerate(rows, start=1)]
+    assert verify_audit_chain(entries) is None
+
+    entries[0].request_data = {"name": "B"}
+    assert verify_audit_chain(entries) == 1
+
+
+def test_verify_audit_chain_skips_unchained_entries():
+    """Test rows written directly by log_operation do not break the chain"""
+    first = {"user_id": 1, "action": "create", "prev_hash": None}
+    first["hash"] = audit_row_hash(None, first)
+    second = {"user_id": 1, "action": "write", "prev_hash": first["hash"]}
+    second["hash"] = audit_row_hash(first["hash"], second)
+    entries = [
+        AuditLog(id=1, **first),
+        AuditLog(id=2, user_id=2, action="read"),
+        AuditLog(id=3, **second),
+    ]
+
+    assert verify_audit_chain(entries) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_log_operations_thaws_payload_views():
+    """Test read-only request payload views are stored and hashed as dicts"""
+    repo = MagicMock()
+    repo.lock_chain_head = AsyncMock(return_value=None)
+    repo.insert_many = AsyncMock()
+    service = AuditService(repo)
+    rows = [{"user_id": 1, "action": "create", "request_data": MappingProxyType({"name": "A"})}]
+
+    await service.bulk_log_operations(rows)
+
+    stored = repo.insert_many.await_args.args[0][0]
+    assert isinstance(stored["request_data"], dict)
+    assert stored["hash"] == audit_row_hash(None, {"user_id": 1, "action": "create", "request_data": {"name": "A"}})
+
+
+@pytest.mark.asyncio
+async def test_lock_chain_head_locks_before_reading():
+    """Test the chain head is read after taking the transaction advisory lock"""
+    from app.repositories.audit_repository import AUDIT_CHAIN_LOCK_ID, AuditRepository
+
+    statements = []
+
+    async def execute(stmt):
+        statements.append(str(stmt.compile(compile_kwargs={"literal_binds": True})))
+        return MagicMock(scalar_one_or_none=MagicMock(return_value="ab" * 32))
+
+    session = MagicMock(execute=execute)
+    session.bind.dialect.name = "postgresql"
+    repo = AuditRepository(session)
+
+    assert await repo.lock_chain_head() == "ab" * 32
+    assert statements[0] == f"SELECT pg_advisory_xact_lock({AUDIT_CHAIN_LOCK_ID}) AS pg_advisory_xact_lock_1"
+    assert "audit_logs.hash IS NOT NULL" in statements[1]
+
+
+@pytest.mark.asyncio
+async def test_lock_chain_head_without_postgres_skips_lock():
+    """Test other databases read the chain head without an advisory lock"""
+    from app.repositories.audit_repository import AuditRepository
+
+    statements = []
+
+    async def execute(stmt):
+        statements.append(str(stmt.compile(compile_kwargs={"literal_binds": True})))
+        return MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+
+    session = MagicMock(execute=execute)
+    session.bind.dialect.name = "sqlite"
+
+    assert await AuditRepository(session).lock_chain_head() is None
+    assert len(statements) == 1
+    assert "pg_advisory_xact_lock" not in statements[0]
@@ -79,3 +79,23 @@ async def test_smart_fallback():
     fallback_value = service._apply_fallback(data, "name")
 
     assert fallback_value == "Ahmed Ali"
+
+
+@pytest.mark.asyncio
+async def test_transform_batch_to_universal():
+    """Test batch transformation matches per-record transformation"""
+    service = FieldMappingService()
+    service.add_custom_mapping("odoo", "17.0", "res.partner", {"name": "name", "mobile": "phone"})
+
+    records = [
+        {"id": 1, "name": "Ahmed Ali", "mobile": "+966501234567"},
+        {"id": 2, "name": "Sara", "mobile": False, "phone_primary": "+966509876543"},
+    ]
+
+    universal = await service.transform_batch_to_universal(records, "odoo", "17.0", "res.partner")
+
+    assert universal == [
+        await service.transform_to_universal(record, "odoo", "17.0", "res.partner")
+        for record in records
+    ]
+    assert universal[1] == {"name": "Sara", "phone": "+966509876543"}
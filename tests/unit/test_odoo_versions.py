@@ -0,0 +1,32 @@
+"""
+Odoo version rules tests
+"""
+from app.services.odoo_versions import Rule, get_migration_path, get_rules
+
+
+def test_migration_path():
+    """Test migration path covers every intermediate version"""
+    assert get_migration_path("13.0", "16.0") == ("13.0", "14.0", "15.0", "16.0")
+    assert get_migration_path("17.0", "17.0") == ("17.0",)
+
+
+def test_migration_path_invalid():
+    """Test downgrades and unknown versions give an empty path"""
+    assert get_migration_path("19.0", "13.0") == ()
+    assert get_migration_path("12.0", "13.0") == ()
+
+
+def test_get_rules():
+    """Test rules are found per (model, from, to) and missing steps are empty"""
+    assert get_rules("account.move", "13.0", "19.0")["invoice_origin"].rename_to == "ref"
+    assert get_rules("res.partner", "14.0", "15.0") == {}
+    assert get_rules("unknown.model", "13.0", "14.0") == {}
+
+
+def test_rules_are_named_tuples():
+    """Test rule dicts are turned into Rule tuples with defaults"""
+    rule = get_rules("res.partner", "15.0", "16.0")["customer"]
+
+    assert isinstance(rule, Rule)
+    assert rule.removed is True
+    assert rule.rename_to is None and rule.value_mapping is None
@@ -0,0 +1,126 @@
+"""
+Query optimizer tests
+"""
+import sys
+
+from app.services.query_optimizer import QueryOptimizer
+
+
+def test_optimize_fields_without_relations_returns_input():
+    """Test fields without known relations are returned as-is"""
+    fields = ['id', 'name', 'email']
+
+    assert QueryOptimizer.optimize_fields('res.partner', fields) is fields
+
+
+def test_optimize_fields_expands_relations_in_order():
+    """Test relation fields are expanded after the requested fields"""
+    result = QueryOptimizer.optimize_fields('sale.order', ['name', 'partner_id', 'partner_id.name'])
+
+    assert result == [
+        'name', 'partner_id', 'partner_id.name',
+        'partner_id.email', 'partner_id.phone', 'partner_id.vat'
+    ]
+
+
+def test_optimize_domain_puts_indexed_criteria_first():
+    """Test indexed criteria are moved ahead of other criteria"""
+    domain = [('name', 'ilike', 'test'), ('email', '!=', False), ('id', '>', 100)]
+
+    assert QueryOptimizer.optimize_domain(domain) == [
+        ('name', 'ilike', 'test'), ('id', '>', 100), ('email', '!=', False)
+    ]
+    assert QueryOptimizer.optimize_domain([('email', '!=', False)]) == [('email', '!=', False)]
+
+
+def test_optimize_domain_returns_ordered_domain_unchanged():
+    """Test an already ordered domain is returned without rebuilding it"""
+    domain = ['|', ('id', '>', 100), ('state', '=', 'sale'), ('email', '!=', False)]
+
+    assert QueryOptimizer.optimize_domain(domain) is domain
+
+
+def test_optimize_domain_leaves_operator_domains_unchanged():
+    """Test domains with '|', '&' or '!' are not reordered"""
+    domain = ['|', ('email', '!=', False), ('name', 'ilike', 'test'), ('id', '>', 100)]
+
+    assert QueryOptimizer.optimize_domain(domain) is domain
+
+
+def test_generate_cache_key_is_stable():
+    """Test equal parameters in any order give the same key"""
+    first = QueryOptimizer.generate_cache_key('s1', 'search_read', 'res.partner', limit=5, domain='[]')
+    second = QueryOptimizer.generate_cache_key('s1', 'search_read', 'res.partner', domain='[]', limit=5)
+    other = QueryOptimizer.generate_cache_key('s1', 'search_read', 'res.partner', domain='[]', limit=6)
+
+    assert first == second != other
+    assert first.startswith('odoo:s1:search_read:res.partner:')
+    assert len(first.rsplit(':', 1)[1]) == 16
+
+
+def test_generate_cache_key_unhashable_kwargs():
+    """Test unhashable parameters bypass memoization but give the same key"""
+    listed = QueryOptimizer.generate_cache_key('s1', 'read', 'res.partner', ids=[1, 2])
+    again = QueryOptimizer.generate_cache_key('s1', 'read', 'res.partner', ids=[1, 2])
+    hashable = QueryOptimizer.generate_cache_key('s1', 'read', 'res.partner', ids=(1, 2))
+
+    assert listed == again == hashable
+
+
+def test_generate_cache_key_distinguishes_equal_scalars():
+    """Test True, 1 and 1.0 get distinct keys whatever the call order"""
+    keys = [
+        QueryOptimizer.generate_cache_key('s1', 'read', 'res.partner', active=value)
+        for value in (True, 1, 1.0, 1, True)
+    ]
+    nested = [
+        QueryOptimizer.generate_cache_key('s1', 'read', 'res.partner', ids=value)
+        for value in ((True,), (1,))
+    ]
+
+    assert len(set(keys[:3])) == 3
+    assert keys[3:] == [keys[1], keys[0]]
+    assert nested[0] != nested[1]
+
+
+def test_get_invalidation_patterns():
+    """Test patterns cover every cached operation and are reused"""
+    patterns = QueryOptimizer.get_invalidation_patterns('s1', 'product.product', 'write')
+
+    assert 'odoo:s1:search_read:product.product:*' in patterns
+    assert 'odoo:s1:web_read:product.product:*' in patterns
+    assert len(patterns) == 8
+    assert QueryOptimizer.get_invalidation_patterns('s1', 'product.product', 'unlink') is patterns
+
+
+def test_optimize_order():
+    """Test order clauses are normalized without changing the sort"""
+    assert QueryOptimizer.optimize_order(None, 'res.partner') == "id DESC"
+    assert QueryOptimizer.optimize_order("name  asc,id desc, name", 'res.partner') == "name ASC, id DESC"
+    assert QueryOptimizer.optimize_order("date_order desc nulls last", 'sale.order') == "date_order DESC NULLS LAST"
+
+
+def test_generate_cache_keys_batch():
+    """Test batched keys match single key generation"""
+    params = [{'ids': '[1]', 'limit': 5}, {'ids': '[2]', 'limit': 5}]
+
+    keys = QueryOptimizer.generate_cache_keys_batch('s1', 'read', 'res.partner', params)
+
+    assert keys == [QueryOptimizer.generate_cache_key('s1', 'read', 'res.partner', **p) for p in params]
+    assert keys[0] != keys[1]
+
+
+def test_should_cache_and_ttl():
+    """Test cacheable operations and their TTLs"""
+    assert QueryOptimizer.should_cache('search_read')
+    assert not QueryOptimizer.should_cache('write')
+    assert QueryOptimizer.get_cache_ttl('fields_get') == 3600
+    assert QueryOptimizer.get_cache_ttl('unknown') == 300
+
+
+def test_relation_fields_interned():
+    """Test relation expansions are interned tuples"""
+    related = QueryOptimizer.RELATION_FIELDS['partner_id']
+
+    assert isinstance(related, tuple)
+    assert related[0] is sys.intern('partner_id.name')
@@ -0,0 +1,157 @@
+"""
+Tests for report exports
+"""
+import io
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import openpyxl
+import pytest
+
+from app.services.report_service import REPORT_CHUNK_SIZE, WIDTH_SAMPLE_ROWS, ReportService
+
+RECORDS = [
+    {"name": "Ahmed", "email": "ahmed@example.com", "create_date": datetime(2024, 1, 2, 3, 4, 5)},
+    {"name": "Sara", "email": None, "create_date": datetime(2024, 6, 7, 8, 9, 10)},
+]
+
+
+@pytest.mark.asyncio
+async def test_export_to_excel():
+    """Test headers, values and datetime formatting of Excel exports"""
+    content = await ReportService().export_to_excel(RECORDS)
+
+    ws = openpyxl.load_workbook(io.BytesIO(content)).active
+    rows = list(ws.values)
+
+    assert ws.title == "Export"
+    assert rows[0] == ("name", "email", "create_date")
+    assert rows[1] == ("Ahmed", "ahmed@example.com", "2024-01-02 03:04:05")
+    assert rows[2] == ("Sara", None, "2024-06-07 08:09:10")
+    assert ws["A1"].font.bold
+    assert ws.column_dimensions["B"].width == len("ahmed@example.com") + 2
+
+
+@pytest.mark.asyncio
+async def test_export_to_excel_datetime_after_sample():
+    """Test datetimes first seen after the sampled rows are formatted too"""
+    records = [{"name": f"r{i}", "write_date": None} for i in range(WIDTH_SAMPLE_ROWS)]
+    records.append({"name": "late", "write_date": datetime(2024, 1, 2, 3, 4, 5)})
+
+    content = await ReportService().export_to_excel(records)
+
+    rows = list(openpyxl.load_workbook(io.BytesIO(content)).active.values)
+    assert rows[-1] == ("late", "2024-01-02 03:04:05")
+
+
+@pytest.mark.asyncio
+async def test_export_to_excel_empty():
+    """Test empty exports return no content"""
+    assert await ReportService().export_to_excel([]) == b""
+
+
+@pytest.mark.asyncio
+async def test_export_to_csv():
+    """Test CSV exports keep the header order and format datetimes"""
+    content = await ReportService().export_to_csv(RECORDS + [{"name": "Omar"}])
+
+    assert content.decode('utf-8').splitlines() == [
+        "name,email,create_date",
+        "Ahmed,ahmed@example.com,2024-01-02 03:04:05",
+        "Sara,,2024-06-07 08:09:10",
+        "Omar,,",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_to_parquet():
+    """Test Parquet exports turn Odoo empty values into nulls"""
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    records = [
+        {"name": "Ahmed", "country_id": [1, "Morocco"], "is_company": False},
+        {"name": "Sara", "country_id": False, "is_company": True},
+    ]
+    content = await ReportService().export_to_parquet(records)
+
+    table = pq.read_table(pa.BufferReader(content))
+    assert table.to_pydict() == {
+        "name": ["Ahmed", "Sara"],
+        "country_id": ["[1, 'Morocco']", None],
+        "is_company": [False, True],
+    }
+
+
+def _pdf(pages: int) -> bytes:
+    """Build a blank PDF with the given number of pages"""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=72, height=72)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_generate_report_single_call():
+    """Test small reports are rendered in one call"""
+    adapter = MagicMock()
+    adapter.call_method = AsyncMock(return_value=(b"%PDF-1.4", "pdf"))
+
+    content = await ReportService().generate_report(
+        adapter, "sale.report_saleorder", "sale.order", [1, 2, 3]
+    )
+
+    assert content == b"%PDF-1.4"
+    adapter.call_method.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_generate_report_chunks():
+    """Test large reports are rendered per chunk and merged"""
+    pytest.importorskip("pypdf")
+    from pypdf import PdfReader
+
+    adapter = MagicMock()
+    adapter.call_method = AsyncMock(side_effect=lambda **kwargs: (_pdf(1), "pdf"))
+    record_ids = list(range(1, REPORT_CHUNK_SIZE * 2 + 2))
+
+    content = await ReportService().generate_report(
+        adapter, "sale.report_saleorder", "sale.order", record_ids
+    )
+
+    assert adapter.call_method.await_count == 3
+    chunks = [call.kwargs["args"][1] for call in adapter.call_method.await_args_list]
+    assert sorted(i for chunk in chunks for i in chunk) == record_ids
+    assert len(PdfReader(io.BytesIO(content)).pages) == 3
+
+
+@pytest.mark.asyncio
+async def test_generate_sales_report_pdf_searches_ids():
+    """Test the PDF sales report fetches ids only"""
+    adapter = MagicMock()
+    adapter.search_read = AsyncMock()
+    adapter.call_method = AsyncMock(side_effect=[[7, 8], (b"%PDF-1.4", "pdf")])
+
+    content = await ReportService().generate_sales_report(
+        adapter, datetime(2024, 1, 1), datetime(2024, 12, 31), format='pdf'
+    )
+
+    assert content == b"%PDF-1.4"
+    adapter.search_read.assert_not_awaited()
+    search, render = adapter.call_method.await_args_list
+    assert search.kwargs["method"] == "search"
+    assert render.kwargs["args"] == ["sale.report_saleorder", [7, 8]]
+
+
+@pytest.mark.asyncio
+async def test_generate_report_unsupported_adapter():
+    """Test adapters without call_method are rejected"""
+    class FileAdapter:
+        pass
+
+    with pytest.raises(NotImplementedError):
+        await ReportService().generate_report(FileAdapter(), "sale.report_saleorder", "sale.order", [1])
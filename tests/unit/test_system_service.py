@@ -0,0 +1,214 @@
+"""
+System service tests
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.system_service import SystemService, _read_cache_key
+
+
+def test_read_cache_key():
+    """Test read cache keys are fixed-length and keep the model prefix"""
+    key = _read_cache_key("odoo", "res.partner", [["name", "=", "A"]], ["name"], 10, 0, None)
+
+    assert key.startswith("read:odoo:res.partner:")
+    assert len(key.rsplit(":", 1)[1]) == 32
+    assert key == _read_cache_key("odoo", "res.partner", [["name", "=", "A"]], ["name"], 10, 0, None)
+    assert key != _read_cache_key("odoo", "res.partner", [["name", "=", "A"]], ["name"], 10, 0, "id desc")
+
+
+@pytest.mark.asyncio
+async def test_update_record_invalidates_model_tag():
+    """Test writes invalidate the cached reads of the model by tag"""
+    cache = MagicMock()
+    cache.invalidate_tag = AsyncMock(return_value=3)
+    audit = MagicMock()
+    audit.is_enabled = MagicMock(return_value=False)
+    service = SystemService(cache, audit)
+    adapter = MagicMock()
+    adapter.write = AsyncMock(return_value=True)
+    service.adapters["odoo"] = adapter
+
+    await service.update_record(1, "odoo", "res.partner", 7, {"name": "B"})
+
+    cache.invalidate_tag.assert_awaited_once_with("model:odoo:res.partner")
+
+
+def test_get_adapter_registry(monkeypatch):
+    """Test adapters are dispatched by lower-case system type"""
+    monkeypatch.setattr(SystemService, "_ADAPTERS", dict(SystemService._ADAPTERS))
+    adapter_cls = MagicMock()
+    SystemService.register_adapter("SAP", adapter_cls)
+    service = SystemService(MagicMock(), MagicMock())
+
+    assert service._get_adapter("Sap", {"url": "x"}) is adapter_cls.return_value
+    adapter_cls.assert_called_once_with({"url": "x"})
+    with pytest.raises(ValueError):
+        service._get_adapter("salesforce", {})
+
+
+@pytest.mark.asyncio
+async def test_system_db_id_recorded_on_connect(monkeypatch):
+    """Test audit entries use the database ID recorded by connect_system"""
+    adapter = MagicMock()
+    adapter.connect = AsyncMock()
+    adapter.disconnect = AsyncMock()
+    adapter.create = AsyncMock(side_effect=RuntimeError("boom"))
+    monkeypatch.setattr(SystemService, "_ADAPTERS", {"odoo": MagicMock(return_value=adapter)})
+    audit = MagicMock()
+    audit.is_enabled = MagicMock(return_value=True)
+    audit.enqueue_operation = AsyncMock()
+    service = SystemService(MagicMock(), audit)
+
+    await service.connect_system("odoo-prod", "odoo", {"url": "x"}, db_id=42)
+    with pytest.raises(RuntimeError):
+        await service.create_record(1, "odoo-prod", "res.partner", {"name": "A"})
+
+    assert audit.enqueue_operation.await_args.kwargs["system_id"] == 42
+    await service.disconnect_system("odoo-prod")
+    assert service._get_system_db_id("odoo-prod") is None
+
+
+@pytest.mark.asyncio
+async def test_audit_ctx_shared_fields():
+    """Test success entries carry the shared audit fields and bypass skips them"""
+    audit = MagicMock()
+    audit.is_enabled = MagicMock(return_value=True)
+    audit.enqueue_operation = AsyncMock()
+    service = SystemService(MagicMock(), audit)
+    adapter = MagicMock()
+    adapter.create = AsyncMock(return_value=9)
+    service.adapters["odoo"] = adapter
+
+    await service.create_record(1, "odoo", "res.partner", {"name": "A"}, ip_address="10.0.0.1")
+    await service.create_record(1, "odoo", "res.partner", {"name": "B"}, bypass_audit=True)
+
+    kwargs = audit.enqueue_operation.await_args.kwargs
+    audit.enqueue_operation.assert_awaited_once()
+    assert kwargs["action"] == "create"
+    assert kwargs["record_id"] == "9"
+    assert kwargs["status"] == "success"
+    assert kwargs["ip_address"] == "10.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_read_records_single_flight():
+    """Test concurrent cache misses share one adapter call, including its errors"""
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set_tagged = AsyncMock(return_value=True)
+    audit = MagicMock()
+    audit.is_enabled = MagicMock(return_value=False)
+    service = SystemService(cache, audit)
+    release = asyncio.Event()
+
+    async def search_read(**kwargs):
+        await release.wait()
+        return [{"id": 1}]
+
+    adapter = MagicMock()
+    adapter.search_read = AsyncMock(side_effect=search_read)
+    service.adapters["odoo"] = adapter
+
+    reads = [asyncio.create_task(service.read_records(1, "odoo", "res.partner")) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*reads)
+    assert results == [[{"id": 1}]] * 5
+    # Each caller can post-process its records without affecting the others
+    assert len({id(records) for records in results}) == 5
+    assert len({id(records[0]) for records in results}) == 5
+    adapter.search_read.assert_awaited_once()
+    cache.set_tagged.assert_awaited_once()
+    assert len(service._inflight) == 0
+
+    adapter.search_read = AsyncMock(side_effect=RuntimeError("boom"))
+    results = await asyncio.gather(
+        *(service.read_records(1, "odoo", "res.partner") for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(service._inflight) == 0
+
+
+@pytest.mark.asyncio
+async def test_read_records_single_flight_survives_leader_cancellation():
+    """Test cancelling the first caller does not cancel the read for the others"""
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set_tagged = AsyncMock(return_value=True)
+    audit = MagicMock()
+    audit.is_enabled = MagicMock(return_value=False)
+    service = SystemService(cache, audit)
+    release = asyncio.Event()
+
+    async def search_read(**kwargs):
+        await release.wait()
+        return [{"id": 1}]
+
+    adapter = MagicMock()
+    adapter.search_read = AsyncMock(side_effect=search_read)
+    service.adapters["odoo"] = adapter
+
+    leader = asyncio.create_task(service.read_records(1, "odoo", "res.partner"))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(service.read_records(1, "odoo", "res.partner"))
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == [{"id": 1}]
+    assert leader.cancelled()
+    adapter.search_read.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_metadata_in_process_cache(monkeypatch):
+    """Test metadata is served in-process until it expires"""
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock(return_value=True)
+    service = SystemService(cache, MagicMock())
+    adapter = MagicMock()
+    adapter.get_metadata = AsyncMock(return_value={"name": {"type": "char"}})
+    service.adapters["odoo"] = adapter
+
+    assert await service.get_metadata("odoo", "res.partner") == {"name": {"type": "char"}}
+    assert await service.get_metadata("odoo", "res.partner") == {"name": {"type": "char"}}
+    adapter.get_metadata.assert_awaited_once()
+    cache.get.assert_awaited_once()
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 301)
+    await service.get_metadata("odoo", "res.partner")
+    assert adapter.get_metadata.await_count == 2
+
+
+def test_metadata_cache_is_bounded(monkeypatch):
+    """Test the in-process metadata cache evicts its oldest entry when full"""
+    monkeypatch.setattr("app.services.system_service.METADATA_L1_MAX_SIZE", 2)
+    service = SystemService(MagicMock(), MagicMock())
+
+    for model in ("a", "b", "c"):
+        service._remember_metadata(f"metadata:odoo:{model}", {})
+
+    assert list(service._metadata_l1) == ["metadata:odoo:b", "metadata:odoo:c"]
+
+
+@pytest.mark.asyncio
+async def test_connect_system_normalizes_system_type(monkeypatch):
+    """Test the system type is lower-cased once and stored on the adapter"""
+    adapter = MagicMock()
+    adapter.connect = AsyncMock()
+    monkeypatch.setattr(SystemService, "_ADAPTERS", {"odoo": MagicMock(return_value=adapter)})
+    service = SystemService(MagicMock(), MagicMock())
+
+    await service.connect_system("odoo-prod", " Odoo", {"url": "x", "system_type": "ODOO"})
+
+    assert adapter.system_type == "odoo"
+    with pytest.raises(ValueError):
+        await service.connect_system("odoo-prod", "", {})
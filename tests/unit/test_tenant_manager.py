@@ -0,0 +1,185 @@
+"""
+Tenant connection pool tests
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import tenant_manager
+from app.services.tenant_manager import ConnectionStats, OdooConnectionPool, TenantConfig
+
+
+@pytest.mark.asyncio
+async def test_get_connection_reuses_client():
+    """Test concurrent first calls create a single client that is then reused"""
+    pool = OdooConnectionPool()
+    await pool.add_tenant(TenantConfig(tenant_id="t1", odoo_url="https://odoo.example.com", database="db"))
+
+    clients = await asyncio.gather(*(pool.get_connection("t1") for _ in range(5)))
+
+    assert len({id(client) for client in clients}) == 1
+    assert await pool.get_connection("t1") is clients[0]
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_get_connection_inactive_tenant():
+    """Test inactive tenants are rejected even with an open connection"""
+    pool = OdooConnectionPool()
+    config = TenantConfig(tenant_id="t1", odoo_url="https://odoo.example.com", database="db")
+    await pool.add_tenant(config)
+    await pool.get_connection("t1")
+
+    config.active = False
+    with pytest.raises(ValueError):
+        await pool.get_connection("t1")
+    with pytest.raises(ValueError):
+        await pool.get_connection("unknown")
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_execute_request_updates_stats():
+    """Test request statistics are recorded for successes and failures"""
+    pool = OdooConnectionPool()
+    await pool.add_tenant(TenantConfig(tenant_id="t1", odoo_url="https://odoo.example.com", database="db"))
+
+    def handler(request):
+        return httpx.Response(200 if request.url.path == "/ok" else 500, json={"result": True})
+
+    pool.connections["t1"] = httpx.AsyncClient(
+        base_url="https://odoo.example.com", transport=httpx.MockTransport(handler)
+    )
+
+    assert await pool.execute_request("t1", "POST", "/ok") == {"result": True}
+    with pytest.raises(httpx.HTTPStatusError):
+        await pool.execute_request("t1", "POST", "/fail")
+
+    stats = await pool.get_stats("t1")
+    assert (stats.total_requests, stats.successful_requests, stats.failed_requests) == (2, 1, 1)
+    assert stats.active_connections == 0
+    assert stats.last_request_at is not None
+    assert stats.avg_response_time >= 0
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_execute_request_avg_response_time(monkeypatch):
+    """Test the mean covers successful requests only and is exact"""
+    pool = OdooConnectionPool()
+    await pool.add_tenant(TenantConfig(tenant_id="t1", odoo_url="https://odoo.example.com", database="db"))
+
+    def handler(request):
+        return httpx.Response(200 if request.url.path == "/ok" else 500, json={"result": True})
+
+    pool.connections["t1"] = httpx.AsyncClient(
+        base_url="https://odoo.example.com", transport=httpx.MockTransport(handler)
+    )
+    # Start/end readings: 9_999us ok, failed (start only), 10_000us ok, 10_002us ok
+    clock = iter([0, 9_999_000, 20_000_000, 30_000_000, 40_000_000, 50_000_000, 60_002_000])
+    monkeypatch.setattr(tenant_manager.time, "perf_counter_ns", lambda: next(clock))
+
+    await pool.execute_request("t1", "POST", "/ok")
+    with pytest.raises(httpx.HTTPStatusError):
+        await pool.execute_request("t1", "POST", "/fail")
+    await pool.execute_request("t1", "POST", "/ok")
+    await pool.execute_request("t1", "POST", "/ok")
+
+    stats = await pool.get_stats("t1")
+    assert stats.total_duration_us == 30_001
+    assert stats.avg_response_time_us == 10_000
+    assert stats.avg_response_time == pytest.approx(0.010000333, abs=1e-9)
+    assert ConnectionStats().avg_response_time == 0.0
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_execute_request_unknown_tenant():
+    """Test unknown tenants are rejected instead of recording throwaway stats"""
+    pool = OdooConnectionPool()
+
+    with pytest.raises(ValueError):
+        await pool.execute_request("unknown", "POST", "/ok")
+    assert await pool.get_stats("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_execute_request_concurrent_stats():
+    """Test concurrent requests count once each and release their connections"""
+    pool = OdooConnectionPool()
+    await pool.add_tenant(TenantConfig(tenant_id="t1", odoo_url="https://odoo.example.com", database="db"))
+
+    async def handler(request):
+        await asyncio.sleep(0)
+        return httpx.Response(200 if request.url.path == "/ok" else 500, json={"result": True})
+
+    pool.connections["t1"] = httpx.AsyncClient(
+        base_url="https://odoo.example.com", transport=httpx.MockTransport(handler)
+    )
+
+    results = await asyncio.gather(
+        *(pool.execute_request("t1", "POST", "/ok" if i % 2 else "/fail") for i in range(10)),
+        return_exceptions=True
+    )
+
+    stats = await pool.get_stats("t1")
+    assert sum(isinstance(result, httpx.HTTPStatusError) for result in results) == 5
+    assert (stats.total_requests, stats.successful_requests, stats.failed_requests) == (10, 5, 5)
+    assert stats.active_connections == 0
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_execute_request_json_payload():
+    """Test JSON payloads are sent as an encoded body with a JSON content type"""
+    pool = OdooConnectionPool()
+    await pool.add_tenant(TenantConfig(tenant_id="t1", odoo_url="https://odoo.example.com", database="db"))
+    seen = {}
+
+    def handler(request):
+        seen["content_type"] = request.headers["content-type"]
+        seen["token"] = request.headers["x-token"]
+        seen["body"] = request.content
+        return httpx.Response(200, content=b'{"result": [1, 2]}')
+
+    pool.connections["t1"] = httpx.AsyncClient(
+        base_url="https://odoo.example.com", transport=httpx.MockTransport(handler)
+    )
+
+    result = await pool.execute_request(
+        "t1", "POST", "/jsonrpc", json={"params": {"ids": [1, 2]}}, headers={"X-Token": "t"}
+    )
+
+    assert result == {"result": [1, 2]}
+    assert seen == {
+        "content_type": "application/json",
+        "token": "t",
+        "body": b'{"params":{"ids":[1,2]}}',
+    }
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_get_connection_client_options(monkeypatch):
+    """Test clients keep every connection alive and only use HTTP/2 on request"""
+    created = []
+
+    class RecordingClient(httpx.AsyncClient):
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+            super().__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncClient", RecordingClient)
+    pool = OdooConnectionPool()
+    await pool.add_tenant(TenantConfig(tenant_id="t1", odoo_url="https://odoo.example.com", database="db"))
+    await pool.add_tenant(TenantConfig(
+        tenant_id="t2", odoo_url="https://odoo.example.com", database="db", http2=True, trust_env=False
+    ))
+
+    await pool.get_connection("t1")
+    await pool.get_connection("t2")
+
+    assert [(kwargs["http2"], kwargs["trust_env"]) for kwargs in created] == [(False, True), (True, False)]
+    assert created[0]["limits"].max_keepalive_connections == 10
+    await pool.close_all()
@@ -0,0 +1,286 @@
+"""
+Tenant service tests
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.core.encryption import encryption_service
+from app.models.tenant import Tenant, TenantStatus
+from app.services import tenant_service as tenant_service_module
+from app.services.tenant_service import TENANT_LIST_MAX_LIMIT, TenantService, decrypt_odoo_password
+
+
+@pytest.fixture(autouse=True)
+def clear_module_caches():
+    tenant_service_module._password_cache.clear()
+    tenant_service_module._auth_cache.clear()
+    yield
+    tenant_service_module._password_cache.clear()
+    tenant_service_module._auth_cache.clear()
+
+
+def test_decrypt_odoo_password_is_cached(monkeypatch):
+    """Test each ciphertext is decrypted once"""
+    ciphertext = encryption_service.encrypt_value("secret")
+    decrypt = MagicMock(wraps=encryption_service.decrypt_value)
+    monkeypatch.setattr(encryption_service, "decrypt_value", decrypt)
+
+    assert decrypt_odoo_password(ciphertext) == "secret"
+    assert decrypt_odoo_password(ciphertext) == "secret"
+    decrypt.assert_called_once_with(ciphertext)
+
+
+@pytest.mark.asyncio
+async def test_update_tenant_invalidates_cached_password():
+    """Test changing the Odoo password drops the old decrypted value"""
+    old_ciphertext = encryption_service.encrypt_value("old")
+    decrypt_odoo_password(old_ciphertext)
+    service = TenantService(MagicMock())
+    service.tenant_repo = MagicMock(update=AsyncMock(side_effect=lambda tenant_id, data: MagicMock(**data)))
+
+    tenant = await service.update_tenant(uuid4(), {"odoo_password": "new"})
+
+    assert old_ciphertext not in tenant_service_module._password_cache
+    assert decrypt_odoo_password(tenant.odoo_password) == "new"
+
+
+@pytest.mark.asyncio
+async def test_update_tenant_only_whitelisted_fields():
+    """Test update_tenant issues one update restricted to editable columns"""
+    service = TenantService(MagicMock())
+    service.tenant_repo = MagicMock(update=AsyncMock(return_value=MagicMock()))
+    tenant_id = uuid4()
+
+    await service.update_tenant(tenant_id, {
+        "id": uuid4(), "created_by": uuid4(), "name": "Acme", "slug": "Acme", "max_users": 10
+    })
+
+    service.tenant_repo.update.assert_awaited_once_with(
+        tenant_id, {"name": "Acme", "slug": "acme", "max_users": 10}
+    )
+
+
+@pytest.mark.asyncio
+async def test_test_odoo_connection_runs_probes_concurrently(monkeypatch):
+    """Test the reachability probe runs alongside authentication"""
+    auth_started = asyncio.Event()
+    adapter = MagicMock()
+    adapter.disconnect = AsyncMock()
+
+    async def authenticate(username, password):
+        auth_started.set()
+        return {"success": True, "uid": 2}
+
+    adapter.authenticate = authenticate
+    monkeypatch.setattr(tenant_service_module, "OdooAdapter", MagicMock(return_value=adapter))
+
+    async def handler(request):
+        if request.url.path == "/web":
+            assert request.method == "HEAD"
+            # Only completes if authentication was started concurrently
+            await asyncio.wait_for(auth_started.wait(), 1)
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"result": {"server_version": "17.0"}})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(tenant_service_module, "get_shared_client", lambda: client)
+    tenant = MagicMock(
+        odoo_url="https://odoo.example.com/", odoo_database="db",
+        odoo_username="admin", odoo_password=encryption_service.encrypt_value("secret")
+    )
+    service = TenantService(MagicMock())
+    service.tenant_repo = MagicMock(get_odoo_credentials=AsyncMock(return_value=tenant))
+
+    result = await service.test_odoo_connection(uuid4())
+
+    assert result["success"] is False
+    assert result["details"]["connection_reachable"] is False
+    assert "refused" in result["details"]["connection_error"]
+    adapter.disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_tenant_statistics_single_query():
+    """Test statistics are derived from one grouped count"""
+    service = TenantService(MagicMock())
+    service.tenant_repo = MagicMock(count_grouped_by_status=AsyncMock(return_value={
+        TenantStatus.ACTIVE: 3,
+        TenantStatus.TRIAL: 2,
+    }))
+
+    stats = await service.get_tenant_statistics()
+
+    assert stats == {"total": 5, "active": 3, "suspended": 0, "trial": 2, "deleted": 0}
+    service.tenant_repo.count_grouped_by_status.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_tenant_statistics_cached_until_status_change():
+    """Test statistics are cached and dropped when a tenant changes status"""
+    cache = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.set = AsyncMock(return_value=True)
+    cache.delete = AsyncMock(return_value=True)
+    service = TenantService(MagicMock(commit=AsyncMock()), cache)
+    service.tenant_repo = MagicMock(
+        count_grouped_by_status=AsyncMock(return_value={TenantStatus.ACTIVE: 1}),
+        set_status=AsyncMock(return_value=True)
+    )
+
+    stats = await service.get_tenant_statistics()
+    cache.set.assert_awaited_once_with("tenant:stats", stats, ttl=30)
+
+    cache.get = AsyncMock(return_value={"total": 7})
+    assert await service.get_tenant_statistics() == {"total": 7}
+    service.tenant_repo.count_grouped_by_status.assert_awaited_once()
+
+    await service.suspend_tenant(uuid4())
+    cache.delete.assert_awaited_once_with("tenant:stats")
+
+
+@pytest.mark.asyncio
+async def test_create_tenant_duplicate_slug_from_constraint():
+    """Test the slug is only looked up after the unique constraint rejects it"""
+    session = MagicMock(rollback=AsyncMock())
+    service = TenantService(session)
+    service.plan_repo = MagicMock(get_by_id_uuid=AsyncMock(return_value=MagicMock()))
+    service.tenant_repo = MagicMock(
+        create=AsyncMock(side_effect=IntegrityError("INSERT", {}, Exception("tenants_slug_key"))),
+        is_slug_taken=AsyncMock(return_value=True)
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_tenant(
+            "Acme", "acme", "ops@acme.test", "https://odoo.acme.test", "acme", "admin", "secret", uuid4()
+        )
+
+    assert exc_info.value.status_code == 400
+    session.rollback.assert_awaited_once()
+    service.tenant_repo.is_slug_taken.assert_awaited_once_with("acme", exclude_id=None)
+
+
+def test_tenant_slug_stored_lower_case():
+    """Test slugs are normalized on assignment so lookups use plain equality"""
+    tenant = Tenant(slug=" Acme-Co ")
+    assert tenant.slug == "acme-co"
+
+    tenant.slug = "ACME"
+    assert tenant.slug == "acme"
+
+
+@pytest.mark.asyncio
+async def test_list_tenants_keyset_page():
+    """Test pages continue after the cursor tenant and the limit is capped"""
+    statements = []
+
+    async def execute(query):
+        statements.append(query)
+        return MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[]))))
+
+    service = TenantService(MagicMock(execute=execute))
+
+    await service.list_tenants(limit=10_000, status=TenantStatus.ACTIVE, after=uuid4())
+
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert "ORDER BY tenants.created_at DESC, tenants.id DESC" in sql
+    assert "tenants.created_at < (SELECT tenants.created_at" in sql
+    assert statements[0]._limit == TENANT_LIST_MAX_LIMIT
+
+
+@pytest.mark.asyncio
+async def test_delete_tenant_single_update_returning():
+    """Test a status change is one UPDATE ... RETURNING without loading the tenant"""
+    statements = []
+
+    async def execute(query):
+        statements.append(query)
+        return MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+
+    service = TenantService(MagicMock(execute=execute, commit=AsyncMock()))
+
+    assert await service.delete_tenant(uuid4()) is False
+
+    assert len(statements) == 1
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE tenants SET status=")
+    assert "deleted_at=" in sql
+    assert sql.endswith("RETURNING tenants.id")
+
+
+@pytest.mark.asyncio
+async def test_authenticate_odoo_resumes_cached_session():
+    """Test a cached Odoo session is reused and a stale one triggers a new login"""
+    tenant = MagicMock(id=uuid4(), odoo_username="admin")
+    adapter = MagicMock()
+    adapter.authenticate = AsyncMock(return_value={
+        "success": True, "uid": 2, "session_id": "abc", "user_context": {"lang": "en_US"}
+    })
+    adapter.resume_session = AsyncMock(return_value=True)
+    service = TenantService(MagicMock())
+
+    await service._authenticate_odoo(adapter, tenant, "secret")
+    result = await service._authenticate_odoo(adapter, tenant, "secret")
+
+    assert result == {"success": True, "uid": 2, "session_id": "abc", "user_context": {"lang": "en_US"}}
+    adapter.authenticate.assert_awaited_once_with("admin", "secret")
+    adapter.resume_session.assert_awaited_once_with("abc", 2)
+
+    adapter.resume_session = AsyncMock(return_value=False)
+    await service._authenticate_odoo(adapter, tenant, "secret")
+    assert adapter.authenticate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_tenant_credentials_drop_cached_session():
+    """Test changing Odoo credentials forgets the tenant's cached session"""
+    tenant_id = uuid4()
+    tenant_service_module._auth_cache.set(tenant_id, {"uid": 2, "session_id": "abc", "user_context": {}})
+    service = TenantService(MagicMock())
+    service.tenant_repo = MagicMock(update=AsyncMock(return_value=MagicMock()))
+
+    await service.update_tenant(tenant_id, {"name": "Acme"})
+    assert tenant_id in tenant_service_module._auth_cache
+
+    await service.update_tenant(tenant_id, {"odoo_database": "acme2"})
+    assert tenant_id not in tenant_service_module._auth_cache
+
+
+@pytest.mark.asyncio
+async def test_get_tenant_uses_identity_map():
+    """Test tenants are looked up with session.get, which skips SQL for loaded rows"""
+    tenant = Tenant(slug="acme")
+    session = MagicMock(get=AsyncMock(return_value=tenant), execute=AsyncMock())
+    service = TenantService(session)
+    tenant_id = uuid4()
+
+    assert await service.get_tenant(tenant_id) is tenant
+    session.get.assert_awaited_once_with(Tenant, tenant_id)
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_odoo_credentials_selects_connection_columns():
+    """Test the connection test loads only the columns it uses"""
+    statements = []
+
+    async def execute(query):
+        statements.append(query)
+        return MagicMock(one_or_none=MagicMock(return_value=None))
+
+    service = TenantService(MagicMock(execute=execute))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.test_odoo_connection(uuid4())
+
+    assert exc_info.value.status_code == 404
+    assert list(statements[0].selected_columns.keys()) == [
+        "id", "name", "slug", "odoo_url", "odoo_database",
+        "odoo_username", "odoo_password", "odoo_version"
+    ]